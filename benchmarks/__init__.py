@@ -0,0 +1 @@
+"""Benchmarks for the FotMob Fixtures integration."""
@@ -0,0 +1,50 @@
+"""Memory held per coordinator and per team as the number of teams grows."""
+import pytest
+
+from custom_components.fotmob_fixtures.coordinator import (
+    FotMobDataUpdateCoordinator,
+    FotMobTeamGroupCoordinator,
+)
+
+from . import payloads
+from .conftest import reset_shared_caches
+
+TEAM_COUNTS = [1, 10, 100]
+
+
+async def _warm_server(hass, team_ids):
+    """Serialize every response once so server bodies are not counted."""
+    await FotMobTeamGroupCoordinator(hass, "warm-up", team_ids)._async_update_data()
+    reset_shared_caches(hass)
+
+
+@pytest.mark.parametrize("count", TEAM_COUNTS)
+async def test_memory_single_coordinators(hass, fotmob_server, memory_benchmark, count):
+    """One single-team coordinator per team, as with one entry per team."""
+    team_ids = payloads.team_ids(count)
+    await _warm_server(hass, team_ids)
+
+    async def build():
+        coordinators = [FotMobDataUpdateCoordinator(hass, team_id) for team_id in team_ids]
+        for coordinator in coordinators:
+            await coordinator._async_update_data()
+            coordinator.team_snapshot(coordinator.team_id)
+        return coordinators
+
+    await memory_benchmark(build, per=count)
+
+
+@pytest.mark.parametrize("count", TEAM_COUNTS)
+async def test_memory_group_coordinator(hass, fotmob_server, memory_benchmark, count):
+    """One team group coordinator serving every team."""
+    team_ids = payloads.team_ids(count)
+    await _warm_server(hass, team_ids)
+
+    async def build():
+        coordinator = FotMobTeamGroupCoordinator(hass, "bench", team_ids)
+        await coordinator._async_update_data()
+        for team_id in coordinator.team_ids:
+            coordinator.team_snapshot(team_id)
+        return coordinator
+
+    await memory_benchmark(build, per=count)
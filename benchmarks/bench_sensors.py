@@ -0,0 +1,61 @@
+"""Cost of sensor state reads and of the per-refresh lookup structures."""
+import pytest
+
+from custom_components.fotmob_fixtures import sensor
+from custom_components.fotmob_fixtures.coordinator import FotMobDataUpdateCoordinator
+from custom_components.fotmob_fixtures.projection import project_league_payload
+from custom_components.fotmob_fixtures.snapshot import TableIndex, TeamSnapshot
+
+from . import payloads
+
+SENSOR_CLASSES = sorted(
+    (
+        cls for cls in vars(sensor).values()
+        # Intermediate base classes define no entity_description_key
+        if isinstance(cls, type) and issubclass(cls, sensor.FotMobBaseSensor) and hasattr(cls, "entity_description_key")
+    ),
+    key=lambda cls: cls.entity_description_key,
+)
+# A team of a plain league and one of a league split in sub-tables
+LEAGUE_TEAMS = {
+    "plain": payloads.league_team_ids(0)[3],
+    "composite": payloads.league_team_ids(payloads.COMPOSITE_EVERY - 1)[13],
+}
+
+
+async def _refreshed(hass, league):
+    """Return a coordinator holding one refresh of a team."""
+    coordinator = FotMobDataUpdateCoordinator(hass, LEAGUE_TEAMS[league])
+    await coordinator._async_update_data()
+    return coordinator
+
+
+@pytest.mark.parametrize("league", list(LEAGUE_TEAMS))
+@pytest.mark.parametrize("sensor_class", SENSOR_CLASSES, ids=lambda cls: cls.entity_description_key)
+async def test_sensor_render(hass, fotmob_server, benchmark, league, sensor_class):
+    """State and attributes of one sensor, as written on every change."""
+    coordinator = await _refreshed(hass, league)
+    entity = sensor_class(coordinator, coordinator.team_id)
+    # Shared renders (league tables) are kept in hass.data
+    entity.hass = hass
+
+    benchmark(lambda: (entity.state, entity.extra_state_attributes))
+
+
+@pytest.mark.parametrize("league", list(LEAGUE_TEAMS))
+async def test_snapshot_build(hass, fotmob_server, benchmark, league):
+    """Per-refresh snapshot: table indexes and the fixture timeline."""
+    coordinator = await _refreshed(hass, league)
+    data = coordinator._team.data
+
+    benchmark(TeamSnapshot, coordinator.team_id, data)
+
+
+@pytest.mark.parametrize("league", list(LEAGUE_TEAMS))
+def test_league_table_index(benchmark, league):
+    """Team lookups over a league payload, composite sub-tables included."""
+    index = payloads.league_index(LEAGUE_TEAMS[league])
+    tables = project_league_payload(payloads.league(payloads.league_id(index)))["table"]
+
+    index = benchmark(TableIndex, tables)
+    assert index.lookup(LEAGUE_TEAMS[league]) is not None
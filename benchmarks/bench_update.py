@@ -0,0 +1,58 @@
+"""End-to-end latency of coordinator updates against the stand-in server."""
+import pytest
+
+from custom_components.fotmob_fixtures.coordinator import (
+    FotMobDataUpdateCoordinator,
+    FotMobTeamGroupCoordinator,
+)
+
+from . import payloads
+from .conftest import reset_shared_caches
+
+GROUP_SIZES = [1, 10, 100]
+
+
+async def test_update_cold(hass, fotmob_server, async_benchmark):
+    """First refresh of a team: overview, tabs and league table downloaded."""
+    team_id = payloads.team_ids(1)[0]
+    coordinator = None
+
+    async def setup():
+        nonlocal coordinator
+        reset_shared_caches(hass)
+        coordinator = FotMobDataUpdateCoordinator(hass, team_id)
+
+    await async_benchmark(lambda: coordinator._async_update_data(), setup=setup)
+
+
+@pytest.mark.parametrize("etags", [False, True], ids=["full", "not_modified"])
+async def test_update_warm(hass, fotmob_server, async_benchmark, etags):
+    """Regular refresh: only the overview is due, fully sent or a 304."""
+    fotmob_server.etags = etags
+    coordinator = FotMobDataUpdateCoordinator(hass, payloads.team_ids(1)[0])
+    await coordinator._async_update_data()
+
+    await async_benchmark(coordinator._async_update_data)
+
+
+@pytest.mark.parametrize("count", GROUP_SIZES)
+async def test_group_update_cold(hass, fotmob_server, async_benchmark, count):
+    """First refresh of a team group, league tables shared per league."""
+    coordinator = None
+
+    async def setup():
+        nonlocal coordinator
+        reset_shared_caches(hass)
+        coordinator = FotMobTeamGroupCoordinator(hass, "bench", payloads.team_ids(count))
+
+    await async_benchmark(lambda: coordinator._async_update_data(), rounds=3 if count > 10 else 10, setup=setup)
+
+
+@pytest.mark.parametrize("count", GROUP_SIZES)
+async def test_group_update_warm(hass, fotmob_server, async_benchmark, count):
+    """Regular refresh of a team group answered with 304s."""
+    fotmob_server.etags = True
+    coordinator = FotMobTeamGroupCoordinator(hass, "bench", payloads.team_ids(count))
+    await coordinator._async_update_data()
+
+    await async_benchmark(coordinator._async_update_data, rounds=3 if count > 10 else 10)
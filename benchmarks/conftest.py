@@ -0,0 +1,138 @@
+"""Fixtures for the FotMob Fixtures benchmarks."""
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from aiohttp.test_utils import TestServer
+
+from custom_components.fotmob_fixtures import coordinator as coordinator_module
+from custom_components.fotmob_fixtures import live as live_module
+from custom_components.fotmob_fixtures.api import get_api_client
+from custom_components.fotmob_fixtures.const import DOMAIN
+
+from .server import FotMobStandIn
+
+ASYNC_ROUNDS = 10
+# Effectively unthrottled, so the integration is measured and not the
+# request budget
+BENCH_REQUESTS_PER_SECOND = 10000
+BENCH_MAX_CONCURRENCY = 16
+
+
+def pytest_addoption(parser):
+    """Add options to save and compare the async and memory results."""
+    group = parser.getgroup("fotmob benchmarks")
+    group.addoption("--fotmob-save", metavar="PATH", help="Save async and memory results as JSON")
+    group.addoption("--fotmob-compare", metavar="PATH", help="Fail on regressions against saved results")
+    group.addoption(
+        "--fotmob-tolerance", type=float, default=0.25,
+        help="Allowed regression against --fotmob-compare results (fraction, default 0.25)",
+    )
+
+
+class Results:
+    """Async timings and memory figures, which pytest-benchmark cannot measure."""
+
+    def __init__(self, config):
+        """Load the baseline to compare with, if any."""
+        self.config = config
+        self.values = {}
+        compare = config.getoption("--fotmob-compare")
+        self.baseline = json.loads(Path(compare).read_text()) if compare else {}
+
+    def record(self, name, value, unit):
+        """Record a result, failing when it regressed past the tolerance."""
+        self.values[name] = {"value": value, "unit": unit}
+        previous = self.baseline.get(name)
+        tolerance = self.config.getoption("--fotmob-tolerance")
+        if previous and value > previous["value"] * (1 + tolerance):
+            pytest.fail(f"{name}: {value:.6g} {unit} regressed from {previous['value']:.6g} {unit}")
+
+
+def pytest_configure(config):
+    """Create the results store."""
+    config.fotmob_results = Results(config)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print and optionally save the async and memory results."""
+    values = config.fotmob_results.values
+    if not values:
+        return
+    terminalreporter.section("fotmob async and memory results")
+    for name, result in sorted(values.items()):
+        terminalreporter.write_line(f"{name:<60} {result['value']:>14.6g} {result['unit']}")
+    if path := config.getoption("--fotmob-save"):
+        Path(path).write_text(json.dumps(values, indent=2, sort_keys=True))
+
+
+@pytest.fixture
+def fotmob_results(request):
+    """Return the results store."""
+    return request.config.fotmob_results
+
+
+@pytest.fixture
+def async_benchmark(request, fotmob_results):
+    """Time an async callable over a number of rounds and record the median."""
+
+    async def run(func, rounds=ASYNC_ROUNDS, setup=None):
+        timings = []
+        for _ in range(rounds):
+            if setup is not None:
+                await setup()
+            start = time.perf_counter()
+            await func()
+            timings.append(time.perf_counter() - start)
+        fotmob_results.record(request.node.name, statistics.median(timings), "s")
+        return timings
+
+    return run
+
+
+@pytest.fixture
+def memory_benchmark(request, fotmob_results):
+    """Measure the memory still allocated after an async callable ran."""
+
+    async def run(func, per=1):
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            kept = await func()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        fotmob_results.record(request.node.name, size / per, "bytes")
+        return kept, size
+
+    return run
+
+
+def reset_shared_caches(hass):
+    """Drop the HTTP client and league cache shared by every entry."""
+    hass.data.pop(DOMAIN, None)
+    get_api_client(hass).scheduler.configure(BENCH_REQUESTS_PER_SECOND, BENCH_MAX_CONCURRENCY)
+
+
+@pytest.fixture
+async def fotmob_server(hass, monkeypatch, socket_enabled):
+    """Serve the benchmark payloads locally and point the integration at them.
+
+    The Home Assistant test plugin blocks sockets; the stand-in server
+    needs them on 127.0.0.1.
+    """
+    reset_shared_caches(hass)
+    server = FotMobStandIn()
+    test_server = TestServer(server.app)
+    await test_server.start_server()
+    base = str(test_server.make_url("/api"))
+    # The URL templates are read where requests are built
+    monkeypatch.setattr(coordinator_module, "TEAM_URL", base + "/data/teams?id={}")
+    monkeypatch.setattr(coordinator_module, "LEAGUE_URL", base + "/leagues?id={}")
+    monkeypatch.setattr(live_module, "MATCH_URL", base + "/matchDetails?matchId={}")
+    yield server
+    await test_server.close()
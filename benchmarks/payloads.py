@@ -0,0 +1,285 @@
+"""FotMob-shaped payloads served by the stand-in server.
+
+The builders mirror the layout (and roughly the size) of real responses,
+including the sections the integration projects away. Recorded responses
+saved in ``fixtures/`` take precedence, see ``recorded``.
+"""
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+BASE_TEAM_ID = 9000
+BASE_LEAGUE_ID = 40
+TEAMS_PER_LEAGUE = 20
+# Every fifth league is split in two groups, like a composite league
+COMPOSITE_EVERY = 5
+FIXTURES_PER_TEAM = 46
+SQUAD_SIZE = 28
+# Fixtures are laid out around the current time, so the adaptive schedule
+# sees a regular matchweek; no kickoff falls inside the live window
+NOW = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def recorded(kind, item_id):
+    """Return a recorded response ``fixtures/<kind>_<id>.json``, or None."""
+    path = FIXTURES_DIR / f"{kind}_{item_id}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def team_ids(count):
+    """Return count team ids, filling one league after the other."""
+    return [BASE_TEAM_ID + i for i in range(count)]
+
+
+def league_index(team_id):
+    """Return the index of the league a team plays in."""
+    return (int(team_id) - BASE_TEAM_ID) // TEAMS_PER_LEAGUE
+
+
+def league_id(index):
+    """Return the league id of a league index."""
+    return BASE_LEAGUE_ID + index
+
+
+def is_composite(index):
+    """Return True for leagues split in sub-tables."""
+    return index % COMPOSITE_EVERY == COMPOSITE_EVERY - 1
+
+
+def league_team_ids(index):
+    """Return the team ids of a league."""
+    first = BASE_TEAM_ID + index * TEAMS_PER_LEAGUE
+    return list(range(first, first + TEAMS_PER_LEAGUE))
+
+
+def _utc(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _team_ref(team_id):
+    return {"id": team_id, "name": f"Team {team_id}", "shortName": f"T{team_id % 1000}"}
+
+
+def _table_rows(ids, rng):
+    rows = []
+    for rank, t_id in enumerate(ids, start=1):
+        wins, draws = rng.randint(3, 18), rng.randint(2, 8)
+        losses = 26 - wins - draws
+        scored, conceded = rng.randint(20, 70), rng.randint(15, 60)
+        rows.append({
+            **_team_ref(t_id),
+            "idx": rank,
+            "pageUrl": f"/teams/{t_id}/overview/team-{t_id}",
+            "played": 26,
+            "wins": wins,
+            "draws": draws,
+            "losses": losses,
+            "scoresStr": f"{scored}-{conceded}",
+            "goalConDiff": scored - conceded,
+            "pts": wins * 3 + draws,
+            "qualColor": "#2AD572" if rank <= 4 else None,
+            "featuredInDivider": False,
+        })
+    return rows
+
+
+def _table(ids, rng):
+    rows = _table_rows(ids, rng)
+    # The extra views are dropped by the projection but weigh on decoding
+    return {
+        "all": rows,
+        "home": [dict(row) for row in rows],
+        "away": [dict(row) for row in rows],
+        "form": [dict(row, form=[]) for row in rows],
+        "xg": [dict(row, xg=round(rng.uniform(10, 50), 2), xgConceded=round(rng.uniform(10, 50), 2)) for row in rows],
+    }
+
+
+def _team_form(ids, rng):
+    return {
+        str(t_id): [
+            {
+                "result": result,
+                "resultString": "WDL"[result],
+                "imageUrl": f"https://images.fotmob.com/image_resources/logo/teamlogo/{t_id}.png",
+                "linkToMatch": f"/matches/{t_id}-{n}",
+                "date": {"utcTime": _utc(NOW - timedelta(days=7 * n))},
+                "teamPageUrl": f"/teams/{t_id}",
+                "tooltipText": {"homeTeam": f"Team {t_id}", "awayTeam": "Other", "homeScore": 1, "awayScore": 0},
+                "score": "1-0",
+            }
+            for n, result in enumerate(rng.choices(range(3), k=5), start=1)
+        ]
+        for t_id in ids
+    }
+
+
+def table_container(index):
+    """Return a table container of a league, as embedded in team overviews."""
+    rng = random.Random(index)
+    ids = league_team_ids(index)
+    data = {"leagueName": f"League {index}", "leagueId": league_id(index), "pageUrl": f"/leagues/{league_id(index)}"}
+    if is_composite(index):
+        half = len(ids) // 2
+        data["composite"] = True
+        data["tables"] = [
+            {"leagueName": f"League {index} Group {name}", "table": _table(group, rng)}
+            for name, group in (("A", ids[:half]), ("B", ids[half:]))
+        ]
+    else:
+        data["composite"] = False
+        data["table"] = _table(ids, rng)
+    return {
+        "data": data,
+        "teamForm": _team_form(ids, rng),
+        "nextOpponent": {str(t_id): [ids[-1 - i], f"Team {ids[-1 - i]}", _utc(NOW + timedelta(days=3))]
+                         for i, t_id in enumerate(ids)},
+    }
+
+
+def _fixtures(team_id, rng):
+    rivals = [t_id for t_id in league_team_ids(league_index(team_id)) if t_id != team_id]
+    fixtures = []
+    for n in range(FIXTURES_PER_TEAM):
+        kickoff = NOW + timedelta(days=7 * (n - FIXTURES_PER_TEAM // 2), hours=12)
+        opponent = rivals[n % len(rivals)]
+        home, away = (team_id, opponent) if n % 2 else (opponent, team_id)
+        finished = kickoff < NOW
+        fixtures.append({
+            "id": team_id * 1000 + n,
+            "pageUrl": f"/matches/{team_id}-{n}",
+            "opponent": _team_ref(opponent),
+            "home": dict(_team_ref(home), score=rng.randint(0, 4) if finished else None),
+            "away": dict(_team_ref(away), score=rng.randint(0, 4) if finished else None),
+            "displayTournament": True,
+            "notStarted": not finished,
+            "tournament": {"name": f"League {league_index(team_id)}", "leagueId": league_id(league_index(team_id))},
+            "status": {
+                "utcTime": _utc(kickoff),
+                "started": finished,
+                "finished": finished,
+                "cancelled": False,
+                "scoreStr": "1 - 1" if finished else None,
+                "reason": {"short": "FT", "long": "Full-Time"} if finished else None,
+            },
+        })
+    return fixtures
+
+
+def _players(team_id, rng, count):
+    return [
+        {
+            "id": team_id * 100 + n,
+            "name": f"Player {team_id}-{n}",
+            "teamId": team_id,
+            "value": rng.randint(0, 20),
+            "rank": n + 1,
+            "role": {"key": "attacker_long", "fallback": "Attacker"},
+            "ccode": "ENG",
+            "cname": "England",
+            "rating": round(rng.uniform(6, 8.5), 2),
+            "injured": False,
+            "transferValue": rng.randint(1, 90) * 1_000_000,
+        }
+        for n in range(count)
+    ]
+
+
+def team_overview(team_id):
+    """Return a team overview response (``/api/data/teams``)."""
+    if (payload := recorded("team", team_id)) is not None:
+        return payload
+    team_id = int(team_id)
+    rng = random.Random(team_id)
+    index = league_index(team_id)
+    players = _players(team_id, rng, SQUAD_SIZE)
+    top = {"players": sorted(players, key=lambda p: -p["value"])}
+    return {
+        "details": {
+            **_team_ref(team_id),
+            "country": "ENG",
+            "sportsTeamJSONLD": {
+                "@context": "https://schema.org",
+                "name": f"Team {team_id}",
+                "location": {"name": f"Stadium {team_id}", "address": {"addressLocality": "City"}},
+                "athlete": [{"name": p["name"], "nationality": p["cname"]} for p in players],
+            },
+            "faqJSONLD": {"mainEntity": [
+                {"name": f"What is the capacity of Stadium {team_id}?",
+                 "acceptedAnswer": {"text": f"{rng.randint(10, 80) * 1000}"}},
+                {"name": "Who is the top scorer?", "acceptedAnswer": {"text": players[0]["name"]}},
+            ]},
+        },
+        "fixtures": {"allFixtures": {"fixtures": _fixtures(team_id, rng)}},
+        "table": [table_container(index)],
+        "topPlayers": {"byGoals": top, "byAssists": top, "byRating": top},
+        "overview": {
+            "topPlayers": {"byGoals": top, "byAssists": top, "byRating": top},
+            "lastLineupStats": {
+                "coach": {"id": team_id * 10, "name": f"Coach {team_id}", "age": 50, "countryName": "England"},
+                "starters": players[:11],
+                "subs": players[11:],
+            },
+            "venue": {"widget": {"name": f"Stadium {team_id}"}, "statPairs": [["Capacity", "40000"]]},
+        },
+        "squad": {"squad": [
+            {"title": "coach", "members": [{"id": team_id * 10, "name": f"Coach {team_id}", "age": 50}]},
+            {"title": "keepers", "members": players[:3]},
+            {"title": "defenders", "members": players[3:12]},
+            {"title": "midfielders", "members": players[12:21]},
+            {"title": "attackers", "members": players[21:]},
+        ]},
+        "stats": {"players": [{"header": "Top scorer", "participant": p} for p in players]},
+    }
+
+
+def transfers_tab(team_id):
+    """Return the transfers tab response of a team."""
+    if (payload := recorded("transfers", team_id)) is not None:
+        return payload
+    team_id = int(team_id)
+    players = _players(team_id, random.Random(-team_id), 30)
+    return {"transfers": {"data": {
+        "Players in": [dict(p, transferDate=_utc(NOW), fromClub="Other FC") for p in players[:10]],
+        "Players out": [dict(p, transferDate=_utc(NOW), toClub="Other FC") for p in players[10:20]],
+        "Contract extensions": [dict(p, transferDate=_utc(NOW)) for p in players[20:]],
+        "Loans": [dict(p) for p in players],
+    }}}
+
+
+def history_tab(team_id):
+    """Return the history tab response of a team."""
+    if (payload := recorded("history", team_id)) is not None:
+        return payload
+    team_id = int(team_id)
+    return {"history": {
+        "trophyList": [
+            {"name": [f"Cup {n}"], "tournamentTemplateId": [n], "won": [str(n % 7 + 1)], "runnerup": ["2"],
+             "season_won": [f"{2000 + k}/{2001 + k}" for k in range(n % 7 + 1)]}
+            for n in range(12)
+        ],
+        "historicalTableData": {"ranks": [{"season": f"{2000 + k}", "position": k % 20 + 1} for k in range(25)]},
+    }}
+
+
+def league(league_id_):
+    """Return a league response (``/api/leagues``)."""
+    if (payload := recorded("league", league_id_)) is not None:
+        return payload
+    index = int(league_id_) - BASE_LEAGUE_ID
+    ids = league_team_ids(index)
+    return {
+        "details": {"id": int(league_id_), "name": f"League {index}", "country": "ENG"},
+        "table": [table_container(index)],
+        "matches": {"allMatches": [
+            {"id": index * 10000 + n, "home": _team_ref(ids[n % 20]), "away": _team_ref(ids[(n + 1) % 20]),
+             "status": {"utcTime": _utc(NOW + timedelta(days=n)), "finished": False}}
+            for n in range(380)
+        ]},
+        "stats": {"players": _players(ids[0], random.Random(index), 60)},
+    }
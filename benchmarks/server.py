@@ -0,0 +1,50 @@
+"""Local aiohttp stand-in for the FotMob API."""
+import hashlib
+import json
+
+from aiohttp import web
+
+from . import payloads
+
+
+class FotMobStandIn:
+    """Serve the benchmark payloads on the FotMob API routes.
+
+    Bodies are serialized once per resource. With ``etags`` set, responses
+    carry an ``ETag`` and matching conditional requests get a 304, like
+    FotMob's CDN.
+    """
+
+    def __init__(self):
+        """Initialize the server state."""
+        self.etags = False
+        self.requests = 0
+        self._bodies = {}
+        self.app = web.Application()
+        self.app.router.add_get("/api/data/teams", self._team)
+        self.app.router.add_get("/api/leagues", self._league)
+
+    def _respond(self, request, key, build):
+        """Answer with the cached body of a resource."""
+        self.requests += 1
+        if key not in self._bodies:
+            body = json.dumps(build()).encode()
+            self._bodies[key] = (body, f'"{hashlib.md5(body).hexdigest()}"')
+        body, etag = self._bodies[key]
+        if not self.etags:
+            return web.Response(body=body, content_type="application/json")
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(body=body, content_type="application/json", headers={"ETag": etag})
+
+    async def _team(self, request):
+        team_id = request.query["id"]
+        tab = request.query.get("tab")
+        builders = {None: payloads.team_overview, "transfers": payloads.transfers_tab, "history": payloads.history_tab}
+        if tab not in builders:
+            raise web.HTTPNotFound()
+        return self._respond(request, ("team", team_id, tab), lambda: builders[tab](team_id))
+
+    async def _league(self, request):
+        league_id = request.query["id"]
+        return self._respond(request, ("league", league_id), lambda: payloads.league(league_id))
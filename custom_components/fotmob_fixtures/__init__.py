@@ -5,29 +5,100 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, CONF_TEAM_ID
-from .coordinator import FotMobDataUpdateCoordinator
+from .api import get_api_client
+from .const import (
+    DOMAIN,
+    DATA_METRICS_OWNER,
+    CONF_TEAM_ID,
+    CONF_TEAM_IDS,
+    CONF_REQUESTS_PER_SECOND,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_REQUESTS_PER_SECOND,
+    DEFAULT_MAX_CONCURRENCY,
+)
+from .coordinator import FotMobDataUpdateCoordinator, FotMobTeamGroupCoordinator
+from .logos import async_setup_logos
+from .results import FotMobResultsStore
+from .store import FotMobPayloadStore
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up FotMob Fixtures from a config entry."""
-    team_id = entry.data.get(CONF_TEAM_ID)
+    _async_configure_request_limits(hass)
+    async_setup_logos(hass)
     
-    coordinator = FotMobDataUpdateCoordinator(hass, team_id)
-    await coordinator.async_config_entry_first_refresh()
+    if team_ids := entry.data.get(CONF_TEAM_IDS):
+        coordinator = FotMobTeamGroupCoordinator(
+            hass,
+            entry.title,
+            team_ids,
+            entry.options,
+            {str(t_id): FotMobPayloadStore(hass, f"{entry.entry_id}_{t_id}") for t_id in team_ids},
+            {str(t_id): FotMobResultsStore(hass, f"{entry.entry_id}_{t_id}") for t_id in team_ids},
+        )
+    else:
+        coordinator = FotMobDataUpdateCoordinator(
+            hass,
+            entry.data.get(CONF_TEAM_ID),
+            entry.options,
+            FotMobPayloadStore(hass, entry.entry_id),
+            FotMobResultsStore(hass, entry.entry_id),
+        )
+    # Entities come up immediately from the cached payload when there is one;
+    # otherwise block on the first refresh as before
+    restored = await coordinator.async_restore()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
     
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(coordinator.async_enable_events())
+
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_jittered_refresh(), f"{DOMAIN} refresh {entry.title}"
+        )
     
     return True
 
+def _async_configure_request_limits(hass: HomeAssistant) -> None:
+    """Apply the most conservative request limits set on any entry."""
+    entries = hass.config_entries.async_entries(DOMAIN)
+    rate = min(
+        (e.options.get(CONF_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND) for e in entries),
+        default=DEFAULT_REQUESTS_PER_SECOND,
+    )
+    concurrency = min(
+        (e.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY) for e in entries),
+        default=DEFAULT_MAX_CONCURRENCY,
+    )
+    get_api_client(hass).scheduler.configure(rate, concurrency)
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the cached payloads and results of a removed entry."""
+    if team_ids := entry.data.get(CONF_TEAM_IDS):
+        for t_id in team_ids:
+            await FotMobPayloadStore(hass, f"{entry.entry_id}_{t_id}").async_remove()
+            await FotMobResultsStore(hass, f"{entry.entry_id}_{t_id}").async_remove()
+    else:
+        await FotMobPayloadStore(hass, entry.entry_id).async_remove()
+        await FotMobResultsStore(hass, entry.entry_id).async_remove()
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        # Clean up data if needed
-        pass
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.async_release()
+        if hass.data[DOMAIN].get(DATA_METRICS_OWNER) == entry.entry_id:
+            # Another entry takes the integration-wide sensors on its next setup
+            hass.data[DOMAIN].pop(DATA_METRICS_OWNER)
 
     return unload_ok
@@ -0,0 +1,276 @@
+"""HTTP client shared by every FotMob config entry."""
+import json
+import logging
+import asyncio
+import time
+
+import aiohttp
+import async_timeout
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - bundled with Home Assistant
+    orjson = None
+
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import DOMAIN, DATA_API_CLIENT
+from .metrics import get_metrics
+from .ratelimit import FotMobRequestScheduler, PRIORITY_DEFAULT
+from .resilience import MAX_RETRY_WAIT, CircuitBreaker, backoff_delay, parse_retry_after
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_RETRIES = 3
+REQUEST_TIMEOUT = 30  # seconds per request
+PRIME_TTL = 600  # seconds a primed payload may stand in for a request
+# Primed payloads of abandoned flows are dropped beyond this
+MAX_PRIMED = 32
+# Bodies larger than this are decoded (and projected) in the executor
+# instead of on the event loop
+DECODE_EXECUTOR_THRESHOLD = 64 * 1024  # bytes
+
+TEAM_URL = "https://www.fotmob.com/api/data/teams?id={}"
+LEAGUE_URL = "https://www.fotmob.com/api/leagues?id={}"
+MATCH_URL = "https://www.fotmob.com/api/matchDetails?matchId={}"
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+
+def json_loads(body):
+    """Decode a JSON body, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def decode_body(body, transform=None):
+    """Decode a response body and apply the optional transform."""
+    payload = json_loads(body)
+    return transform(payload) if transform is not None else payload
+
+
+class FotMobApiError(Exception):
+    """Error to indicate a FotMob request failed.
+
+    ``status`` is the HTTP status for error responses and None for
+    network errors and timeouts.
+    """
+
+    def __init__(self, message, status=None):
+        """Initialize the error."""
+        super().__init__(message)
+        self.status = status
+
+    @property
+    def transient(self):
+        """Return True for errors worth retrying later (429, 5xx, network)."""
+        return self.status is None or self.status == 429 or self.status >= 500
+
+
+class FotMobCircuitOpenError(FotMobApiError):
+    """Error to indicate requests are suspended after repeated failures."""
+
+
+class CachedResponse:
+    """Validators and parsed body of the last 200 response for a URL."""
+
+    __slots__ = ("etag", "last_modified", "payload", "transform")
+
+    def __init__(self, etag, last_modified, payload, transform):
+        """Initialize the cached response."""
+        self.etag = etag
+        self.last_modified = last_modified
+        self.payload = payload
+        self.transform = transform
+
+
+class FotMobApiClient:
+    """Fetch FotMob JSON using conditional requests.
+
+    ``ETag``/``Last-Modified`` validators are kept per URL. A ``304 Not
+    Modified`` answer returns the previously parsed object itself, so
+    callers can detect an unchanged payload with an identity check.
+    """
+
+    def __init__(self, hass):
+        """Initialize the client."""
+        self.hass = hass
+        self._cache = {}  # url -> CachedResponse
+        self._primed = {}  # url -> (primed_at, payload)
+        self.scheduler = FotMobRequestScheduler()
+        self.metrics = get_metrics(hass)
+        # Shared by every entry, so all coordinators back off together
+        self.breaker = CircuitBreaker()
+        self.stats = {
+            "requests": 0,
+            "not_modified": 0,
+            "downloaded": 0,
+            "errors": 0,
+            "suspended": 0,  # requests skipped while the circuit breaker is open
+        }
+
+    def forget(self, url):
+        """Drop the cached validators and payload of a URL."""
+        self._cache.pop(url, None)
+
+    def prime(self, url, payload):
+        """Serve payload for the next request of url, e.g. after validation.
+
+        Payloads nobody requested (an aborted flow, a team not picked)
+        expire after PRIME_TTL; at most MAX_PRIMED are kept, oldest first out.
+        """
+        now = time.monotonic()
+        for primed_url, (primed_at, _) in list(self._primed.items()):
+            if now - primed_at >= PRIME_TTL:
+                del self._primed[primed_url]
+        self._primed.pop(url, None)
+        while len(self._primed) >= MAX_PRIMED:
+            del self._primed[next(iter(self._primed))]
+        self._primed[url] = (now, payload)
+
+    async def async_get_json(
+        self, url, retries=MAX_RETRIES, priority=PRIORITY_DEFAULT, raise_on_error=False, transform=None
+    ):
+        """Fetch JSON, retrying transient failures with jittered back-off.
+
+        Every attempt waits for a slot of the shared request scheduler;
+        back-off sleeps happen outside the slot, honor ``Retry-After`` and
+        are abandoned when longer than MAX_RETRY_WAIT. While the circuit
+        breaker is open, requests fail fast. Failures return an empty
+        dict, or raise FotMobApiError when raise_on_error is set; callers
+        keep serving their last good data.
+        ``transform`` is applied to fresh bodies before they are cached,
+        so only its result is kept in memory.
+        """
+        primed = self._primed.pop(url, None)
+        if primed and time.monotonic() - primed[0] < PRIME_TTL:
+            return transform(primed[1]) if transform is not None else primed[1]
+
+        session = async_get_clientsession(self.hass)
+        endpoint = self.metrics.endpoint(url)
+        error = None
+        attempt = 0
+        try:
+            for attempt in range(1, retries + 1):
+                token = self.breaker.allow()
+                if token is None:
+                    error = FotMobCircuitOpenError(
+                        f"Requests suspended for {self.breaker.retry_in:.0f}s after repeated failures"
+                    )
+                    _LOGGER.debug("Skipping %s: %s", url, error)
+                    break
+                cached = self._cache.get(url)
+                if cached and cached.transform != transform:
+                    # Cached for another consumer in another shape
+                    cached = None
+                headers = HEADERS
+                if cached:
+                    headers = dict(HEADERS)
+                    if cached.etag:
+                        headers['If-None-Match'] = cached.etag
+                    if cached.last_modified:
+                        headers['If-Modified-Since'] = cached.last_modified
+                wait = None
+                queued_at = time.monotonic()
+                try:
+                    async with self.scheduler.slot(priority):
+                        started = time.monotonic()
+                        endpoint.queue_wait.observe(started - queued_at)
+                        self.stats["requests"] += 1
+                        async with async_timeout.timeout(REQUEST_TIMEOUT):
+                            async with session.get(url, headers=headers) as response:
+                                if response.status == 304 and cached:
+                                    endpoint.latency.observe(time.monotonic() - started)
+                                    self.breaker.record_success()
+                                    self.stats["not_modified"] += 1
+                                    endpoint.not_modified += 1
+                                    return cached.payload
+                                error = FotMobApiError(f"HTTP {response.status}", response.status)
+                                if error.transient:
+                                    if response.status == 429:
+                                        endpoint.rate_limited += 1
+                                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                                    self.breaker.record_failure(token, retry_after)
+                                    wait = retry_after if retry_after is not None else backoff_delay(attempt)
+                                    _LOGGER.warning("HTTP %s on %s (attempt %d/%d)",
+                                                    response.status, url, attempt, retries)
+                                elif response.status != 200:
+                                    # FotMob answered: the service is up
+                                    self.breaker.record_success()
+                                    _LOGGER.warning("Error fetching FotMob URL %s: HTTP %s", url, response.status)
+                                    self.stats["errors"] += 1
+                                    endpoint.errors += 1
+                                    return self._failed(error, raise_on_error)
+                                else:
+                                    body = await response.read()
+                                    endpoint.latency.observe(time.monotonic() - started)
+                                    endpoint.size.observe(len(body))
+                                    self.breaker.record_success()
+                                    decode_started = time.monotonic()
+                                    payload = await self._async_decode(body, transform)
+                                    endpoint.decode.observe(time.monotonic() - decode_started)
+                                    self.stats["downloaded"] += 1
+                                    etag = response.headers.get('ETag')
+                                    last_modified = response.headers.get('Last-Modified')
+                                    if etag or last_modified:
+                                        self._cache[url] = CachedResponse(etag, last_modified, payload, transform)
+                                    else:
+                                        self._cache.pop(url, None)
+                                    return payload
+                except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+                    self.breaker.record_failure(token)
+                    error = FotMobApiError(str(err) or type(err).__name__)
+                    wait = backoff_delay(attempt)
+                    _LOGGER.warning("Fetch attempt %d/%d failed for %s: %s", attempt, retries, url, error)
+                except Exception as e:
+                    _LOGGER.error("Unexpected error fetching FotMob URL %s: %s", url, e)
+                    self.stats["errors"] += 1
+                    endpoint.errors += 1
+                    return self._failed(FotMobApiError(str(e)), raise_on_error)
+                finally:
+                    self.breaker.end_attempt(token)
+
+                if attempt >= retries:
+                    break
+                if wait > MAX_RETRY_WAIT:
+                    _LOGGER.warning("Not retrying %s for %ds; keeping the last good data", url, wait)
+                    break
+                await asyncio.sleep(wait)
+        finally:
+            if attempt:
+                endpoint.retries.observe(attempt - 1)
+
+        if isinstance(error, FotMobCircuitOpenError):
+            self.stats["suspended"] += 1
+        else:
+            _LOGGER.error("Giving up on %s after %d attempt(s): %s", url, attempt, error)
+            self.stats["errors"] += 1
+            endpoint.errors += 1
+        return self._failed(error, raise_on_error)
+
+    async def _async_decode(self, body, transform):
+        """Decode small bodies inline and large ones off the event loop."""
+        if len(body) < DECODE_EXECUTOR_THRESHOLD:
+            return decode_body(body, transform)
+        return await self.hass.async_add_executor_job(decode_body, body, transform)
+
+    @staticmethod
+    def _failed(error, raise_on_error):
+        """Raise error, or return the empty payload callers expect."""
+        if raise_on_error:
+            raise error
+        return {}
+
+
+def get_api_client(hass):
+    """Return the API client shared by every config entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    client = domain_data.get(DATA_API_CLIENT)
+    if client is None:
+        client = domain_data[DATA_API_CLIENT] = FotMobApiClient(hass)
+    return client
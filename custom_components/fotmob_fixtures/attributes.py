@@ -0,0 +1,86 @@
+"""Compact encoding and size budget of the heavy sensor attributes."""
+import json
+
+from .const import (
+    CONF_ATTRIBUTE_BUDGET,
+    CONF_COMPACT_ATTRIBUTES,
+    DEFAULT_ATTRIBUTE_BUDGET,
+)
+
+
+def columnar(rows):
+    """Turn a list of row dicts into a dict of column lists.
+
+    Columns follow the first-seen key order; rows missing a key get None.
+    Anything but a list of dicts is returned unchanged.
+    """
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        return rows
+    columns = {}
+    for row in rows:
+        for key in row:
+            columns.setdefault(key, None)
+    return {key: [row.get(key) for row in rows] for key in columns}
+
+
+def attribute_size(attributes):
+    """Return the size of the attributes serialized as compact JSON."""
+    return len(json.dumps(attributes, separators=(',', ':'), default=str).encode())
+
+
+def _length(value):
+    """Return the number of rows of a row list or column dict."""
+    if isinstance(value, list):
+        return len(value)
+    if isinstance(value, dict):
+        return max((len(column) for column in value.values() if isinstance(column, list)), default=0)
+    return 0
+
+
+def _head(value, count):
+    """Return the first count rows of a row list or column dict."""
+    if isinstance(value, list):
+        return value[:count]
+    if isinstance(value, dict):
+        return {key: column[:count] if isinstance(column, list) else column for key, column in value.items()}
+    return value
+
+
+def fit_budget(attributes, keys, budget):
+    """Truncate the row attributes in keys until the whole fits in budget bytes.
+
+    Rows are halved until the attributes fit; ``truncated`` then maps
+    each shortened attribute to its full row count, and is left out when
+    no rows had to be dropped.
+    """
+    size = attribute_size(attributes)
+    if size <= budget:
+        return attributes
+    lengths = {key: _length(attributes[key]) for key in keys if key in attributes}
+    fitted = dict(attributes)
+    keep = max(lengths.values(), default=0)
+    while keep > 0 and size > budget:
+        keep //= 2
+        for key in lengths:
+            fitted[key] = _head(attributes[key], keep)
+        size = attribute_size(fitted)
+    if truncated := {key: length for key, length in lengths.items() if length > keep}:
+        fitted["truncated"] = truncated
+    return fitted
+
+
+def is_compact(options):
+    """Return True when the compact attribute format is enabled."""
+    return options.get(CONF_COMPACT_ATTRIBUTES, False)
+
+
+def shape_attributes(attributes, keys, options, truncate=()):
+    """Apply the compact format option and the size budget to attributes.
+
+    keys names the attributes holding lists of rows, which are encoded as
+    columns and truncated; truncate names further lists only truncated.
+    """
+    if is_compact(options):
+        attributes = {key: columnar(value) if key in keys else value for key, value in attributes.items()}
+    budget = options.get(CONF_ATTRIBUTE_BUDGET, DEFAULT_ATTRIBUTE_BUDGET) * 1024
+    return fit_budget(attributes, tuple(keys) + tuple(truncate), budget)
@@ -1,18 +1,46 @@
 """Config flow for FotMob Fixtures integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
-import requests
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, CONF_TEAM_ID
+from .api import TEAM_URL, FotMobApiError, get_api_client
+from .const import (
+    DOMAIN,
+    CONF_TEAM_ID,
+    CONF_TEAM_IDS,
+    CONF_LIVE_INTERVAL,
+    CONF_PREMATCH_INTERVAL,
+    CONF_MATCHWEEK_INTERVAL,
+    CONF_IDLE_INTERVAL,
+    CONF_MATCH_DETAILS_INTERVAL,
+    CONF_MAX_STALENESS,
+    CONF_REQUESTS_PER_SECOND,
+    CONF_MAX_CONCURRENCY,
+    CONF_KEEP_RAW_PAYLOAD,
+    CONF_COMPACT_ATTRIBUTES,
+    CONF_ATTRIBUTE_BUDGET,
+    DEFAULT_LIVE_INTERVAL,
+    DEFAULT_PREMATCH_INTERVAL,
+    DEFAULT_MATCHWEEK_INTERVAL,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_MATCH_DETAILS_INTERVAL,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_REQUESTS_PER_SECOND,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_ATTRIBUTE_BUDGET,
+)
+from .ratelimit import PRIORITY_INTERACTIVE
+from .search import get_search_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +51,22 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_TEAM_GROUP_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): str,
+        vol.Required(CONF_TEAM_IDS): str,
+    }
+)
+
+STEP_SEARCH_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required("query"): str,
+    }
+)
+
+# Separates a team's name from its league in the search results
+SEARCH_LABEL = "{name} ({league})"
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
     team_id = data[CONF_TEAM_ID]
@@ -31,51 +75,185 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     if not team_id.isdigit():
          raise InvalidTeam
          
-    # Optional: Verify with FotMob API
-    url = f"https://www.fotmob.com/api/teams?id={team_id}"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
-    def fetch():
-        return requests.get(url, headers=headers, timeout=10)
-
+    # Verify with the same endpoint and pooled session as the coordinator
+    client = get_api_client(hass)
+    url = TEAM_URL.format(team_id)
     try:
-        response = await hass.async_add_executor_job(fetch)
-        if response.status_code != 200:
-            raise InvalidTeam
-        
-        team_data = response.json()
-        team_name = team_data.get('details', {}).get('name')
-        if not team_name:
-            raise InvalidTeam
-            
-        return {"title": team_name}
-        
-    except Exception as err:
+        team_data = await client.async_get_json(
+            url, retries=1, priority=PRIORITY_INTERACTIVE, raise_on_error=True
+        )
+    except FotMobApiError as err:
         _LOGGER.error("Error validating FotMob team %s: %s", team_id, err)
-        if isinstance(err, InvalidTeam):
-            raise err
-        raise CannotConnect
+        if err.status is not None and not err.transient:
+            raise InvalidTeam from err
+        raise CannotConnect from err
+
+    team_name = team_data.get('details', {}).get('name')
+    if not team_name:
+        raise InvalidTeam
+
+    # The entry's first refresh reuses this payload instead of downloading it
+    # again; the unprojected response is not kept for teams never added
+    client.prime(url, team_data)
+    client.forget(url)
+    return {"title": team_name}
+
+async def validate_teams(hass: HomeAssistant, team_ids: list[str]) -> tuple[list, dict, dict]:
+    """Validate several teams at once; returns (titles, errors, placeholders)."""
+    # Validation requests go through the shared scheduler, and each
+    # validated payload seeds the entry's first refresh
+    results = await asyncio.gather(
+        *(validate_input(hass, {CONF_TEAM_ID: t_id}) for t_id in team_ids),
+        return_exceptions=True,
+    )
+    errors = {}
+    placeholders = {"invalid": ""}
+    invalid = [t_id for t_id, res in zip(team_ids, results) if isinstance(res, InvalidTeam)]
+    if invalid:
+        errors[CONF_TEAM_IDS] = "invalid_team_ids"
+        placeholders["invalid"] = ", ".join(invalid)
+    elif any(isinstance(res, CannotConnect) for res in results):
+        errors["base"] = "cannot_connect"
+    elif any(isinstance(res, Exception) for res in results):
+        _LOGGER.error("Unexpected exception validating teams: %s", results)
+        errors["base"] = "unknown"
+    titles = [res["title"] for res in results if isinstance(res, dict)]
+    return titles, errors, placeholders
 
 class FotMobFixturesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for FotMob Fixtures."""
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._matches: dict[str, str] = {}
+
+    def _configured_team_ids(self) -> set[str]:
+        """Return the ids of the teams tracked by any entry, alone or in a group."""
+        team_ids = set()
+        for entry in self._async_current_entries(include_ignore=False):
+            if CONF_TEAM_IDS in entry.data:
+                team_ids.update(str(t_id) for t_id in entry.data[CONF_TEAM_IDS])
+            elif CONF_TEAM_ID in entry.data:
+                team_ids.add(str(entry.data[CONF_TEAM_ID]))
+        return team_ids
+
+    def _check_not_configured(self, team_ids: list[str]) -> tuple[dict, dict]:
+        """Reject teams already tracked, whose entities would share unique IDs."""
+        configured = [t_id for t_id in team_ids if t_id in self._configured_team_ids()]
+        if not configured:
+            return {}, {"invalid": ""}
+        return {CONF_TEAM_IDS: "team_ids_configured"}, {"invalid": ", ".join(configured)}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> FotMobOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return FotMobOptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["search", "team", "team_group"])
+
+    async def async_step_search(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle looking up teams by name."""
+        errors = {}
+        if user_input is not None:
+            index = get_search_index(self.hass)
+            try:
+                matches = await index.async_search(user_input["query"])
+            except FotMobApiError as err:
+                _LOGGER.error("Error searching FotMob for %s: %s", user_input["query"], err)
+                # Offer what the index already knows before giving up
+                matches = index.search(user_input["query"])
+                if not matches:
+                    errors["base"] = "cannot_connect"
+            if not matches and not errors:
+                errors["query"] = "no_results"
+            if not errors:
+                self._matches = {
+                    match["id"]: SEARCH_LABEL.format(**match) if match.get("league") else match["name"]
+                    for match in matches
+                }
+                return await self.async_step_search_results()
+
+        return self.async_show_form(
+            step_id="search",
+            data_schema=STEP_SEARCH_DATA_SCHEMA,
+            errors=errors,
+        )
+
+    async def async_step_search_results(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle picking one team, or several for a team group."""
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_TEAM_IDS): cv.multi_select(self._matches),
+                vol.Optional("name"): str,
+            }
+        )
+        errors = {}
+        placeholders = {"invalid": ""}
+        if user_input is not None:
+            team_ids = list(user_input[CONF_TEAM_IDS])
+            if not team_ids:
+                errors[CONF_TEAM_IDS] = "invalid_team"
+            else:
+                errors, placeholders = self._check_not_configured(team_ids)
+            if not errors:
+                titles, errors, placeholders = await validate_teams(self.hass, team_ids)
+            if not errors:
+                name = user_input.get("name")
+                if len(team_ids) == 1:
+                    await self.async_set_unique_id(team_ids[0])
+                    self._abort_if_unique_id_configured()
+                    data = {CONF_TEAM_ID: team_ids[0]}
+                    if name:
+                        data["name"] = name
+                    return self.async_create_entry(title=name or titles[0], data=data)
+                # Several picks are added in one pass, as a team group
+                name = name or ", ".join(titles)
+                return self.async_create_entry(
+                    title=name, data={"name": name, CONF_TEAM_IDS: team_ids}
+                )
+
+        return self.async_show_form(
+            step_id="search_results",
+            data_schema=schema,
+            errors=errors,
+            description_placeholders=placeholders,
+        )
+
+    async def async_step_team(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle adding a single team."""
         if user_input is None:
             return self.async_show_form(
-                step_id="user", data_schema=STEP_USER_DATA_SCHEMA
+                step_id="team", data_schema=STEP_USER_DATA_SCHEMA
             )
 
         errors = {}
+        team_id = user_input[CONF_TEAM_ID].strip()
+        user_input = {**user_input, CONF_TEAM_ID: team_id}
+        await self.async_set_unique_id(team_id)
+        self._abort_if_unique_id_configured()
 
         try:
+            if team_id in self._configured_team_ids():
+                # Tracked by a team group, which has no per-team unique ID
+                raise TeamConfigured
             info = await validate_input(self.hass, user_input)
+        except TeamConfigured:
+            errors["team_id"] = "team_configured"
         except CannotConnect:
             errors["base"] = "cannot_connect"
         except InvalidTeam:
@@ -89,11 +267,113 @@ class FotMobFixturesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_create_entry(title=title, data=user_input)
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="team", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_team_group(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle adding a group of teams served by one coordinator."""
+        if user_input is None:
+            return self.async_show_form(
+                step_id="team_group",
+                data_schema=STEP_TEAM_GROUP_DATA_SCHEMA,
+                description_placeholders={"invalid": ""},
+            )
+
+        errors = {}
+        placeholders = {"invalid": ""}
+        team_ids = list(dict.fromkeys(
+            t_id.strip() for t_id in user_input[CONF_TEAM_IDS].split(",") if t_id.strip()
+        ))
+
+        if not team_ids:
+            errors[CONF_TEAM_IDS] = "invalid_team"
+        else:
+            errors, placeholders = self._check_not_configured(team_ids)
+        if not errors:
+            _, errors, placeholders = await validate_teams(self.hass, team_ids)
+
+        if not errors:
+            return self.async_create_entry(
+                title=user_input["name"],
+                data={"name": user_input["name"], CONF_TEAM_IDS: team_ids},
+            )
+
+        return self.async_show_form(
+            step_id="team_group",
+            data_schema=STEP_TEAM_GROUP_DATA_SCHEMA,
+            errors=errors,
+            description_placeholders=placeholders,
         )
 
+class FotMobOptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle FotMob Fixtures options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage polling intervals, cached data staleness and request limits."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        minutes = vol.All(vol.Coerce(int), vol.Range(min=1, max=1440))
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_LIVE_INTERVAL,
+                    default=options.get(CONF_LIVE_INTERVAL, DEFAULT_LIVE_INTERVAL),
+                ): minutes,
+                vol.Optional(
+                    CONF_PREMATCH_INTERVAL,
+                    default=options.get(CONF_PREMATCH_INTERVAL, DEFAULT_PREMATCH_INTERVAL),
+                ): minutes,
+                vol.Optional(
+                    CONF_MATCHWEEK_INTERVAL,
+                    default=options.get(CONF_MATCHWEEK_INTERVAL, DEFAULT_MATCHWEEK_INTERVAL),
+                ): minutes,
+                vol.Optional(
+                    CONF_IDLE_INTERVAL,
+                    default=options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+                ): minutes,
+                vol.Optional(
+                    CONF_MATCH_DETAILS_INTERVAL,
+                    default=options.get(CONF_MATCH_DETAILS_INTERVAL, DEFAULT_MATCH_DETAILS_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
+                vol.Optional(
+                    CONF_MAX_STALENESS,
+                    default=options.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=720)),
+                vol.Optional(
+                    CONF_REQUESTS_PER_SECOND,
+                    default=options.get(CONF_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=20)),
+                vol.Optional(
+                    CONF_MAX_CONCURRENCY,
+                    default=options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                vol.Optional(
+                    CONF_COMPACT_ATTRIBUTES,
+                    default=options.get(CONF_COMPACT_ATTRIBUTES, False),
+                ): bool,
+                vol.Optional(
+                    CONF_ATTRIBUTE_BUDGET,
+                    default=options.get(CONF_ATTRIBUTE_BUDGET, DEFAULT_ATTRIBUTE_BUDGET),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=256)),
+                vol.Optional(
+                    CONF_KEEP_RAW_PAYLOAD,
+                    default=options.get(CONF_KEEP_RAW_PAYLOAD, False),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
 class InvalidTeam(HomeAssistantError):
     """Error to indicate there is invalid team ID."""
+
+class TeamConfigured(HomeAssistantError):
+    """Error to indicate the team is already tracked by another entry."""
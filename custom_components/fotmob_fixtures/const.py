@@ -2,3 +2,57 @@
 
 DOMAIN = "fotmob_fixtures"
 CONF_TEAM_ID = "team_id"
+# Team group entries track several teams with one coordinator
+CONF_TEAM_IDS = "team_ids"
+
+# Keys for integration-wide objects kept in hass.data[DOMAIN] next to the
+# per-entry coordinators.
+DATA_LEAGUE_CACHE = "league_cache"
+DATA_API_CLIENT = "api_client"
+DATA_METRICS = "metrics"
+# Formatted league tables, shared by the teams of a league
+DATA_TABLE_RENDERS = "table_renders"
+# League coordinators, shared by the teams playing in each league
+DATA_LEAGUES = "leagues"
+# Team logos cached on disk and served locally
+DATA_LOGO_CACHE = "logo_cache"
+# Team and league names searched by the config flow
+DATA_SEARCH_INDEX = "search_index"
+# Entry whose sensor platform provides the integration-wide diagnostic sensors
+DATA_METRICS_OWNER = "metrics_owner"
+
+# Options: polling interval (minutes) for each match phase
+CONF_LIVE_INTERVAL = "live_interval"
+CONF_PREMATCH_INTERVAL = "prematch_interval"
+CONF_MATCHWEEK_INTERVAL = "matchweek_interval"
+CONF_IDLE_INTERVAL = "idle_interval"
+
+DEFAULT_LIVE_INTERVAL = 1
+DEFAULT_PREMATCH_INTERVAL = 5
+DEFAULT_MATCHWEEK_INTERVAL = 30
+DEFAULT_IDLE_INTERVAL = 360
+
+# Options: hours after which cached data counts as unavailable
+CONF_MAX_STALENESS = "max_staleness"
+DEFAULT_MAX_STALENESS = 24
+
+# Options: integration-wide request limits (the most conservative values
+# across all entries apply)
+CONF_REQUESTS_PER_SECOND = "requests_per_second"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Options: keep the unprojected API responses in memory for diagnostics
+CONF_KEEP_RAW_PAYLOAD = "keep_raw_payload"
+
+# Options: seconds between match details requests while a match is live
+CONF_MATCH_DETAILS_INTERVAL = "match_details_interval"
+DEFAULT_MATCH_DETAILS_INTERVAL = 20
+
+# Options: heavy list attributes as column arrays, and the size budget
+# (KiB) of any sensor's attributes
+CONF_COMPACT_ATTRIBUTES = "compact_attributes"
+CONF_ATTRIBUTE_BUDGET = "attribute_budget"
+DEFAULT_ATTRIBUTE_BUDGET = 16
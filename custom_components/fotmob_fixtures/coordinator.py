@@ -1,116 +1,763 @@
 import logging
 import asyncio
+import random
+import time
+from abc import ABC, abstractmethod
 from datetime import timedelta
+from functools import partial
 
-import aiohttp
-import async_timeout
-
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .api import LEAGUE_URL, TEAM_URL, get_api_client
+from .const import DOMAIN, DATA_LEAGUE_CACHE, CONF_KEEP_RAW_PAYLOAD, CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS
+from .events import FotMobMatchEvents
+from .league import get_leagues
+from .live import FotMobLiveMatchCoordinator
+from .logos import get_logo_cache
+from .metrics import get_metrics
+from .projection import (
+    project_history_tab,
+    project_league_payload,
+    project_team_overview,
+    project_transfers_tab,
+)
+from .ratelimit import PRIORITY_BACKGROUND, PRIORITY_DEFAULT, PRIORITY_LIVE
+from .scheduler import (
+    PHASE_IDLE,
+    PHASE_LIVE,
+    PHASE_MATCHWEEK,
+    compute_update_interval,
+    is_matchday,
+    phase_interval,
+)
+from .snapshot import TeamSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
-MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds between retries
-REQUEST_TIMEOUT = 30  # seconds per request
+LEAGUE_CACHE_TTL = 240  # seconds a shared league payload is reused
+# Random extra delay spreading the refreshes of many entries apart
+REFRESH_JITTER = 0.1  # fraction of the update interval
+STARTUP_JITTER = 15  # seconds
 
+# Refresh cadence of the secondary resources; the overview is fetched on
+# every update
+TRANSFERS_TTL = timedelta(days=1)
+HISTORY_TTL = timedelta(days=7)
+LEAGUE_TTL = timedelta(hours=6)
+LEAGUE_MATCHDAY_TTL = timedelta(minutes=5)
+# Teams of a group refreshed concurrently
+GROUP_FAN_OUT = 4
 
-class FotMobDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching FotMob data."""
+
+class ResourceTier:
+    """A secondary resource refreshed on its own cadence.
+
+    Holds the last good payload so a failed or skipped fetch still merges
+    the previous data into the coordinator payload.
+    """
+
+    __slots__ = ("ttl", "key", "data", "fetched_at")
+
+    def __init__(self, ttl, key=None):
+        """Initialize the tier; key selects a sub-object of the response."""
+        self.ttl = ttl
+        self.key = key
+        self.data = None
+        self.fetched_at = None
+
+    def is_due(self, now, ttl=None):
+        """Return True when the resource should be fetched again."""
+        if self.fetched_at is None:
+            return True
+        return now - self.fetched_at >= (ttl or self.ttl)
+
+    def store(self, payload, now):
+        """Keep a fetched payload; empty responses leave the tier due."""
+        if not payload:
+            return
+        self.data = payload.get(self.key, {}) if self.key else payload
+        self.fetched_at = now
+
+    def reset(self):
+        """Forget the payload, e.g. after the league changed."""
+        self.data = None
+        self.fetched_at = None
+
+
+class FotMobLeagueCache:
+    """Hass-wide cache of league payloads shared by all coordinators.
+
+    Coordinators tracking teams in the same league share a single request
+    (concurrent callers await the same in-flight task) and the same parsed
+    object. Entries expire after ``ttl`` seconds and are evicted as soon as
+    the last coordinator referencing the league releases it.
+    """
+
+    def __init__(self, hass, ttl=LEAGUE_CACHE_TTL):
+        """Initialize the cache."""
+        self.hass = hass
+        self.ttl = ttl
+        self._payloads = {}  # league_id -> (fetched_at, payload)
+        self._inflight = {}  # league_id -> asyncio.Task
+        self._refs = {}  # league_id -> set of owners
+        self._owners = {}  # owner -> league_id
+
+    def acquire(self, owner, league_id):
+        """Record that owner uses league_id, dropping any previous league."""
+        league_id = str(league_id)
+        if self._owners.get(owner) == league_id:
+            return
+        self.release(owner)
+        self._owners[owner] = league_id
+        self._refs.setdefault(league_id, set()).add(owner)
+
+    def release(self, owner):
+        """Drop owner's reference and evict the league when unused."""
+        league_id = self._owners.pop(owner, None)
+        if league_id is None:
+            return
+        refs = self._refs.get(league_id, set())
+        refs.discard(owner)
+        if not refs:
+            self._refs.pop(league_id, None)
+            self._payloads.pop(league_id, None)
+
+    async def async_get(self, league_id):
+        """Return the league payload, fetching it at most once per TTL."""
+        league_id = str(league_id)
+        cached = self._payloads.get(league_id)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        task = self._inflight.get(league_id)
+        if task is None:
+            task = self.hass.async_create_task(self._async_fetch(league_id))
+            self._inflight[league_id] = task
+        # Shield so one cancelled waiter does not abort the shared request
+        return await asyncio.shield(task)
+
+    async def _async_fetch(self, league_id):
+        """Fetch a league payload and store it for the other owners."""
+        try:
+            payload = await get_api_client(self.hass).async_get_json(
+                LEAGUE_URL.format(league_id), priority=PRIORITY_BACKGROUND, transform=project_league_payload
+            )
+        finally:
+            self._inflight.pop(league_id, None)
+
+        if not payload:
+            # Keep serving the last good table rather than dropping it
+            cached = self._payloads.get(league_id)
+            return cached[1] if cached else {}
+
+        if league_id in self._refs:
+            self._payloads[league_id] = (time.monotonic(), payload)
+        return payload
+
+
+def get_league_cache(hass):
+    """Return the league cache shared by every config entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.get(DATA_LEAGUE_CACHE)
+    if cache is None:
+        cache = domain_data[DATA_LEAGUE_CACHE] = FotMobLeagueCache(hass)
+    return cache
+
+
+class FotMobTeamFetcher:
+    """Fetch pipeline of one team: overview, refresh tiers and snapshot.
+
+    Used by both the single-team coordinator and the team group
+    coordinator; it keeps the last good merged payload in ``data``.
+    """
 
     def __init__(self, hass, team_id):
-        """Initialize the coordinator."""
+        """Initialize the fetcher."""
+        self.hass = hass
         self.team_id = team_id
+        self.base_url = TEAM_URL.format(team_id)
+        self.data = None
+        # Unprojected responses, only kept when the debug option is set
+        self.keep_raw = False
+        self.raw = {}
+        self.last_fetched = None
+        self.phase = PHASE_IDLE
+        self.interval = None
+        self._snapshot = None
+        self._snapshot_source = None
+        self._league_id = None
+        # Coordinator of the league the team plays in, owning its standings
+        self.league = None
+        self._tiers = {
+            "transfers": ResourceTier(TRANSFERS_TTL, "transfers"),
+            "history": ResourceTier(HISTORY_TTL, "history"),
+            "league_table": ResourceTier(LEAGUE_TTL),
+        }
+
+    def _keep_raw(self, name, payload):
+        """Keep an unprojected response for troubleshooting."""
+        if self.keep_raw:
+            self.raw[name] = payload
+
+    def _project_overview(self, payload):
+        """Project an overview response, dropping the raw JSON."""
+        self._keep_raw("overview", payload)
+        return project_team_overview(payload)
+
+    def _project_transfers(self, payload):
+        """Project a transfers tab response."""
+        self._keep_raw("transfers", payload)
+        return project_transfers_tab(payload)
+
+    def _project_history(self, payload):
+        """Project a history tab response."""
+        self._keep_raw("history", payload)
+        return project_history_tab(payload)
+
+    @property
+    def snapshot(self):
+        """Return the lookup snapshot for the current data, built once per refresh."""
+        data = self.data
+        if self._snapshot is None or self._snapshot_source is not data:
+            self._snapshot = TeamSnapshot(self.team_id, data if data is not None else {})
+            self._snapshot_source = data
+        return self._snapshot
+
+    @property
+    def tier_times(self):
+        """Return the last fetch time of each refresh tier."""
+        return {name: tier.fetched_at for name, tier in self._tiers.items() if tier.fetched_at}
+
+    def stale_at(self, options):
+        """Return when the data exceeds the max staleness option, or None."""
+        if self.last_fetched is None:
+            return None
+        return self.last_fetched + timedelta(hours=options.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS))
+
+    def is_stale(self, options):
+        """Return True when the data is older than the max staleness option."""
+        stale_at = self.stale_at(options)
+        return stale_at is not None and dt_util.utcnow() > stale_at
+
+    def restore(self, data, fetched_at, tier_times, options):
+        """Seed the fetcher from a stored payload."""
+        self.data = data
+        self.last_fetched = fetched_at
+        for name, tier in self._tiers.items():
+            if data.get(name) and name in tier_times:
+                tier.data = data[name]
+                tier.fetched_at = tier_times[name]
+        tables = data.get("table", [])
+        if tables and (league_id := tables[0].get("data", {}).get("leagueId")):
+            self._league_id = str(league_id)
+        self._update_schedule(data, options)
+        self._publish_standings()
+        self._allow_logos()
+
+    def release(self):
+        """Release shared resources held by this team."""
+        get_league_cache(self.hass).release(self)
+        get_leagues(self.hass).release(self)
+        self.league = None
+        if (cache := get_logo_cache(self.hass)) is not None:
+            cache.release(self)
+        client = get_api_client(self.hass)
+        for url in (self.base_url, f"{self.base_url}&tab=transfers", f"{self.base_url}&tab=history"):
+            client.forget(url)
+
+    def _publish_standings(self):
+        """Hand the team's tables to the coordinator of its league."""
+        leagues = get_leagues(self.hass)
+        if self._league_id is None:
+            leagues.release(self)
+            self.league = None
+            return
+        self.league = leagues.acquire(self, self._league_id)
+        self.league.async_publish(self.snapshot.table_index)
+
+    def _allow_logos(self):
+        """Let the logo view serve the team, its opponents and table rows."""
+        if (cache := get_logo_cache(self.hass)) is None:
+            return
+        snapshot = self.snapshot
+        timeline = snapshot.timeline
+        cache.allow(self, (
+            self.team_id,
+            *snapshot.overview_index.entries,
+            *snapshot.table_index.entries,
+            *(view.opponent_id for views in (timeline.past, timeline.live, timeline.upcoming) for view in views),
+        ))
+
+    def _update_schedule(self, overview, options):
+        """Derive the match phase and polling interval from the fixtures."""
+        fixtures = overview.get('fixtures', {}).get('allFixtures', {}).get('fixtures', [])
+        self.phase, self.interval = compute_update_interval(fixtures, options)
+        return fixtures
+
+    async def async_fetch_overview(self, options):
+        """Fetch the team overview, which is refreshed on every update."""
+        self.keep_raw = options.get(CONF_KEEP_RAW_PAYLOAD, False)
+        if not self.keep_raw:
+            self.raw = {}
+        priority = PRIORITY_LIVE if self.phase == PHASE_LIVE else PRIORITY_DEFAULT
+        overview = await get_api_client(self.hass).async_get_json(
+            self.base_url, priority=priority, transform=self._project_overview
+        )
+        if not overview:
+            raise UpdateFailed(f"Failed to fetch primary team data from FotMob for team {self.team_id}")
+        self._update_schedule(overview, options)
+        return overview
+
+    def due_league(self, overview, now):
+        """Return the league id whose table should be fetched now, if any."""
+        league_id = None
+        tables = overview.get("table", [])
+        if tables:
+            league_id = tables[0].get("data", {}).get("leagueId")
+
+        league_cache = get_league_cache(self.hass)
+        league_tier = self._tiers["league_table"]
+        if not league_id:
+            league_cache.release(self)
+            league_tier.reset()
+            self._league_id = None
+            return None
+
+        if str(league_id) != self._league_id:
+            league_tier.reset()
+            self._league_id = str(league_id)
+        # Shared across coordinators: one request per league per TTL
+        league_cache.acquire(self, league_id)
+        fixtures = overview.get('fixtures', {}).get('allFixtures', {}).get('fixtures', [])
+        league_ttl = LEAGUE_MATCHDAY_TTL if is_matchday(fixtures, now) else None
+        if league_tier.is_due(now, league_ttl):
+            return league_id
+        return None
+
+    async def async_fetch_secondary(self, overview, now):
+        """Fetch the secondary tiers that are due and merge the payload."""
+        client = get_api_client(self.hass)
+        tasks = {}
+        if self._tiers["transfers"].is_due(now):
+            tasks["transfers"] = client.async_get_json(
+                f"{self.base_url}&tab=transfers", priority=PRIORITY_BACKGROUND, transform=self._project_transfers
+            )
+        if self._tiers["history"].is_due(now):
+            tasks["history"] = client.async_get_json(
+                f"{self.base_url}&tab=history", priority=PRIORITY_BACKGROUND, transform=self._project_history
+            )
+        if (league_id := self.due_league(overview, now)) is not None:
+            tasks["league_table"] = get_league_cache(self.hass).async_get(league_id)
+
+        results = await asyncio.gather(*tasks.values())
+        for name, result in zip(tasks, results):
+            self._tiers[name].store(result, now)
+
+        # Merge the projected sections; tiers keep their last good payload.
+        # The overview may be the cached object of a 304, so never mutate it
+        data = dict(overview)
+        for name, tier in self._tiers.items():
+            if tier.data:
+                data[name] = tier.data
+
+        self.last_fetched = now
+        # Unchanged payloads (304s share the parsed objects, making this
+        # mostly identity checks) keep the previous object so listeners
+        # and the snapshot are not refreshed for nothing
+        if self.data is None or data != self.data:
+            self.data = data
+        self._publish_standings()
+        self._allow_logos()
+        return self.data
+
+    async def async_fetch(self, options, now):
+        """Fetch and merge every resource of the team that is due."""
+        overview = await self.async_fetch_overview(options)
+        return await self.async_fetch_secondary(overview, now)
+
+
+class FotMobBaseCoordinator(DataUpdateCoordinator, ABC):
+    """Behaviour shared by the single-team and team group coordinators."""
+
+    def __init__(self, hass, name, options, results=None):
+        """Initialize the coordinator."""
+        self.options = options or {}
+        self._results = results or {}  # team id -> FotMobResultsStore
+        self.phase = PHASE_IDLE
+        self._live = {}  # team id -> FotMobLiveMatchCoordinator
+        self._events = {}  # team id -> FotMobMatchEvents, once enabled
+        self.last_refresh_duration = None
+        self._unsub_stale_check = None
         super().__init__(
             hass,
             _LOGGER,
-            name=f"FotMob Team {team_id}",
+            name=name,
             update_interval=timedelta(minutes=5),
+            # Listeners are skipped when a refresh returns the same data
+            always_update=False,
         )
 
-    async def _async_update_data(self):
-        """Fetch data from FotMob API with retry logic."""
-        session = async_get_clientsession(self.hass)
-        base_url = f"https://www.fotmob.com/api/data/teams?id={self.team_id}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/json',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
+    @property
+    @abstractmethod
+    def team_ids(self):
+        """Return the ids of the teams served by this coordinator."""
 
-        async def fetch_json(url, retries=MAX_RETRIES):
-            """Fetch JSON with exponential retry on timeout/network errors."""
-            for attempt in range(1, retries + 1):
-                try:
-                    async with async_timeout.timeout(REQUEST_TIMEOUT):
-                        response = await session.get(url, headers=headers)
-                        if response.status == 429:
-                            wait = RETRY_DELAY * attempt * 2
-                            _LOGGER.warning("Rate limited on %s, waiting %ds (attempt %d/%d)", url, wait, attempt, retries)
-                            await asyncio.sleep(wait)
-                            continue
-                        if response.status != 200:
-                            _LOGGER.warning("Error fetching FotMob URL %s: HTTP %s", url, response.status)
-                            return {}
-                        return await response.json()
-                except (asyncio.TimeoutError, aiohttp.ClientError) as err:
-                    wait = RETRY_DELAY * attempt
-                    if attempt < retries:
-                        _LOGGER.warning("Fetch attempt %d/%d failed for %s: %s. Retrying in %ds...",
-                                        attempt, retries, url, err, wait)
-                        await asyncio.sleep(wait)
-                    else:
-                        _LOGGER.error("All %d attempts failed for %s: %s", retries, url, err)
-                        return {}
-                except Exception as e:
-                    _LOGGER.error("Unexpected error fetching FotMob URL %s: %s", url, e)
-                    return {}
-            return {}
+    @abstractmethod
+    def _fetcher(self, team_id):
+        """Return the fetcher of a team."""
 
-        try:
-            # 1. Fetch overview first
-            overview = await fetch_json(base_url)
-            if not overview:
-                raise UpdateFailed("Failed to fetch primary team data from FotMob")
-
-            # 2. Discover leagueId for full table data
-            league_id = None
-            tables = overview.get("table", [])
-            if tables:
-                league_id = tables[0].get("data", {}).get("leagueId")
-
-            # 3. Fetch secondary data in parallel
-            transfers_url = f"{base_url}&tab=transfers"
-            history_url = f"{base_url}&tab=history"
-            
-            # Fetch secondary data in parallel to be efficient
-            tasks = [
-                fetch_json(transfers_url),
-                fetch_json(history_url)
-            ]
-            
-            if league_id:
-                tasks.append(fetch_json(f"https://www.fotmob.com/api/leagues?id={league_id}"))
-            else:
-                tasks.append(asyncio.sleep(0, result={})) # Placeholder
-
-            results = await asyncio.gather(*tasks)
-            transfers = results[0]
-            history = results[1]
-            league_data = results[2]
-
-            # Merge everything
-            data = overview
-            if transfers:
-                data["transfers"] = transfers.get("transfers", {})
-            if history:
-                data["history"] = history.get("history", {})
-            if league_data:
-                data["league_table"] = league_data
+    def team_payload(self, team_id):
+        """Return the merged payload of a team, or None."""
+        return self._fetcher(team_id).data
+
+    def team_raw_payload(self, team_id):
+        """Return the unprojected responses kept for a team, if enabled."""
+        return self._fetcher(team_id).raw
+
+    def team_snapshot(self, team_id):
+        """Return the per-refresh lookup snapshot of a team."""
+        return self._fetcher(team_id).snapshot
+
+    def league_coordinator(self, team_id):
+        """Return the coordinator of the league a team plays in, or None."""
+        return self._fetcher(team_id).league
 
+    def team_results(self, team_id):
+        """Return the results store of a team, or None."""
+        return self._results.get(str(team_id))
+
+    async def _async_load_results(self):
+        """Load the stored results of every team."""
+        await asyncio.gather(*(results.async_load() for results in self._results.values()))
+
+    def _record_results(self, team_id):
+        """Append the team's newly finished fixtures to its results store."""
+        if (results := self.team_results(team_id)) is not None:
+            snapshot = self.team_snapshot(team_id)
+            results.append(snapshot.timeline.past, snapshot.timeline.season_start, snapshot.season)
+
+    def team_is_stale(self, team_id):
+        """Return True when a team's data is older than the max staleness."""
+        return self._fetcher(team_id).is_stale(self.options)
+
+    @callback
+    def _schedule_stale_check(self):
+        """Notify listeners when the next team's data goes stale.
+
+        Repeated failed refreshes do not notify listeners, so without this
+        sensors would keep showing cached data through a long outage.
+        """
+        self._cancel_stale_check()
+        now = dt_util.utcnow()
+        upcoming = [
+            stale_at for team_id in self.team_ids
+            if (stale_at := self._fetcher(team_id).stale_at(self.options)) is not None and stale_at > now
+        ]
+        if upcoming:
+            self._unsub_stale_check = async_track_point_in_utc_time(
+                self.hass, self._async_handle_stale, min(upcoming) + timedelta(seconds=1)
+            )
+
+    @callback
+    def _async_handle_stale(self, now):
+        """Let the sensors of the teams whose data went stale turn unavailable."""
+        self._unsub_stale_check = None
+        self.async_update_listeners()
+        self._schedule_stale_check()
+
+    def _cancel_stale_check(self):
+        """Cancel the pending staleness check."""
+        if self._unsub_stale_check is not None:
+            self._unsub_stale_check()
+            self._unsub_stale_check = None
+
+    async def _async_update_data(self):
+        """Refresh the teams, recording how long it took."""
+        started = time.perf_counter()
+        try:
+            data = await self._async_fetch_teams()
+            self._schedule_stale_check()
             return data
+        finally:
+            self.last_refresh_duration = time.perf_counter() - started
+            get_metrics(self.hass).observe_refresh(self.name, self.last_refresh_duration)
+
+    @abstractmethod
+    async def _async_fetch_teams(self):
+        """Fetch and return the coordinator data."""
+
+    def live_coordinator(self, team_id):
+        """Return the live match coordinator of a team, created on first use."""
+        team_id = str(team_id)
+        live = self._live.get(team_id)
+        if live is None:
+            live = self._live[team_id] = FotMobLiveMatchCoordinator(
+                self.hass, team_id, self.options, self.async_request_refresh
+            )
+        return live
+
+    def _team_interval(self, team_id, phase, interval, now):
+        """Start or stop live match polling, and return the team's interval.
+
+        While the match details of a live fixture are polled, the overview
+        is only refreshed at the matchweek pace; the live interval applies
+        again when the match details cannot be fetched.
+        """
+        live = self.live_coordinator(team_id)
+        tracking = live.async_track(self.team_snapshot(team_id), now)
+        if tracking and live.last_update_success and phase == PHASE_LIVE and interval is not None:
+            return max(interval, phase_interval(PHASE_MATCHWEEK, self.options))
+        return interval
+
+    @callback
+    def async_enable_events(self):
+        """Fire bus events on match state changes; returns an unsubscribe callable."""
+        unsubs = [self.async_add_listener(self._async_process_events)]
+        for team_id in self.team_ids:
+            self._events[team_id] = FotMobMatchEvents(self.hass, team_id)
+            unsubs.append(
+                self.live_coordinator(team_id).async_add_listener(partial(self._async_process_live_events, team_id))
+            )
+        # The current state is the baseline
+        self._async_process_events()
+
+        @callback
+        def unsubscribe():
+            for unsub in unsubs:
+                unsub()
+            self._events.clear()
+
+        return unsubscribe
+
+    @callback
+    def _async_process_events(self):
+        """Diff the snapshot of every team against its previous one."""
+        for team_id, events in self._events.items():
+            payload = self.team_payload(team_id) or {}
+            events.async_process_snapshot(self.team_snapshot(team_id), payload.get('details', {}).get('name'))
+
+    @callback
+    def _async_process_live_events(self, team_id):
+        """Diff the match details of a team against the previous ones."""
+        if (events := self._events.get(team_id)) is not None:
+            events.async_process_live(self.live_coordinator(team_id).data)
+
+    def _release_live(self):
+        """Stop every live match poll and the staleness check."""
+        self._cancel_stale_check()
+        for live in self._live.values():
+            live.async_stop()
+
+    def _apply_schedule(self, phase, interval):
+        """Use the phase interval, plus jitter so entries drift apart."""
+        if phase != self.phase:
+            _LOGGER.debug("%s: %s phase, polling every %s", self.name, phase, interval)
+        self.phase = phase
+        if interval is not None:
+            self.update_interval = interval * (1 + random.uniform(0, REFRESH_JITTER))
+
+    async def async_jittered_refresh(self):
+        """Refresh after a random delay so entries do not all fire at once."""
+        await asyncio.sleep(random.uniform(0, STARTUP_JITTER))
+        await self.async_refresh()
+
+
+class FotMobDataUpdateCoordinator(FotMobBaseCoordinator):
+    """Class to manage fetching FotMob data."""
+
+    def __init__(self, hass, team_id, options=None, store=None, results=None):
+        """Initialize the coordinator."""
+        self.team_id = team_id
+        self._team = FotMobTeamFetcher(hass, team_id)
+        self._store = store
+        super().__init__(
+            hass, f"FotMob Team {team_id}", options, {str(team_id): results} if results is not None else None
+        )
+
+    @property
+    def team_ids(self):
+        """Return the ids of the teams served by this coordinator."""
+        return [self.team_id]
+
+    def _fetcher(self, team_id):
+        """Return the fetcher of a team."""
+        return self._team
 
+    @property
+    def snapshot(self):
+        """Return the lookup snapshot for the current data."""
+        return self._team.snapshot
+
+    @property
+    def last_fetched(self):
+        """Return the time of the last successful refresh."""
+        return self._team.last_fetched
+
+    async def async_restore(self):
+        """Seed the coordinator from the persistent cache.
+
+        Returns False when there is no usable cached payload, in which case
+        the caller should perform a regular first refresh.
+        """
+        await self._async_load_results()
+        if self._store is None or (stored := await self._store.async_load()) is None:
+            return False
+        data, fetched_at, tier_times = stored
+        self._team.restore(data, fetched_at, tier_times, self.options)
+        if self._team.is_stale(self.options):
+            _LOGGER.debug("%s: cached payload from %s is too old", self.name, fetched_at)
+            self._team.release()
+            self._team = FotMobTeamFetcher(self.hass, self.team_id)
+            return False
+
+        self._apply_team_schedule(dt_util.utcnow())
+        self._record_results(self.team_id)
+        self._schedule_stale_check()
+        self.async_set_updated_data(data)
+        return True
+
+    def async_release(self):
+        """Release shared resources held by this coordinator."""
+        self._release_live()
+        self._team.release()
+
+    def _apply_team_schedule(self, now):
+        """Poll at the pace of the team's match phase."""
+        team = self._team
+        self._apply_schedule(team.phase, self._team_interval(self.team_id, team.phase, team.interval, now))
+
+    async def _async_fetch_teams(self):
+        """Fetch data from FotMob API with retry logic."""
+        now = dt_util.utcnow()
+        try:
+            data = await self._team.async_fetch(self.options, now)
         except UpdateFailed:
             raise
         except Exception as err:
             raise UpdateFailed(f"Unexpected error updating FotMob data: {err}")
+
+        self._apply_team_schedule(now)
+        self._record_results(self.team_id)
+        if self._store is not None:
+            self._store.async_schedule_save(data, now, self._team.tier_times)
+        return data
+
+
+class FotMobTeamGroupCoordinator(FotMobBaseCoordinator):
+    """Fetch many teams on a single schedule.
+
+    Overviews are fetched with a bounded fan-out, then the league tables
+    due for the whole group are fetched once per league before the
+    per-team secondary tiers. ``data`` maps team id to the team payload.
+    """
+
+    def __init__(self, hass, name, team_ids, options=None, stores=None, results=None):
+        """Initialize the coordinator."""
+        self._teams = {str(team_id): FotMobTeamFetcher(hass, str(team_id)) for team_id in team_ids}
+        self._stores = stores or {}
+        super().__init__(hass, f"FotMob Group {name}", options, results)
+
+    @property
+    def team_ids(self):
+        """Return the ids of the teams served by this coordinator."""
+        return list(self._teams)
+
+    def _fetcher(self, team_id):
+        """Return the fetcher of a team."""
+        return self._teams[str(team_id)]
+
+    async def async_restore(self):
+        """Seed the teams that have a usable cached payload.
+
+        Returns False when no team could be restored.
+        """
+        await self._async_load_results()
+        restored = False
+        for team_id, team in self._teams.items():
+            store = self._stores.get(team_id)
+            if store is None or (stored := await store.async_load()) is None:
+                continue
+            data, fetched_at, tier_times = stored
+            team.restore(data, fetched_at, tier_times, self.options)
+            if team.is_stale(self.options):
+                team.release()
+                self._teams[team_id] = FotMobTeamFetcher(self.hass, team_id)
+                continue
+            self._record_results(team_id)
+            restored = True
+
+        if not restored:
+            return False
+        self._apply_group_schedule(dt_util.utcnow())
+        self._schedule_stale_check()
+        self.async_set_updated_data(self._group_data())
+        return True
+
+    def async_release(self):
+        """Release shared resources held by this coordinator."""
+        self._release_live()
+        for team in self._teams.values():
+            team.release()
+
+    def _group_data(self):
+        """Return the team id -> payload mapping of the teams with data."""
+        return {team_id: team.data for team_id, team in self._teams.items() if team.data is not None}
+
+    def _apply_group_schedule(self, now):
+        """Poll at the pace of the most urgent team."""
+        scheduled = [
+            (team.phase, self._team_interval(team_id, team.phase, team.interval, now))
+            for team_id, team in self._teams.items()
+        ]
+        scheduled = [(phase, interval) for phase, interval in scheduled if interval is not None]
+        if not scheduled:
+            return
+        self._apply_schedule(*min(scheduled, key=lambda item: item[1]))
+
+    async def _async_fetch_teams(self):
+        """Fetch every team of the group with a bounded request fan-out."""
+        now = dt_util.utcnow()
+        semaphore = asyncio.Semaphore(GROUP_FAN_OUT)
+
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+
+        teams = list(self._teams.values())
+        overviews = await asyncio.gather(
+            *(bounded(team.async_fetch_overview(self.options)) for team in teams),
+            return_exceptions=True,
+        )
+        fetched = [(team, overview) for team, overview in zip(teams, overviews) if isinstance(overview, dict)]
+        for team, overview in zip(teams, overviews):
+            if isinstance(overview, Exception):
+                _LOGGER.warning("%s: keeping last data of team %s: %s", self.name, team.team_id, overview)
+        if not fetched:
+            raise UpdateFailed("Failed to fetch primary team data from FotMob for every team of the group")
+
+        # One request per league for the whole group; the per-team fetches
+        # below then hit the shared league cache
+        league_ids = {team.due_league(overview, now) for team, overview in fetched} - {None}
+        league_cache = get_league_cache(self.hass)
+        await asyncio.gather(*(bounded(league_cache.async_get(league_id)) for league_id in league_ids))
+
+        results = await asyncio.gather(
+            *(bounded(team.async_fetch_secondary(overview, now)) for team, overview in fetched),
+            return_exceptions=True,
+        )
+        for (team, _), result in zip(fetched, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("%s: keeping last data of team %s: %s", self.name, team.team_id, result)
+                continue
+            self._record_results(team.team_id)
+            if (store := self._stores.get(team.team_id)) is not None:
+                store.async_schedule_save(result, now, team.tier_times)
+
+        self._apply_group_schedule(now)
+        data = self._group_data()
+        if self.data is not None and data == self.data:
+            return self.data
+        return data
@@ -0,0 +1,43 @@
+"""Diagnostics support for FotMob Fixtures."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .api import get_api_client
+from .league import get_leagues
+from .metrics import get_metrics
+from .const import DOMAIN, DATA_LOGO_CACHE, CONF_KEEP_RAW_PAYLOAD
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    diagnostics = {
+        "team_ids": coordinator.team_ids,
+        "options": dict(entry.options),
+        "phase": coordinator.phase,
+        "update_interval": str(coordinator.update_interval),
+        "live_matches": {
+            team_id: coordinator.live_coordinator(team_id).match_id for team_id in coordinator.team_ids
+        },
+        # Integration-wide: 304 answers are hits, full downloads are misses
+        "http_cache": dict(get_api_client(hass).stats),
+        "circuit_breaker": get_api_client(hass).breaker.as_dict(),
+        # Integration-wide: league coordinators, their teams and providing entry
+        "leagues": get_leagues(hass).as_dict(),
+        "logo_cache": hass.data[DOMAIN][DATA_LOGO_CACHE].as_dict(),
+        "last_refresh_duration": coordinator.last_refresh_duration,
+        # Integration-wide histograms: requests per URL type, sensor writes
+        # per sensor key, refreshes per coordinator
+        "metrics": get_metrics(hass).as_dict(),
+    }
+    if entry.options.get(CONF_KEEP_RAW_PAYLOAD):
+        diagnostics["raw_payloads"] = {
+            team_id: coordinator.team_raw_payload(team_id) for team_id in coordinator.team_ids
+        }
+    return diagnostics
@@ -0,0 +1,164 @@
+"""Home Assistant bus events derived from successive match states."""
+import logging
+
+from homeassistant.core import callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_KICKOFF = f"{DOMAIN}_kickoff"
+EVENT_GOAL = f"{DOMAIN}_goal"
+EVENT_FULL_TIME = f"{DOMAIN}_full_time"
+EVENT_LINEUP_PUBLISHED = f"{DOMAIN}_lineup_published"
+EVENT_TABLE_POSITION_CHANGED = f"{DOMAIN}_table_position_changed"
+
+# Matches whose fired events are remembered for de-duplication
+FIRED_MATCHES_KEPT = 4
+
+
+def parse_score(score_str):
+    """Return (home, away) goals of a "1 - 0" score string, or None."""
+    try:
+        home, away = (int(part) for part in str(score_str).split('-'))
+    except (TypeError, ValueError):
+        return None
+    return home, away
+
+
+def _fixture_info(fixture):
+    """Return the match fields shared by every event of a fixture."""
+    status = fixture.get('status', {})
+    return {
+        "match_id": str(fixture.get('id')),
+        "home": fixture.get('home', {}).get('name'),
+        "away": fixture.get('away', {}).get('name'),
+        "league": fixture.get('league', {}).get('name') or fixture.get('tournament', {}).get('name'),
+        "score": status.get('scoreStr'),
+    }
+
+
+def _live_info(live):
+    """Return the match fields shared by every event of a match details payload."""
+    return {
+        "match_id": live.get('match_id'),
+        "home": live.get('home', {}).get('name'),
+        "away": live.get('away', {}).get('name'),
+        "league": live.get('league'),
+        "score": live.get('score'),
+    }
+
+
+def _goals(live):
+    """Return the goal events of a match details payload."""
+    return [event for event in live.get('events', []) if event.get('type') == "goal"]
+
+
+def diff_snapshots(previous, current):
+    """Yield (event type, data, dedupe key) between two team snapshots."""
+    prev_fix = previous.active_fixture
+    cur_fix = current.active_fixture
+    prev_id = str(prev_fix.get('id')) if prev_fix else None
+    cur_id = str(cur_fix.get('id')) if cur_fix else None
+
+    if cur_fix and cur_id != prev_id:
+        yield EVENT_KICKOFF, _fixture_info(cur_fix), (cur_id, "kickoff")
+
+    if prev_fix and cur_id != prev_id:
+        fixtures = current.data.get('fixtures', {}).get('allFixtures', {}).get('fixtures', [])
+        ended = next((fix for fix in fixtures if str(fix.get('id')) == prev_id), None)
+        if ended and ended.get('status', {}).get('finished'):
+            yield EVENT_FULL_TIME, _fixture_info(ended), (prev_id, "full_time")
+
+    if prev_fix and cur_fix and cur_id == prev_id:
+        before = parse_score(prev_fix.get('status', {}).get('scoreStr'))
+        after = parse_score(cur_fix.get('status', {}).get('scoreStr'))
+        # Disallowed goals lower the score; only increases are goals
+        if before and after and sum(after) > sum(before):
+            data = _fixture_info(cur_fix)
+            data["side"] = "home" if after[0] > before[0] else "away"
+            yield EVENT_GOAL, data, (cur_id, "goal", data["score"])
+
+    prev_entry = previous.table_index.lookup(previous.team_id)
+    cur_entry = current.table_index.lookup(current.team_id)
+    if prev_entry and cur_entry:
+        old, new = prev_entry.row.get('idx'), cur_entry.row.get('idx')
+        if isinstance(old, int) and isinstance(new, int) and old != new:
+            yield EVENT_TABLE_POSITION_CHANGED, {
+                "league": cur_entry.league_name,
+                "old_position": old,
+                "new_position": new,
+                "points": cur_entry.row.get('pts'),
+                "played": cur_entry.row.get('played'),
+            }, None
+
+
+def diff_live(previous, current):
+    """Yield (event type, data, dedupe key) between two match details payloads."""
+    match_id = current.get('match_id')
+    if not previous or previous.get('match_id') != match_id:
+        # First sight of a match is the baseline, e.g. after a restart
+        return
+    info = _live_info(current)
+
+    if current.get('lineups') and not previous.get('lineups'):
+        yield EVENT_LINEUP_PUBLISHED, {**info, "lineups": current['lineups']}, (match_id, "lineup")
+
+    if current.get('started') and not previous.get('started'):
+        yield EVENT_KICKOFF, info, (match_id, "kickoff")
+
+    for goal in _goals(current)[len(_goals(previous)):]:
+        data = {**info, **{key: value for key, value in goal.items() if key != "type"}}
+        data["score"] = goal.get('score', info["score"])
+        yield EVENT_GOAL, data, (match_id, "goal", data["score"])
+
+    if current.get('finished') and not previous.get('finished'):
+        yield EVENT_FULL_TIME, info, (match_id, "full_time")
+
+
+class FotMobMatchEvents:
+    """Fire bus events for the changes between successive states of a team.
+
+    Both the team snapshot and the live match details feed the diff; an
+    event seen by both (e.g. a goal in the overview score and the match
+    facts) is fired once. The first state seen is only a baseline.
+    """
+
+    def __init__(self, hass, team_id):
+        """Initialize the event source."""
+        self.hass = hass
+        self.team_id = str(team_id)
+        self.team_name = None
+        self._snapshot = None
+        self._live = None
+        self._fired = {}  # match id -> dedupe keys already fired
+
+    @callback
+    def async_process_snapshot(self, snapshot, team_name):
+        """Diff a new team snapshot against the previous one."""
+        self.team_name = team_name
+        previous, self._snapshot = self._snapshot, snapshot
+        if previous is None or previous is snapshot or not previous.data:
+            return
+        self._fire(diff_snapshots(previous, snapshot))
+
+    @callback
+    def async_process_live(self, live):
+        """Diff new match details against the previous ones."""
+        previous, self._live = self._live, live
+        if not live or previous is live:
+            return
+        self._fire(diff_live(previous, live))
+
+    def _fire(self, events):
+        """Fire the events not fired yet."""
+        for event_type, data, key in events:
+            if key is not None:
+                fired = self._fired.setdefault(key[0], set())
+                if key in fired:
+                    continue
+                fired.add(key)
+                while len(self._fired) > FIRED_MATCHES_KEPT:
+                    del self._fired[next(iter(self._fired))]
+            _LOGGER.debug("Team %s: firing %s", self.team_id, event_type)
+            self.hass.bus.async_fire(event_type, {"team_id": self.team_id, "team_name": self.team_name, **data})
@@ -0,0 +1,159 @@
+"""League-scoped standings, owned once for every team playing in a league."""
+import logging
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN, DATA_LEAGUES
+from .search import get_search_index
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sent with the league id once no tracked team plays in the league anymore
+SIGNAL_LEAGUE_REMOVED = f"{DOMAIN}_league_removed_{{}}"
+
+
+class FotMobLeagueCoordinator(DataUpdateCoordinator):
+    """Standings, form and next opponents of one league.
+
+    It does not poll: the refreshes of the teams playing in the league
+    publish the tables they fetched, and listeners are only notified when
+    the content version of a section changed. ``data`` is the TableIndex
+    of the last published tables, shared by reference with every team.
+    """
+
+    def __init__(self, hass, league_id):
+        """Initialize the coordinator."""
+        self.league_id = league_id
+        self.version = None
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"FotMob League {league_id}",
+            update_interval=None,
+            always_update=False,
+        )
+
+    async def _async_update_data(self):
+        """Keep the published standings; the team refreshes fetch them."""
+        return self.data
+
+    @callback
+    def async_publish(self, index):
+        """Take the tables of a team refresh when their content changed."""
+        if not index.sections:
+            return
+        version = tuple(section.version for section in index.sections)
+        if version == self.version:
+            return
+        self.version = version
+        self.async_set_updated_data(index)
+        get_search_index(self.hass).ingest_standings(self.league_id, self.league_name, index)
+
+    def lookup(self, team_id):
+        """Return the TableEntry of a team, or None."""
+        return self.data.lookup(team_id) if self.data is not None else None
+
+    @property
+    def league_name(self):
+        """Return the name of the league, not of a composite sub-table."""
+        if self.data is None or not self.data.sections:
+            return None
+        section = self.data.sections[0]
+        data = section.container.get('data', section.container)
+        return data.get('leagueName') or section.league_name
+
+
+class FotMobLeagues:
+    """Hass-wide registry of league coordinators, refcounted by team.
+
+    Each league's entities are provided by exactly one config entry: the
+    first entry whose sensor platform is loaded. When that entry unloads,
+    the leagues still in use are handed to another loaded entry.
+    """
+
+    def __init__(self, hass):
+        """Initialize the registry."""
+        self.hass = hass
+        self._coordinators = {}  # league_id -> FotMobLeagueCoordinator
+        self._refs = {}  # league_id -> set of owners
+        self._owners = {}  # owner -> league_id
+        self._providers = {}  # entry_id -> callback adding a league's entities
+        self._claims = {}  # league_id -> entry_id providing its entities
+
+    def get(self, league_id):
+        """Return the coordinator of a league, or None."""
+        return self._coordinators.get(str(league_id))
+
+    def acquire(self, owner, league_id):
+        """Record that owner plays in league_id and return its coordinator."""
+        league_id = str(league_id)
+        if self._owners.get(owner) != league_id:
+            self.release(owner)
+            self._owners[owner] = league_id
+            self._refs.setdefault(league_id, set()).add(owner)
+        coordinator = self._coordinators.get(league_id)
+        if coordinator is None:
+            coordinator = self._coordinators[league_id] = FotMobLeagueCoordinator(self.hass, league_id)
+            self._assign(league_id)
+        return coordinator
+
+    def release(self, owner):
+        """Drop owner's reference and remove the league when unused."""
+        league_id = self._owners.pop(owner, None)
+        if league_id is None:
+            return
+        refs = self._refs.get(league_id, set())
+        refs.discard(owner)
+        if refs:
+            return
+        self._refs.pop(league_id, None)
+        self._coordinators.pop(league_id, None)
+        if self._claims.pop(league_id, None) is not None:
+            async_dispatcher_send(self.hass, SIGNAL_LEAGUE_REMOVED.format(league_id))
+
+    @callback
+    def async_add_provider(self, entry_id, add_league):
+        """Let an entry provide league entities; returns a removal callable."""
+        self._providers[entry_id] = add_league
+        for league_id in list(self._coordinators):
+            self._assign(league_id)
+
+        @callback
+        def remove():
+            self._providers.pop(entry_id, None)
+            for league_id, claimed_by in list(self._claims.items()):
+                if claimed_by == entry_id:
+                    del self._claims[league_id]
+                    self._assign(league_id)
+
+        return remove
+
+    def _assign(self, league_id):
+        """Give an unclaimed league to a provider, if any is loaded."""
+        if league_id in self._claims or not self._providers:
+            return
+        entry_id, add_league = next(iter(self._providers.items()))
+        self._claims[league_id] = entry_id
+        add_league(self._coordinators[league_id])
+
+    def as_dict(self):
+        """Return the registry state for diagnostics."""
+        return {
+            league_id: {
+                "teams": sorted(str(getattr(owner, "team_id", owner)) for owner in self._refs.get(league_id, ())),
+                "provided_by": self._claims.get(league_id),
+                "published": coordinator.data is not None,
+            }
+            for league_id, coordinator in self._coordinators.items()
+        }
+
+
+def get_leagues(hass):
+    """Return the league registry shared by every config entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    leagues = domain_data.get(DATA_LEAGUES)
+    if leagues is None:
+        leagues = domain_data[DATA_LEAGUES] = FotMobLeagues(hass)
+    return leagues
@@ -0,0 +1,129 @@
+"""Fast polling of the match details of a team's live fixture."""
+import logging
+from datetime import timedelta
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .api import MATCH_URL, get_api_client
+from .const import CONF_MATCH_DETAILS_INTERVAL, DEFAULT_MATCH_DETAILS_INTERVAL
+from .projection import project_match_details
+from .ratelimit import PRIORITY_LIVE
+from .scheduler import KICKOFF_GRACE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lineups are published about an hour before kickoff; the match is polled
+# at a slow pace from then on so their publication is noticed
+LINEUP_WINDOW = timedelta(minutes=75)
+LINEUP_POLL_INTERVAL = timedelta(minutes=3)
+
+
+def live_fixture(snapshot, now):
+    """Return the fixture of a team that is live or about to kick off."""
+    if snapshot is None:
+        return None
+    if snapshot.active_fixture:
+        return snapshot.active_fixture
+    fixture = snapshot.next_fixture
+    if fixture:
+        status = fixture.get('status', {})
+        kickoff = dt_util.parse_datetime(status.get('utcTime') or '')
+        if (
+            kickoff is not None
+            and not status.get('cancelled')
+            and kickoff - LINEUP_WINDOW <= now <= kickoff + KICKOFF_GRACE
+        ):
+            return fixture
+    return None
+
+
+class FotMobLiveMatchCoordinator(DataUpdateCoordinator):
+    """Poll the match details endpoint while a fixture of a team is live.
+
+    The coordinator is idle (no update interval) until ``async_track``
+    sees a live fixture in the team payload, and stops polling by itself
+    at full time. ``data`` keeps the last match state, so the final score
+    and events stay visible until the next match. Before kickoff the
+    match is polled at ``LINEUP_POLL_INTERVAL`` to catch the lineups.
+    """
+
+    def __init__(self, hass, team_id, options, on_finished):
+        """Initialize the coordinator."""
+        self.team_id = str(team_id)
+        self.options = options
+        self.match_id = None
+        # The overview can lag behind the match details at full time
+        self._finished_match_id = None
+        self._on_finished = on_finished
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"FotMob Live {team_id}",
+            update_interval=None,
+            always_update=False,
+        )
+
+    @property
+    def tracking(self):
+        """Return True while a match is being polled."""
+        return self.match_id is not None
+
+    @callback
+    def async_track(self, snapshot, now):
+        """Start or stop polling from a fresh team snapshot.
+
+        Returns True while a match is being polled.
+        """
+        fixture = live_fixture(snapshot, now)
+        match_id = str(fixture['id']) if fixture and fixture.get('id') is not None else None
+        if match_id == self._finished_match_id:
+            match_id = None
+        if match_id == self.match_id:
+            return self.tracking
+        if match_id is None:
+            _LOGGER.debug("%s: match %s no longer live", self.name, self.match_id)
+            self.async_stop()
+            return False
+
+        _LOGGER.debug("%s: polling match %s", self.name, match_id)
+        self.match_id = match_id
+        self.update_interval = self._poll_interval(fixture.get('status', {}).get('started'))
+        self.hass.async_create_task(self.async_refresh())
+        return True
+
+    def _poll_interval(self, started):
+        """Return the fast cadence once the match started, else the lineup one."""
+        if not started:
+            return LINEUP_POLL_INTERVAL
+        return timedelta(seconds=self.options.get(CONF_MATCH_DETAILS_INTERVAL, DEFAULT_MATCH_DETAILS_INTERVAL))
+
+    @callback
+    def async_stop(self):
+        """Stop polling, keeping the last match state."""
+        self.match_id = None
+        self.update_interval = None
+        self._unschedule_refresh()
+
+    async def _async_update_data(self):
+        """Fetch the match details of the tracked match."""
+        match_id = self.match_id
+        if match_id is None:
+            return self.data
+        # A fast cadence needs no retries; the next poll is the retry
+        match = await get_api_client(self.hass).async_get_json(
+            MATCH_URL.format(match_id), retries=1, priority=PRIORITY_LIVE, transform=project_match_details
+        )
+        if not match:
+            raise UpdateFailed(f"Failed to fetch match {match_id} from FotMob")
+
+        if match.get('finished') or match.get('cancelled'):
+            _LOGGER.debug("%s: match %s is over", self.name, match_id)
+            self.async_stop()
+            self._finished_match_id = match_id
+            # Pick up the final result in the team overview right away
+            self.hass.async_create_task(self._on_finished())
+        else:
+            self.update_interval = self._poll_interval(match.get('started'))
+        return match
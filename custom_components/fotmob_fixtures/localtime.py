@@ -0,0 +1,62 @@
+"""Conversion of FotMob UTC times to local display strings."""
+from functools import lru_cache
+
+from homeassistant.util import dt as dt_util
+
+# Distinct kickoff times kept formatted; a few leagues' worth of fixtures
+LOCALIZE_CACHE_SIZE = 1024
+
+_cached_time_zone = None
+
+
+@lru_cache(maxsize=LOCALIZE_CACHE_SIZE)
+def _format_local(utc_time_str, time_zone):
+    """Format a UTC ISO string in time_zone as DD/MM/YYYY HH:MM TZ."""
+    utc_dt = dt_util.parse_datetime(utc_time_str)
+    if utc_dt is None:
+        return "N/A"
+    if utc_dt.tzinfo is None:
+        utc_dt = utc_dt.replace(tzinfo=dt_util.UTC)
+    local_dt = utc_dt.astimezone(time_zone)
+    # Prefer the abbreviation, else a GMT offset like the old "%z" slice
+    tz_name = local_dt.tzname()
+    if not tz_name or tz_name.startswith(("+", "-")):
+        offset = int(local_dt.utcoffset().total_seconds())
+        tz_name = f"GMT{'-' if offset < 0 else '+'}{abs(offset) // 3600:02d}"
+    return f"{local_dt:%d/%m/%Y %H:%M} {tz_name}"
+
+
+def _current_time_zone():
+    """Return Home Assistant's time zone, dropping the cache when it changed."""
+    global _cached_time_zone
+    time_zone = dt_util.DEFAULT_TIME_ZONE
+    if time_zone is not _cached_time_zone:
+        _format_local.cache_clear()
+        _cached_time_zone = time_zone
+    return time_zone
+
+
+def _localize(value, time_zone):
+    """Localize one value with a resolved time zone."""
+    if not value:
+        return "N/A"
+    if isinstance(value, list) and len(value) > 1:
+        # Handle list format from nextOpponent [team_id, name, time_str]
+        value = value[1]
+    if not isinstance(value, str):
+        return "N/A"
+    try:
+        return _format_local(value, time_zone)
+    except (TypeError, ValueError, OverflowError):
+        return "N/A"
+
+
+def localize_time(utc_time_str):
+    """Convert UTC ISO string to local time DD/MM/YYYY HH:MM."""
+    return _localize(utc_time_str, _current_time_zone())
+
+
+def localize_times(utc_time_strs):
+    """Convert several UTC ISO strings in one pass, in order."""
+    time_zone = _current_time_zone()
+    return [_localize(value, time_zone) for value in utc_time_strs]
@@ -0,0 +1,237 @@
+"""Team logos cached on disk and served by Home Assistant."""
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from http import HTTPStatus
+
+import aiohttp
+import async_timeout
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import REQUEST_TIMEOUT, get_api_client
+from .const import DOMAIN, DATA_LOGO_CACHE
+from .ratelimit import PRIORITY_BACKGROUND
+
+_LOGGER = logging.getLogger(__name__)
+
+LOGO_URL = "https://images.fotmob.com/image_resources/logo/teamlogo/{}.png"
+LOCAL_LOGO_URL = f"/api/{DOMAIN}/logo/{{}}"
+
+LOGO_TTL = 30 * 24 * 3600  # seconds before a cached logo is downloaded again
+LOGO_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Eviction removes the least recently served logos down to this fraction
+LOGO_CACHE_LOW_WATER = 0.8
+# Browsers may reuse a served logo without asking again
+LOGO_MAX_AGE = 24 * 3600  # seconds
+
+
+def logo_url(team_id):
+    """Return the local URL of a team logo."""
+    return LOCAL_LOGO_URL.format(team_id)
+
+
+class FotMobLogoCache:
+    """Team logos downloaded once and kept on disk.
+
+    A logo is fetched again after ``ttl`` seconds; until then, and
+    whenever FotMob cannot be reached, the file on disk is served. The
+    directory is kept under ``max_bytes`` by removing the logos served
+    least recently. Concurrent requests for a logo share one download.
+    Only the teams the integration links logos of are served: tracked
+    teams, their opponents and the teams of their league tables.
+    """
+
+    def __init__(self, hass, path, ttl=LOGO_TTL, max_bytes=LOGO_CACHE_MAX_BYTES):
+        """Initialize the cache."""
+        self.hass = hass
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._files = None  # team id -> [size, fetched (epoch), last served (monotonic)]
+        self._inflight = {}  # team id -> asyncio.Task
+        self._allowed = {}  # owner (a team fetcher) -> team ids whose logo it links
+        self._refs = Counter()  # team id -> number of owners linking its logo
+        self.stats = {"hits": 0, "downloads": 0, "errors": 0, "evicted": 0}
+
+    def allow(self, owner, team_ids):
+        """Let the view serve the logos of these teams, replacing owner's previous ones."""
+        team_ids = frozenset(str(team_id) for team_id in team_ids if team_id is not None)
+        previous = self._allowed.get(owner, frozenset())
+        if team_ids == previous:
+            return
+        self._refs.update(team_ids - previous)
+        for team_id in previous - team_ids:
+            self._refs[team_id] -= 1
+            if self._refs[team_id] <= 0:
+                del self._refs[team_id]
+        self._allowed[owner] = team_ids
+
+    def release(self, owner):
+        """Stop serving the logos only owner linked."""
+        self.allow(owner, ())
+        self._allowed.pop(owner, None)
+
+    def is_allowed(self, team_id):
+        """Return True when the integration links the logo of this team."""
+        return str(team_id) in self._refs
+
+    def _file(self, team_id):
+        """Return the path of a team's logo file."""
+        return os.path.join(self.path, f"{team_id}.png")
+
+    def _scan(self):
+        """Create the directory and index the logos already on disk."""
+        os.makedirs(self.path, exist_ok=True)
+        files = {}
+        now = time.monotonic()
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                team_id, ext = os.path.splitext(entry.name)
+                if ext == ".png" and team_id.isdigit():
+                    stat = entry.stat()
+                    files[team_id] = [stat.st_size, stat.st_mtime, now]
+        return files
+
+    async def async_get(self, team_id):
+        """Return the path of a team's logo, or None when there is none."""
+        team_id = str(team_id)
+        if self._files is None:
+            self._files = await self.hass.async_add_executor_job(self._scan)
+
+        cached = self._files.get(team_id)
+        if cached is not None:
+            cached[2] = time.monotonic()
+            if time.time() - cached[1] < self.ttl:
+                self.stats["hits"] += 1
+                return self._file(team_id)
+
+        task = self._inflight.get(team_id)
+        if task is None:
+            task = self.hass.async_create_task(self._async_download(team_id))
+            self._inflight[team_id] = task
+        # Shield so one closed client connection does not abort the download
+        if await asyncio.shield(task):
+            return self._file(team_id)
+        # Keep serving an expired logo rather than none
+        return self._file(team_id) if team_id in self._files else None
+
+    async def _async_download(self, team_id):
+        """Download a logo to disk; returns True on success."""
+        try:
+            body = await self._async_fetch(team_id)
+        finally:
+            self._inflight.pop(team_id, None)
+        if body is None:
+            self.stats["errors"] += 1
+            return False
+
+        await self.hass.async_add_executor_job(self._write, team_id, body)
+        self._files[team_id] = [len(body), time.time(), time.monotonic()]
+        self.stats["downloads"] += 1
+        await self._async_evict()
+        return True
+
+    async def _async_fetch(self, team_id):
+        """Return the logo body, or None."""
+        session = async_get_clientsession(self.hass)
+        try:
+            # Logo downloads count against the shared FotMob request budget
+            async with get_api_client(self.hass).scheduler.slot(PRIORITY_BACKGROUND):
+                async with async_timeout.timeout(REQUEST_TIMEOUT):
+                    async with session.get(LOGO_URL.format(team_id)) as response:
+                        if response.status != HTTPStatus.OK:
+                            _LOGGER.debug("Logo of team %s: HTTP %s", team_id, response.status)
+                            return None
+                        return await response.read()
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.debug("Logo of team %s: %s", team_id, err)
+            return None
+
+    def _write(self, team_id, body):
+        """Write a logo atomically."""
+        os.makedirs(self.path, exist_ok=True)
+        tmp = f"{self._file(team_id)}.tmp"
+        with open(tmp, "wb") as file:
+            file.write(body)
+        os.replace(tmp, self._file(team_id))
+
+    def _remove(self, team_ids):
+        """Delete logo files."""
+        for team_id in team_ids:
+            try:
+                os.remove(self._file(team_id))
+            except FileNotFoundError:
+                pass
+
+    async def _async_evict(self):
+        """Remove the least recently served logos when over the size bound."""
+        total = sum(size for size, _, _ in self._files.values())
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for team_id, (size, _, _) in sorted(self._files.items(), key=lambda item: item[1][2]):
+            if total <= self.max_bytes * LOGO_CACHE_LOW_WATER:
+                break
+            evicted.append(team_id)
+            total -= size
+        for team_id in evicted:
+            del self._files[team_id]
+        self.stats["evicted"] += len(evicted)
+        await self.hass.async_add_executor_job(self._remove, evicted)
+
+    def as_dict(self):
+        """Return the cache state for diagnostics."""
+        files = self._files or {}
+        return {
+            "logos": len(files),
+            "allowed": len(self._refs),
+            "bytes": sum(size for size, _, _ in files.values()),
+            **self.stats,
+        }
+
+
+class FotMobLogoView(HomeAssistantView):
+    """Serve cached team logos at /api/fotmob_fixtures/logo/<team id>.
+
+    Logos are public images, so no authentication is required; this lets
+    dashboards use the URL in plain image tags. Teams the integration does
+    not link are answered with 404, so the view cannot be used to make
+    Home Assistant download arbitrary ids.
+    """
+
+    url = f"/api/{DOMAIN}/logo/{{team_id}}"
+    name = f"api:{DOMAIN}:logo"
+    requires_auth = False
+
+    def __init__(self, cache):
+        """Initialize the view."""
+        self.cache = cache
+
+    async def get(self, request, team_id):
+        """Return the logo, or redirect to FotMob when it is not cached."""
+        if not team_id.isdigit() or not self.cache.is_allowed(team_id):
+            raise web.HTTPNotFound()
+        path = await self.cache.async_get(team_id)
+        if path is None:
+            raise web.HTTPFound(LOGO_URL.format(team_id))
+        return web.FileResponse(path, headers={"Cache-Control": f"public, max-age={LOGO_MAX_AGE}"})
+
+
+def get_logo_cache(hass):
+    """Return the logo cache, or None before it was set up."""
+    return hass.data.get(DOMAIN, {}).get(DATA_LOGO_CACHE)
+
+
+def async_setup_logos(hass):
+    """Create the logo cache and register its view, once for every entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_LOGO_CACHE in domain_data:
+        return domain_data[DATA_LOGO_CACHE]
+    cache = domain_data[DATA_LOGO_CACHE] = FotMobLogoCache(hass, hass.config.path(".storage", f"{DOMAIN}_logos"))
+    hass.http.register_view(FotMobLogoView(cache))
+    return cache
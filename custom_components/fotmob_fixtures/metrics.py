@@ -0,0 +1,176 @@
+"""Integration-wide request, decode and render instrumentation."""
+from bisect import bisect_left
+
+from .const import DOMAIN, DATA_METRICS
+
+# Upper bounds of the histogram buckets; the last bucket is unbounded
+SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+COUNT_BUCKETS = (0, 1, 2, 3, 5)
+
+
+def url_type(url):
+    """Classify a FotMob URL by the resource it fetches."""
+    if "matchDetails" in url:
+        return "match"
+    if "/leagues" in url:
+        return "league"
+    if "tab=transfers" in url:
+        return "transfers"
+    if "tab=history" in url:
+        return "history"
+    if "/teams" in url:
+        return "team"
+    return "other"
+
+
+class Histogram:
+    """Bucketed distribution of observed values, with count, sum and extremes."""
+
+    __slots__ = ("bounds", "buckets", "count", "total", "min", "max")
+
+    def __init__(self, bounds):
+        """Initialize an empty histogram."""
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        """Add a value."""
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q):
+        """Return the upper bound of the bucket holding the q-quantile."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self, scale=1, buckets=True):
+        """Return a summary, with values multiplied by scale (e.g. s to ms)."""
+        def scaled(value):
+            return round(value * scale, 3) if value is not None else None
+
+        summary = {
+            "count": self.count,
+            "mean": scaled(self.total / self.count) if self.count else None,
+            "min": scaled(self.min),
+            "p50": scaled(self.quantile(0.5)),
+            "p95": scaled(self.quantile(0.95)),
+            "max": scaled(self.max),
+        }
+        if buckets:
+            summary["buckets"] = {
+                f"le_{scaled(bound)}": count for bound, count in zip(self.bounds, self.buckets)
+            } | {"le_inf": self.buckets[-1]}
+        return summary
+
+
+class EndpointMetrics:
+    """Request figures of one URL type."""
+
+    __slots__ = ("latency", "queue_wait", "size", "decode", "retries", "rate_limited", "not_modified", "errors")
+
+    def __init__(self):
+        """Initialize empty figures."""
+        self.latency = Histogram(SECONDS_BUCKETS)
+        self.queue_wait = Histogram(SECONDS_BUCKETS)
+        self.size = Histogram(BYTES_BUCKETS)
+        self.decode = Histogram(SECONDS_BUCKETS)
+        self.retries = Histogram(COUNT_BUCKETS)
+        self.rate_limited = 0
+        self.not_modified = 0
+        self.errors = 0
+
+    def as_dict(self):
+        """Return the figures, times in milliseconds."""
+        return {
+            "latency_ms": self.latency.as_dict(1000),
+            "queue_wait_ms": self.queue_wait.as_dict(1000),
+            "size_bytes": self.size.as_dict(),
+            "decode_ms": self.decode.as_dict(1000),
+            "retries": self.retries.as_dict(),
+            "rate_limited": self.rate_limited,
+            "not_modified": self.not_modified,
+            "errors": self.errors,
+        }
+
+
+class FotMobMetrics:
+    """Figures of every FotMob request and sensor state write.
+
+    Requests are grouped by URL type, sensor writes by sensor key, and
+    coordinator refreshes by coordinator name.
+    """
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self.endpoints = {}  # url type -> EndpointMetrics
+        self.render = {}  # sensor key -> Histogram (seconds)
+        self.refresh = {}  # coordinator name -> Histogram (seconds)
+
+    def endpoint(self, url):
+        """Return the figures of the URL type of url."""
+        kind = url_type(url)
+        metrics = self.endpoints.get(kind)
+        if metrics is None:
+            metrics = self.endpoints[kind] = EndpointMetrics()
+        return metrics
+
+    def observe_render(self, key, seconds):
+        """Record the time taken to write a sensor state."""
+        histogram = self.render.get(key)
+        if histogram is None:
+            histogram = self.render[key] = Histogram(SECONDS_BUCKETS)
+        histogram.observe(seconds)
+
+    def observe_refresh(self, name, seconds):
+        """Record the duration of a coordinator refresh."""
+        histogram = self.refresh.get(name)
+        if histogram is None:
+            histogram = self.refresh[name] = Histogram(SECONDS_BUCKETS)
+        histogram.observe(seconds)
+
+    @staticmethod
+    def merged(histograms, bounds):
+        """Return one histogram combining several with the same bounds."""
+        merged = Histogram(bounds)
+        for histogram in histograms:
+            for i, count in enumerate(histogram.buckets):
+                merged.buckets[i] += count
+            merged.count += histogram.count
+            merged.total += histogram.total
+            for value in (histogram.min, histogram.max):
+                if value is not None:
+                    merged.min = value if merged.min is None else min(merged.min, value)
+                    merged.max = value if merged.max is None else max(merged.max, value)
+        return merged
+
+    def as_dict(self):
+        """Return every figure, times in milliseconds."""
+        return {
+            "endpoints": {kind: metrics.as_dict() for kind, metrics in self.endpoints.items()},
+            "render_ms": {key: histogram.as_dict(1000) for key, histogram in self.render.items()},
+            "refresh_ms": {name: histogram.as_dict(1000) for name, histogram in self.refresh.items()},
+        }
+
+
+def get_metrics(hass):
+    """Return the metrics shared by every config entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    metrics = domain_data.get(DATA_METRICS)
+    if metrics is None:
+        metrics = domain_data[DATA_METRICS] = FotMobMetrics()
+    return metrics
@@ -0,0 +1,252 @@
+"""Reduce raw FotMob payloads to the fields the sensors read."""
+
+FIXTURE_KEYS = ("id", "pageUrl", "home", "away", "status", "league", "tournament", "result", "notStarted")
+FIXTURE_TEAM_KEYS = ("id", "name", "shortName", "score")
+FIXTURE_STATUS_KEYS = ("utcTime", "started", "finished", "cancelled", "scoreStr", "reason", "liveTime")
+TABLE_DATA_KEYS = ("leagueName", "leagueId", "composite", "selectedSeason")
+TABLE_ROW_KEYS = (
+    "idx", "id", "name", "shortName", "played", "wins", "draws", "losses", "scoresStr",
+    "goalConDiff", "pts", "form", "next", "qualColor", "color", "deductionReason",
+)
+DETAILS_KEYS = ("id", "name", "shortName", "country", "stadium", "venue", "location")
+TOP_PLAYER_LISTS = ("byGoals", "byAssists", "byRating")
+TOP_PLAYERS_KEPT = 3
+TRANSFER_LISTS = ("Players in", "Players out", "Contract extensions")
+MATCH_TEAM_KEYS = ("id", "name", "score")
+# Match facts events worth a sensor attribute, by FotMob event type
+MATCH_EVENT_TYPES = ("Goal", "Card", "Substitution")
+
+
+def _pick(obj, keys):
+    """Return a dict with only the given keys of obj."""
+    if not isinstance(obj, dict):
+        return {}
+    return {key: obj[key] for key in keys if key in obj}
+
+
+def project_fixture(fixture):
+    """Keep the teams, status and competition of a fixture."""
+    projected = _pick(fixture, FIXTURE_KEYS)
+    for side in ("home", "away"):
+        if side in projected:
+            projected[side] = _pick(projected[side], FIXTURE_TEAM_KEYS)
+    if "status" in projected:
+        projected["status"] = _pick(projected["status"], FIXTURE_STATUS_KEYS)
+    return projected
+
+
+def project_fixtures(fixtures):
+    """Keep the fixture list only."""
+    items = fixtures.get('allFixtures', {}).get('fixtures', []) if isinstance(fixtures, dict) else []
+    return {"allFixtures": {"fixtures": [project_fixture(fix) for fix in items]}}
+
+
+def _project_table(table):
+    """Keep the 'all' rows (and merged next opponents) of a table."""
+    projected = {"all": [_pick(row, TABLE_ROW_KEYS) for row in table.get('all', [])]}
+    if 'nextOpponent' in table:
+        projected['nextOpponent'] = table['nextOpponent']
+    return projected
+
+
+def project_tables(tables):
+    """Keep the standings, form and next opponents of table containers."""
+    projected = []
+    for container in tables or []:
+        if not isinstance(container, dict):
+            continue
+        has_data = 'data' in container
+        data = container.get('data') if has_data else container
+        if not isinstance(data, dict):
+            continue
+        out = _pick(data, TABLE_DATA_KEYS)
+        if data.get('composite'):
+            out['tables'] = [
+                {"leagueName": sub.get('leagueName'), "table": _project_table(sub.get('table', {}))}
+                for sub in data.get('tables', [])
+            ]
+        else:
+            out['table'] = _project_table(data.get('table', {}))
+
+        item = {'data': out} if has_data else out
+        for key in ('teamForm', 'nextOpponent'):
+            if key in container:
+                item[key] = container[key]
+        projected.append(item)
+    return projected
+
+
+def _project_top_players(top_players):
+    """Keep the first players of each top list."""
+    if not isinstance(top_players, dict):
+        return {}
+    return {
+        name: {"players": top_players[name].get('players', [])[:TOP_PLAYERS_KEPT]}
+        for name in TOP_PLAYER_LISTS
+        if isinstance(top_players.get(name), dict)
+    }
+
+
+def project_details(details):
+    """Keep the name, venue and the capacity FAQ of the team details."""
+    if not isinstance(details, dict):
+        return {}
+    projected = _pick(details, DETAILS_KEYS)
+    location = details.get('sportsTeamJSONLD', {}).get('location')
+    if location:
+        projected['sportsTeamJSONLD'] = {"location": location}
+    faq = [
+        q for q in details.get('faqJSONLD', {}).get('mainEntity', [])
+        if 'capacity' in q.get('name', '').lower()
+    ]
+    if faq:
+        projected['faqJSONLD'] = {"mainEntity": faq}
+    return projected
+
+
+def project_overview(overview):
+    """Keep the top players and last lineup coach of the overview tab."""
+    if not isinstance(overview, dict):
+        return {}
+    projected = {}
+    if 'topPlayers' in overview:
+        projected['topPlayers'] = _project_top_players(overview['topPlayers'])
+    coach = overview.get('lastLineupStats', {}).get('coach')
+    if coach:
+        projected['lastLineupStats'] = {"coach": coach}
+    return projected
+
+
+def project_squad(squad):
+    """Keep the coach group of the squad."""
+    groups = squad.get('squad', []) if isinstance(squad, dict) else []
+    return {
+        "squad": [
+            group for group in groups
+            if isinstance(group, dict) and str(group.get('title', '')).lower() == "coach"
+        ]
+    }
+
+
+def project_transfers(transfers):
+    """Keep the transfer lists shown by the transfers sensor."""
+    data = transfers.get('data', {}) if isinstance(transfers, dict) else {}
+    return {"data": _pick(data, TRANSFER_LISTS)}
+
+
+def project_history(history):
+    """Keep the trophy list."""
+    return {"trophyList": history.get('trophyList', [])} if isinstance(history, dict) else {}
+
+
+def project_league_payload(league):
+    """Keep the standings of a league API payload."""
+    return {"table": project_tables(league.get('table', []))}
+
+
+def project_transfers_tab(payload):
+    """Project the response of the transfers tab."""
+    return {"transfers": project_transfers(payload.get("transfers", {}))}
+
+
+def project_history_tab(payload):
+    """Project the response of the history tab."""
+    return {"history": project_history(payload.get("history", {}))}
+
+
+def _project_match_event(event, home_id):
+    """Flatten a match facts event to type, minute, side and players."""
+    player = event.get('player') or {}
+    projected = {
+        "type": event.get('type', '').lower(),
+        "minute": event.get('timeStr', event.get('time')),
+        "side": "home" if event.get('isHome', str(event.get('teamId')) == home_id) else "away",
+        "player": player.get('name') or event.get('nameStr'),
+    }
+    if event.get('type') == "Goal":
+        projected["score"] = f"{event.get('homeScore', '?')} - {event.get('awayScore', '?')}"
+        projected["own_goal"] = bool(event.get('ownGoal'))
+        assist = event.get('assistInput') or event.get('assistStr')
+        if assist:
+            projected["assist"] = assist
+    elif event.get('type') == "Card":
+        projected["card"] = event.get('card')
+    elif event.get('type') == "Substitution":
+        projected["players"] = [p.get('name') for p in event.get('swap', []) if isinstance(p, dict)]
+    return projected
+
+
+def _project_match_stats(stats):
+    """Map each stat title to its [home, away] values."""
+    projected = {}
+    periods = stats.get('Periods', {}) if isinstance(stats, dict) else {}
+    for group in periods.get('All', {}).get('stats', []):
+        for stat in group.get('stats', []):
+            values = stat.get('stats')
+            title = stat.get('title')
+            if title and isinstance(values, list) and len(values) == 2 and title not in projected:
+                projected[title] = values
+    return projected
+
+
+def _project_lineup(lineup):
+    """Return the starting eleven names of each side, if published."""
+    if not isinstance(lineup, dict):
+        return None
+    sides = {}
+    for side, key in (("home", "homeTeam"), ("away", "awayTeam")):
+        starters = (lineup.get(key) or {}).get('starters') or []
+        names = [player.get('name') for player in starters if isinstance(player, dict)]
+        if names:
+            sides[side] = names
+    return sides or None
+
+
+def project_match_details(match):
+    """Reduce a match details payload to status, score, events and stats."""
+    if not isinstance(match, dict):
+        return {}
+    header = match.get('header', {})
+    status = header.get('status', {})
+    teams = [_pick(team, MATCH_TEAM_KEYS) for team in header.get('teams', [])[:2]]
+    if len(teams) < 2:
+        return {}
+    general = match.get('general', {})
+    content = match.get('content', {})
+    home_id = str(teams[0].get('id'))
+    events = content.get('matchFacts', {}).get('events', {}).get('events', [])
+    return {
+        "match_id": str(general.get('matchId', '')),
+        "league": general.get('leagueName'),
+        "started": bool(status.get('started')),
+        "finished": bool(status.get('finished')),
+        "cancelled": bool(status.get('cancelled')),
+        "minute": (status.get('liveTime') or {}).get('short'),
+        "reason": (status.get('reason') or {}).get('short'),
+        "score": status.get('scoreStr'),
+        "home": teams[0],
+        "away": teams[1],
+        "events": [
+            _project_match_event(event, home_id)
+            for event in events
+            if isinstance(event, dict) and event.get('type') in MATCH_EVENT_TYPES
+        ],
+        "stats": _project_match_stats(content.get('stats')),
+        "lineups": _project_lineup(content.get('lineup')),
+    }
+
+
+TEAM_PROJECTIONS = {
+    "details": project_details,
+    "fixtures": project_fixtures,
+    "table": project_tables,
+    "topPlayers": _project_top_players,
+    "overview": project_overview,
+    "coach": lambda coach: coach,
+    "squad": project_squad,
+}
+
+
+def project_team_overview(overview):
+    """Project the sections of a team overview the sensors read."""
+    return {key: project(overview[key]) for key, project in TEAM_PROJECTIONS.items() if key in overview}
@@ -0,0 +1,95 @@
+"""Integration-wide rate limiting of FotMob HTTP requests."""
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+
+from .const import DEFAULT_REQUESTS_PER_SECOND, DEFAULT_MAX_CONCURRENCY
+
+# Lower value is served first
+PRIORITY_INTERACTIVE = 0  # config flow, a user is waiting
+PRIORITY_LIVE = 1  # refreshes while a match is live
+PRIORITY_DEFAULT = 2  # regular team overview refreshes
+PRIORITY_BACKGROUND = 3  # transfers/history tabs and league tables
+
+
+class FotMobRequestScheduler:
+    """Token bucket with bounded concurrency and priority ordering.
+
+    Every request waits for a slot: a token (refilled at ``rate`` per
+    second, up to a burst of ``max_concurrency``) and a free concurrency
+    slot. Waiters are served by priority, then in arrival order.
+    """
+
+    def __init__(self, rate=DEFAULT_REQUESTS_PER_SECOND, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        """Initialize the scheduler."""
+        self.rate = rate
+        self.max_concurrency = max_concurrency
+        self._tokens = float(max_concurrency)
+        self._updated = time.monotonic()
+        self._active = 0
+        self._waiters = []  # heap of (priority, seq, future)
+        self._seq = itertools.count()
+        self._timer = None
+
+    def configure(self, rate, max_concurrency):
+        """Apply new limits; waiting requests pick them up immediately."""
+        self._refill()
+        self.rate = rate
+        self.max_concurrency = max_concurrency
+        self._tokens = min(self._tokens, float(max_concurrency))
+        self._dispatch()
+
+    @property
+    def queued(self):
+        """Return the number of requests waiting for a slot."""
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    @asynccontextmanager
+    async def slot(self, priority=PRIORITY_DEFAULT):
+        """Hold a request slot for the duration of the block."""
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut))
+        self._dispatch()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Granted just as we were cancelled: hand the slot back
+                self._release()
+            raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _refill(self):
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(float(self.max_concurrency), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _release(self):
+        """Free a concurrency slot and wake the next waiter."""
+        self._active -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        """Grant slots to waiters while tokens and concurrency allow."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._refill()
+        while self._waiters and self._active < self.max_concurrency:
+            if self._waiters[0][2].done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                self._timer = asyncio.get_running_loop().call_later(wait, self._dispatch)
+                return
+            _, _, fut = heapq.heappop(self._waiters)
+            self._tokens -= 1
+            self._active += 1
+            fut.set_result(None)
@@ -0,0 +1,135 @@
+"""Retry back-off and the integration-wide circuit breaker."""
+import itertools
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+BACKOFF_BASE = 2  # seconds before the first retry, doubled per attempt
+BACKOFF_CAP = 60  # seconds
+# Retries that would sleep longer than this give up instead, so an update
+# never stalls on a long Retry-After; the breaker keeps the others away
+MAX_RETRY_WAIT = 15  # seconds
+
+FAILURE_THRESHOLD = 3  # consecutive failed requests opening the breaker
+OPEN_DURATION = 60  # seconds, doubled each time a probe fails
+MAX_OPEN_DURATION = 900  # seconds
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    """Return the exponential back-off before a retry, with equal jitter."""
+    delay = min(cap, base * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def parse_retry_after(value, now=None):
+    """Return the seconds to wait from a Retry-After header, or None.
+
+    The header holds either a number of seconds or an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+class CircuitBreaker:
+    """Stop every request to FotMob after repeated failures.
+
+    After ``threshold`` consecutive failures (429, 5xx, timeouts and
+    connection errors) the breaker opens for ``open_duration`` seconds,
+    or the server's Retry-After when longer, and requests fail fast.
+    Then a single probe request is let through: success closes the
+    breaker, failure re-opens it for twice as long. ``allow`` returns a
+    token per attempt, so only the probe's own outcome ends the probe.
+    """
+
+    def __init__(self, threshold=FAILURE_THRESHOLD, open_duration=OPEN_DURATION, max_open_duration=MAX_OPEN_DURATION):
+        """Initialize a closed breaker."""
+        self.threshold = threshold
+        self.open_duration = open_duration
+        self.max_open_duration = max_open_duration
+        self.failures = 0
+        self.trips = 0
+        self._duration = open_duration
+        self._open_until = None
+        self._tokens = itertools.count(1)
+        self._probe = None  # token of the half-open probe in flight
+
+    @property
+    def state(self):
+        """Return closed, open or half_open."""
+        if self._open_until is None:
+            return STATE_CLOSED
+        if time.monotonic() < self._open_until:
+            return STATE_OPEN
+        return STATE_HALF_OPEN
+
+    @property
+    def retry_in(self):
+        """Return the seconds until the breaker lets a probe through."""
+        if self._open_until is None:
+            return 0.0
+        return max(0.0, self._open_until - time.monotonic())
+
+    def allow(self):
+        """Return an attempt token when a request may be sent now, else None."""
+        state = self.state
+        if state == STATE_CLOSED:
+            return next(self._tokens)
+        if state == STATE_HALF_OPEN and self._probe is None:
+            self._probe = next(self._tokens)
+            return self._probe
+        return None
+
+    def end_attempt(self, token):
+        """Mark the end of an attempt, whatever its outcome."""
+        if token == self._probe:
+            self._probe = None
+
+    def record_success(self):
+        """Close the breaker after a successful request."""
+        self.failures = 0
+        self._duration = self.open_duration
+        self._open_until = None
+
+    def record_failure(self, token, retry_after=None):
+        """Count a failed attempt, opening the breaker when needed."""
+        self.failures += 1
+        if self._open_until is not None:
+            # Attempts sent before the breaker opened may still fail; only
+            # a failed probe opens it again, for longer
+            if token == self._probe:
+                self._duration = min(self.max_open_duration, self._duration * 2)
+                self._trip(retry_after)
+        elif self.failures >= self.threshold:
+            self._trip(retry_after)
+
+    def _trip(self, retry_after):
+        """Open the breaker."""
+        duration = max(self._duration, retry_after or 0)
+        self._open_until = time.monotonic() + duration
+        self.trips += 1
+
+    def as_dict(self):
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+            "retry_in": round(self.retry_in, 1),
+        }
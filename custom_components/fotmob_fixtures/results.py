@@ -0,0 +1,265 @@
+"""Persistent log of a team's finished matches and running season figures."""
+import heapq
+import logging
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .snapshot import parse_utc
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Results only change at full time, so writes can wait
+SAVE_DELAY = 60
+# Oldest results are dropped beyond this; a few seasons of every competition
+MAX_RESULTS = 400
+
+
+def result_record(view):
+    """Return the stored record of a finished FixtureView, or None."""
+    fixture = view.fixture
+    if not fixture.get('status', {}).get('finished') or view.kickoff is None:
+        return None
+    home = fixture.get('home', {}).get('score')
+    away = fixture.get('away', {}).get('score')
+    if not isinstance(home, int) or not isinstance(away, int) or fixture.get('id') is None:
+        return None
+    goals_for, goals_against = (home, away) if view.is_home else (away, home)
+    league = fixture.get('league') or fixture.get('tournament') or {}
+    return {
+        "id": str(fixture['id']),
+        "time": view.kickoff.isoformat(),
+        "home": view.is_home,
+        "opponent": view.opponent,
+        "opponent_id": view.opponent_id,
+        "for": goals_for,
+        "against": goals_against,
+        "result": view.result,
+        "competition": league.get('name'),
+    }
+
+
+class SplitStats:
+    """Win/draw/loss and goal counts of a set of matches."""
+
+    __slots__ = ("played", "wins", "draws", "losses", "goals_for", "goals_against")
+
+    def __init__(self):
+        """Initialize empty counts."""
+        self.played = self.wins = self.draws = self.losses = 0
+        self.goals_for = self.goals_against = 0
+
+    def add(self, record):
+        """Count one result."""
+        self.played += 1
+        self.goals_for += record["for"]
+        self.goals_against += record["against"]
+        if record["result"] == "W":
+            self.wins += 1
+        elif record["result"] == "D":
+            self.draws += 1
+        else:
+            self.losses += 1
+
+    @property
+    def record(self):
+        """Return the record as W-D-L."""
+        return f"{self.wins}-{self.draws}-{self.losses}"
+
+    def per_game(self, goals):
+        """Return goals per match, or None before the first match."""
+        return round(goals / self.played, 2) if self.played else None
+
+    def as_dict(self):
+        """Return the counts with per-game averages."""
+        return {
+            "record": self.record,
+            "played": self.played,
+            "wins": self.wins,
+            "draws": self.draws,
+            "losses": self.losses,
+            "goals_for": self.goals_for,
+            "goals_against": self.goals_against,
+            "goals_per_game": self.per_game(self.goals_for),
+            "conceded_per_game": self.per_game(self.goals_against),
+        }
+
+
+class SeasonStats:
+    """Running figures over a season, updated as each result is appended.
+
+    Results must be added in kickoff order for the streaks to hold; the
+    store rebuilds the figures when a result arrives out of order.
+    """
+
+    def __init__(self, season_start=None):
+        """Initialize empty figures for the season starting at season_start."""
+        self.season_start = season_start
+        self.total = SplitStats()
+        self.home = SplitStats()
+        self.away = SplitStats()
+        self.competitions = {}  # name -> SplitStats
+        self.clean_sheets = 0
+        self.failed_to_score = 0
+        self.streak_result = None
+        self.streak = 0
+        self.unbeaten = 0
+        self.winless = 0
+        self.longest_win = 0
+        self.longest_unbeaten = 0
+        self.last_time = None
+
+    def add(self, record, kickoff):
+        """Add a result; returns False when it is older than the last one."""
+        if self.last_time is not None and kickoff < self.last_time:
+            return False
+        self.last_time = kickoff
+        self.total.add(record)
+        (self.home if record["home"] else self.away).add(record)
+        competition = record.get("competition") or "Unknown"
+        self.competitions.setdefault(competition, SplitStats()).add(record)
+        self.clean_sheets += record["against"] == 0
+        self.failed_to_score += record["for"] == 0
+
+        result = record["result"]
+        self.streak = self.streak + 1 if result == self.streak_result else 1
+        self.streak_result = result
+        self.unbeaten = self.unbeaten + 1 if result != "L" else 0
+        self.winless = self.winless + 1 if result != "W" else 0
+        if result == "W":
+            self.longest_win = max(self.longest_win, self.streak)
+        self.longest_unbeaten = max(self.longest_unbeaten, self.unbeaten)
+        return True
+
+
+class FotMobResultsStore:
+    """Append-only store of a team's finished matches, keyed by match id.
+
+    Finished fixtures of every refresh are appended once; older results
+    stay when they drop out of the FotMob overview. ``stats`` covers the
+    current season. Its start is the first fixture of the overview when
+    the season is first seen, and is kept while the overview's fixture
+    window slides forward.
+    """
+
+    def __init__(self, hass, storage_id):
+        """Initialize the store; storage_id is the entry id (plus team for groups)."""
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.results.{storage_id}")
+        self.results = {}  # match id -> record, in kickoff order
+        self.stats = SeasonStats()
+        self.season = None  # FotMob's name of the current season, when known
+        # Bumped on every change, so sensors can skip unchanged writes
+        self.revision = 0
+
+    async def async_load(self):
+        """Load the stored results and rebuild the season figures."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Ignoring unreadable FotMob results: %s", err)
+            return
+        if not stored:
+            return
+        self.results = {record["id"]: record for record in stored.get("results", [])}
+        self.season = stored.get("season")
+        self._rebuild(parse_utc(stored.get("season_start")))
+
+    def _rebuild(self, season_start):
+        """Recompute the season figures from the stored results."""
+        records = sorted(self.results.values(), key=lambda record: record["time"])
+        self.results = {record["id"]: record for record in records[-MAX_RESULTS:]}
+        self.stats = SeasonStats(season_start)
+        for record in self.results.values():
+            kickoff = parse_utc(record["time"])
+            if season_start is None or kickoff >= season_start:
+                self.stats.add(record, kickoff)
+        self.revision += 1
+
+    def _trim(self):
+        """Drop the oldest results beyond MAX_RESULTS.
+
+        Returns True when a dropped result was counted in the season
+        figures, which then have to be rebuilt.
+        """
+        excess = len(self.results) - MAX_RESULTS
+        oldest = heapq.nsmallest(excess, self.results.values(), key=lambda record: record["time"])
+        season_start = self.stats.season_start
+        in_season = False
+        for record in oldest:
+            del self.results[record["id"]]
+            in_season |= season_start is None or parse_utc(record["time"]) >= season_start
+        return in_season
+
+    def _new_season_start(self, season_start, season):
+        """Return the start the season figures move to, or None to keep it.
+
+        The overview only lists recent fixtures, so its first kickoff moves
+        forward as old ones drop out; that alone never starts a season.
+        A season starts when FotMob names another one, or when the fixture
+        list begins after every stored result. Fixtures older than the
+        stored start extend the season back.
+        """
+        stored = self.stats.season_start
+        if season_start is None:
+            return None
+        if stored is None or season_start < stored:
+            return season_start
+        if season_start == stored:
+            return None
+        if season is not None and self.season is not None and season != self.season:
+            return season_start
+        latest = max((record["time"] for record in self.results.values()), default=None)
+        if latest is None or season_start > parse_utc(latest):
+            return season_start
+        return None
+
+    def append(self, views, season_start, season=None):
+        """Add the finished fixtures not stored yet; returns True on changes.
+
+        season_start is the first kickoff of the overview and season
+        FotMob's name of the season, when the payload has one.
+        """
+        changed = False
+        new_start = self._new_season_start(season_start, season)
+        rebuild = new_start is not None
+        season_start = new_start if rebuild else self.stats.season_start
+        if season is not None and season != self.season:
+            self.season = season
+            changed = True
+        for view in views:
+            fixture_id = view.fixture.get('id')
+            if fixture_id is None or str(fixture_id) in self.results:
+                continue
+            record = result_record(view)
+            if record is None:
+                continue
+            self.results[record["id"]] = record
+            changed = True
+            if rebuild or (season_start is not None and view.kickoff < season_start):
+                continue
+            if not self.stats.add(record, view.kickoff):
+                rebuild = True
+        if len(self.results) > MAX_RESULTS and self._trim():
+            rebuild = True
+        if rebuild:
+            self._rebuild(season_start)
+            changed = True
+        elif changed:
+            self.revision += 1
+        if changed:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return changed
+
+    def _data_to_save(self):
+        """Return the stored form of the results."""
+        season_start = self.stats.season_start
+        return {
+            "season": self.season,
+            "season_start": season_start.isoformat() if season_start else None,
+            "results": list(self.results.values()),
+        }
+
+    async def async_remove(self):
+        """Delete the stored results."""
+        await self._store.async_remove()
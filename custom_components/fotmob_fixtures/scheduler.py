@@ -0,0 +1,108 @@
+"""Adaptive polling schedule driven by fixture kickoff times."""
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_LIVE_INTERVAL,
+    CONF_PREMATCH_INTERVAL,
+    CONF_MATCHWEEK_INTERVAL,
+    CONF_IDLE_INTERVAL,
+    DEFAULT_LIVE_INTERVAL,
+    DEFAULT_PREMATCH_INTERVAL,
+    DEFAULT_MATCHWEEK_INTERVAL,
+    DEFAULT_IDLE_INTERVAL,
+)
+
+PHASE_LIVE = "live"
+PHASE_PREMATCH = "prematch"
+PHASE_MATCHWEEK = "matchweek"
+PHASE_IDLE = "idle"
+
+PREMATCH_WINDOW = timedelta(hours=3)
+MATCHWEEK_WINDOW = timedelta(days=3)
+# A fixture past kickoff that FotMob has not flagged as started yet is
+# treated as live for this long, so the kickoff is picked up quickly.
+KICKOFF_GRACE = timedelta(hours=3)
+# Fixtures kicking off this close to now make it a matchday for the team
+MATCHDAY_WINDOW = timedelta(hours=12)
+
+PHASE_OPTIONS = {
+    PHASE_LIVE: (CONF_LIVE_INTERVAL, DEFAULT_LIVE_INTERVAL),
+    PHASE_PREMATCH: (CONF_PREMATCH_INTERVAL, DEFAULT_PREMATCH_INTERVAL),
+    PHASE_MATCHWEEK: (CONF_MATCHWEEK_INTERVAL, DEFAULT_MATCHWEEK_INTERVAL),
+    PHASE_IDLE: (CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+}
+
+
+def next_kickoff(fixtures, now):
+    """Return the earliest kickoff of a fixture that has not started yet."""
+    earliest = None
+    for fix in fixtures:
+        status = fix.get('status', {})
+        if status.get('started') or status.get('finished') or status.get('cancelled'):
+            continue
+        kickoff = dt_util.parse_datetime(status.get('utcTime') or '')
+        if kickoff is None or kickoff < now - KICKOFF_GRACE:
+            continue
+        if earliest is None or kickoff < earliest:
+            earliest = kickoff
+    return earliest
+
+
+def is_matchday(fixtures, now=None):
+    """Return True when a fixture kicks off within MATCHDAY_WINDOW of now."""
+    now = now or dt_util.utcnow()
+    for fix in fixtures:
+        status = fix.get('status', {})
+        if status.get('cancelled'):
+            continue
+        kickoff = dt_util.parse_datetime(status.get('utcTime') or '')
+        if kickoff is not None and abs(kickoff - now) <= MATCHDAY_WINDOW:
+            return True
+    return False
+
+
+def match_phase(fixtures, now=None):
+    """Return (phase, next kickoff) for a team's fixture list."""
+    now = now or dt_util.utcnow()
+    for fix in fixtures:
+        status = fix.get('status', {})
+        if status.get('started') and not status.get('finished'):
+            return PHASE_LIVE, None
+
+    kickoff = next_kickoff(fixtures, now)
+    if kickoff is None:
+        return PHASE_IDLE, None
+
+    until = kickoff - now
+    if until <= timedelta(0):
+        return PHASE_LIVE, kickoff
+    if until <= PREMATCH_WINDOW:
+        return PHASE_PREMATCH, kickoff
+    if until <= MATCHWEEK_WINDOW:
+        return PHASE_MATCHWEEK, kickoff
+    return PHASE_IDLE, kickoff
+
+
+def phase_interval(phase, options):
+    """Return the configured polling interval for a phase."""
+    key, default = PHASE_OPTIONS[phase]
+    return timedelta(minutes=options.get(key, default))
+
+
+def compute_update_interval(fixtures, options, now=None):
+    """Return (phase, update interval) for the given fixtures and options.
+
+    Long intervals are clipped so the coordinator wakes up in time for the
+    pre-match window of the next kickoff.
+    """
+    now = now or dt_util.utcnow()
+    phase, kickoff = match_phase(fixtures, now)
+    interval = phase_interval(phase, options)
+
+    if kickoff is not None and phase in (PHASE_MATCHWEEK, PHASE_IDLE):
+        wake_up = kickoff - PREMATCH_WINDOW - now
+        interval = max(min(interval, wake_up), phase_interval(PHASE_PREMATCH, options))
+
+    return phase, interval
@@ -0,0 +1,235 @@
+"""Offline team and league name index used by the config flow search."""
+import asyncio
+import logging
+import time
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from urllib.parse import quote
+
+from homeassistant.helpers.storage import Store
+
+from .api import get_api_client
+from .const import DOMAIN, DATA_SEARCH_INDEX
+from .ratelimit import PRIORITY_INTERACTIVE
+
+_LOGGER = logging.getLogger(__name__)
+
+SEARCH_URL = "https://www.fotmob.com/api/search/suggest?term={}"
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+# Remote answers for a search term are reused this long
+SEARCH_TTL = 7 * 24 * 3600  # seconds
+SEARCH_LIMIT = 20
+# Minimum trigram (Jaccard) similarity of a fuzzy match
+MIN_SIMILARITY = 0.3
+# Scores of a name, or a word of it, equal to or starting with the query;
+# fuzzy matches score their similarity, at most 1
+EXACT_SCORE = 3.0
+PREFIX_SCORE = 2.0
+# Without a prefix match, FotMob is asked below this many fuzzy matches
+MIN_FUZZY_MATCHES = 3
+
+TYPE_TEAM = "team"
+TYPE_LEAGUE = "league"
+
+
+def normalize(text):
+    """Return text case-folded and without accents, for matching."""
+    text = unicodedata.normalize("NFKD", str(text))
+    return "".join(char for char in text if not unicodedata.combining(char)).casefold().strip()
+
+
+def trigrams(text):
+    """Return the trigrams of normalized text, padded at the word edges."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _suggestions(payload):
+    """Yield the team and league items of a search response, at any depth."""
+    if isinstance(payload, list):
+        for item in payload:
+            yield from _suggestions(item)
+    elif isinstance(payload, dict):
+        if payload.get("type") in (TYPE_TEAM, TYPE_LEAGUE) and payload.get("id") and payload.get("name"):
+            yield payload
+            return
+        for value in payload.values():
+            if isinstance(value, (list, dict)):
+                yield from _suggestions(value)
+
+
+class FotMobSearchIndex:
+    """Teams and leagues by name, with prefix and trigram lookups.
+
+    Filled from the standings the integration fetches anyway and from
+    FotMob's search endpoint, whose answers are cached per term. The
+    index is persisted, so searches mostly resolve without a request.
+    """
+
+    def __init__(self, hass):
+        """Initialize an empty index."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.search_index")
+        self._entries = {}  # key -> {"type", "id", "name", "league"}
+        self._grams = {}  # trigram -> set of keys
+        self._gram_counts = {}  # key -> number of trigrams of the name
+        self._tokens = None  # sorted (token, key) list, rebuilt after changes
+        self._searched = {}  # normalized term -> epoch of the remote search
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    def __len__(self):
+        """Return the number of indexed teams and leagues."""
+        return len(self._entries)
+
+    def add(self, kind, item_id, name, league=None):
+        """Index a team or league; returns True when it changed the index."""
+        if not item_id or not name:
+            return False
+        key = f"{kind}:{item_id}"
+        current = self._entries.get(key)
+        if current is not None:
+            if current["name"] == name and (league is None or current.get("league") == league):
+                return False
+            self._unindex(key)
+        self._entries[key] = {"type": kind, "id": str(item_id), "name": name, "league": league}
+        grams = trigrams(normalize(name))
+        for gram in grams:
+            self._grams.setdefault(gram, set()).add(key)
+        self._gram_counts[key] = len(grams)
+        self._tokens = None
+        return True
+
+    def _unindex(self, key):
+        """Drop a key from the trigram lookup."""
+        for gram in trigrams(normalize(self._entries[key]["name"])):
+            if keys := self._grams.get(gram):
+                keys.discard(key)
+        self._gram_counts.pop(key, None)
+
+    def _sorted_tokens(self):
+        """Return the (token, key) list of every name and name word."""
+        if self._tokens is None:
+            tokens = set()
+            for key, entry in self._entries.items():
+                name = normalize(entry["name"])
+                tokens.add((name, key))
+                tokens.update((word, key) for word in name.split())
+            self._tokens = sorted(tokens)
+        return self._tokens
+
+    def search(self, query, kind=TYPE_TEAM, limit=SEARCH_LIMIT):
+        """Return the entries of kind best matching query, best first.
+
+        Names or name words starting with the query come first, then
+        names sharing enough trigrams with it (typos, missing letters).
+        """
+        return [entry for _, entry in self._scored(query, kind)[:limit]]
+
+    def _scored(self, query, kind):
+        """Return the (score, entry) matches of kind, best first."""
+        term = normalize(query)
+        if not term:
+            return []
+        scores = {}
+        tokens = self._sorted_tokens()
+        i = bisect_left(tokens, (term,))
+        while i < len(tokens) and tokens[i][0].startswith(term):
+            token, key = tokens[i]
+            scores[key] = max(scores.get(key, 0), EXACT_SCORE if token == term else PREFIX_SCORE)
+            i += 1
+
+        grams = trigrams(term)
+        shared = Counter(key for gram in grams for key in self._grams.get(gram, ()))
+        for key, count in shared.items():
+            similarity = count / (len(grams) + self._gram_counts[key] - count)
+            if similarity >= MIN_SIMILARITY:
+                scores[key] = max(scores.get(key, 0), similarity)
+
+        matches = [key for key in scores if self._entries[key]["type"] == kind]
+        matches.sort(key=lambda key: (-scores[key], self._entries[key]["name"]))
+        return [(scores[key], self._entries[key]) for key in matches]
+
+    def ingest_standings(self, league_id, league_name, index):
+        """Index a league and the teams of its standings (a TableIndex)."""
+        changed = self.add(TYPE_LEAGUE, league_id, league_name)
+        for section in index.sections:
+            for row in section.rows:
+                changed |= self.add(TYPE_TEAM, row.get("id"), row.get("name"), league_name)
+        if changed:
+            self._schedule_save()
+
+    async def async_search(self, query, kind=TYPE_TEAM, limit=SEARCH_LIMIT):
+        """Search the index, asking FotMob once per term when it falls short.
+
+        The index falls short when no name starts with the query and
+        fewer than MIN_FUZZY_MATCHES names resemble it. Raises
+        FotMobApiError when FotMob had to be asked and failed.
+        """
+        await self.async_load()
+        scored = self._scored(query, kind)
+        term = normalize(query)
+        searched = self._searched.get(term)
+        if (
+            (scored and scored[0][0] >= PREFIX_SCORE)
+            or len(scored) >= MIN_FUZZY_MATCHES
+            or (searched is not None and time.time() - searched < SEARCH_TTL)
+        ):
+            return [entry for _, entry in scored[:limit]]
+
+        payload = await get_api_client(self.hass).async_get_json(
+            SEARCH_URL.format(quote(query.strip())), retries=1, priority=PRIORITY_INTERACTIVE, raise_on_error=True
+        )
+        for item in _suggestions(payload):
+            self.add(item["type"], item["id"], item["name"], item.get("leagueName"))
+        self._searched[term] = time.time()
+        self._schedule_save()
+        return self.search(query, kind, limit)
+
+    async def async_load(self):
+        """Merge the persisted index into the current one, once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                stored = await self._store.async_load()
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning("Ignoring unreadable FotMob search index: %s", err)
+                stored = None
+            self._loaded = True
+            if not stored:
+                return
+            # Entries added since startup are fresher than the stored ones
+            for entry in stored.get("entries", []):
+                if f"{entry['type']}:{entry['id']}" not in self._entries:
+                    self.add(entry["type"], entry["id"], entry["name"], entry.get("league"))
+            for term, searched in stored.get("searched", {}).items():
+                self._searched.setdefault(term, searched)
+            self._schedule_save()
+
+    def _schedule_save(self):
+        """Save the index after a delay, once the stored one was merged."""
+        if not self._loaded:
+            self.hass.async_create_task(self.async_load())
+            return
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self):
+        """Return the stored form of the index."""
+        now = time.time()
+        return {
+            "entries": list(self._entries.values()),
+            "searched": {term: at for term, at in self._searched.items() if now - at < SEARCH_TTL},
+        }
+
+
+def get_search_index(hass):
+    """Return the search index shared by every config entry and flow."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    index = domain_data.get(DATA_SEARCH_INDEX)
+    if index is None:
+        index = domain_data[DATA_SEARCH_INDEX] = FotMobSearchIndex(hass)
+    return index
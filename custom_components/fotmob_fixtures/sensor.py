@@ -1,39 +1,99 @@
 import logging
-from datetime import datetime
+import time
 from homeassistant.util import dt as dt_util
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_TEAM_ID
+from .attributes import columnar, is_compact, shape_attributes
+from .const import DOMAIN, DATA_METRICS_OWNER, DATA_TABLE_RENDERS
+from .league import SIGNAL_LEAGUE_REMOVED, get_leagues
+from .logos import logo_url
+from .localtime import localize_time, localize_times
+from .metrics import SECONDS_BUCKETS, FotMobMetrics, get_metrics
+from .snapshot import fingerprint, flatten_form
 
 _LOGGER = logging.getLogger(__name__)
 
-def localize_time(utc_time_str):
-    """Convert UTC ISO string to local time DD/MM/YYYY HH:MM."""
-    if not utc_time_str:
-        return "N/A"
-    try:
-        if isinstance(utc_time_str, list) and len(utc_time_str) > 1:
-            # Handle list format from nextOpponent [team_id, name, time_str]
-            utc_time_str = utc_time_str[1]
-        
-        utc_dt = dt_util.parse_datetime(utc_time_str)
-        if utc_dt:
-            # Home Assistant's dt_util.as_local() respects the system timezone
-            local_dt = dt_util.as_local(utc_dt)
-            # Find timezone abbreviation or offset
-            tz_name = local_dt.strftime("%Z")
-            if not tz_name or tz_name.startswith("+") or tz_name.startswith("-"):
-                tz_name = f"GMT{local_dt.strftime('%z')[:3]}"
-            
-            return f"{local_dt.strftime('%d/%m/%Y %H:%M')} {tz_name}"
-    except Exception:
-        pass
-    return "N/A"
+# Fixtures listed by the Next Fixtures and Last Results sensors
+FIXTURES_LISTED = 5
+
+def render_table(section):
+    """Format the rows of a standings section, none flagged as current.
+
+    Returns the rows and the position of each team id among them.
+    """
+    # Form and next opponent were merged from the container level
+    # (sibling of 'data') when the index was built
+    next_times = localize_times([opp[1] for opp in section.next_opponent.values()])
+    next_map = {
+        t_id: {"id": opp[0], "time": next_time}
+        for (t_id, opp), next_time in zip(section.next_opponent.items(), next_times)
+    }
+
+    formatted_table = []
+    positions = {}
+    for row in section.rows:
+        t_id = str(row.get('id'))
+        positions.setdefault(t_id, len(formatted_table))
+
+        # 1. Form from teamForm (high-fidelity), fallback to row-local
+        form_results = flatten_form(section.team_form.get(t_id) or row.get('form', []))
+
+        # 2. Extract next opponent (prefer merge, fallback to row-local)
+        next_data = next_map.get(t_id)
+        next_id = next_data.get("id") if isinstance(next_data, dict) else None
+        next_time = next_data.get("time") if isinstance(next_data, dict) else "N/A"
+
+        if not next_id:
+            next_opponent = row.get("next")
+            if isinstance(next_opponent, list) and len(next_opponent) > 0:
+                next_id = next_opponent[0].get("id")
+                # Fallback time extraction if needed
+            elif isinstance(next_opponent, (str, int)):
+                next_id = next_opponent
+
+        formatted_table.append({
+            "rank": row.get("idx"),
+            "team": row.get("name"),
+            "team_id": row.get("id"),
+            "logo": logo_url(row.get("id")),
+            "played": row.get("played"),
+            "wins": row.get("wins"),
+            "draws": row.get("draws"),
+            "losses": row.get("losses"),
+            "goals": row.get("scoresStr", "-"),
+            "gd": row.get("goalConDiff"),
+            "pts": row.get("pts"),
+            "form": form_results,
+            "next_id": next_id,
+            "timestamp": next_time,
+            "color": row.get("qualColor") or row.get("color") or "",
+            "deduction": row.get("deductionReason"),
+            "is_current": False
+        })
+
+    return tuple(formatted_table), positions
+
+def rendered_table(hass, section):
+    """Return the formatted rows of a section, rendered once per league.
+
+    Renders are keyed by league and (sub-)table name and replaced when
+    the section's content version or the time zone changes, so every team
+    of the league reuses the same rows until the standings move.
+    """
+    renders = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_TABLE_RENDERS, {})
+    key = (section.league_id, section.league_name)
+    time_zone = str(dt_util.DEFAULT_TIME_ZONE)
+    cached = renders.get(key)
+    if cached is None or cached[0] != section.version or cached[1] != time_zone:
+        cached = renders[key] = (section.version, time_zone, render_table(section))
+    return cached[2]
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -42,39 +102,116 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform from a config entry."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    team_id = config_entry.data.get(CONF_TEAM_ID)
     
-    entities = [
-        FotMobMatchSensor(coordinator, team_id),
-        FotMobLeaguePositionSensor(coordinator, team_id),
-        FotMobLeaguePointsSensor(coordinator, team_id),
-        FotMobTeamFormSensor(coordinator, team_id),
-        FotMobMatchesPlayedSensor(coordinator, team_id),
-        FotMobTopScorerSensor(coordinator, team_id),
-        FotMobTopAssistSensor(coordinator, team_id),
-        FotMobTopRatingSensor(coordinator, team_id),
-        FotMobTeamTransfersSensor(coordinator, team_id),
-        FotMobTeamHistorySensor(coordinator, team_id),
-        FotMobLeagueTableSensor(coordinator, team_id),
-        FotMobStadiumSensor(coordinator, team_id),
-        FotMobCoachSensor(coordinator, team_id),
-    ]
+    # One set of sensors per team; team group entries serve many teams
+    entities = []
+    for team_id in coordinator.team_ids:
+        entities.extend([
+            FotMobMatchSensor(coordinator, team_id),
+            FotMobLeaguePositionSensor(coordinator, team_id),
+            FotMobLeaguePointsSensor(coordinator, team_id),
+            FotMobTeamFormSensor(coordinator, team_id),
+            FotMobMatchesPlayedSensor(coordinator, team_id),
+            FotMobTopScorerSensor(coordinator, team_id),
+            FotMobTopAssistSensor(coordinator, team_id),
+            FotMobTopRatingSensor(coordinator, team_id),
+            FotMobTeamTransfersSensor(coordinator, team_id),
+            FotMobTeamHistorySensor(coordinator, team_id),
+            FotMobLeagueTableSensor(coordinator, team_id),
+            FotMobStadiumSensor(coordinator, team_id),
+            FotMobCoachSensor(coordinator, team_id),
+            FotMobLiveMinuteSensor(coordinator, team_id),
+            FotMobLiveEventsSensor(coordinator, team_id),
+            FotMobLiveStatsSensor(coordinator, team_id),
+            FotMobNextFixturesSensor(coordinator, team_id),
+            FotMobLastResultsSensor(coordinator, team_id),
+            FotMobSeasonRecordSensor(coordinator, team_id),
+            FotMobGoalsPerGameSensor(coordinator, team_id),
+            FotMobStreakSensor(coordinator, team_id),
+        ])
+
+    entities.append(FotMobRefreshDurationSensor(coordinator, config_entry))
+    # Integration-wide figures get one set of sensors, on the first entry
+    domain_data = hass.data[DOMAIN]
+    if domain_data.setdefault(DATA_METRICS_OWNER, config_entry.entry_id) == config_entry.entry_id:
+        metrics = get_metrics(hass)
+        entities.extend([
+            FotMobApiLatencySensor(metrics),
+            FotMobApiTrafficSensor(metrics),
+            FotMobDecodeTimeSensor(metrics),
+            FotMobRenderTimeSensor(metrics),
+        ])
     
     async_add_entities(entities)
 
+    @callback
+    def async_add_league(league_coordinator):
+        """Add the entities of a league this entry was picked to provide."""
+        async_add_entities([FotMobLeagueStandingsSensor(league_coordinator, config_entry.options)])
+
+    # Each league gets one set of entities across every entry
+    config_entry.async_on_unload(get_leagues(hass).async_add_provider(config_entry.entry_id, async_add_league))
+
 class FotMobBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for FotMob sensors."""
 
+    # Sensors reading the match details poll also follow the live coordinator
+    follows_live_match = False
+    # Sensors reading the standings also follow the league coordinator
+    follows_league = False
+
     def __init__(self, coordinator, team_id):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._team_id = team_id
         self._attr_unique_id = f"fotmob_{team_id}_{self.entity_description_key}"
+        self._last_inputs = None
+        self._last_fingerprint = None
+
+    async def async_added_to_hass(self):
+        """Subscribe to the live match coordinator when the sensor reads it."""
+        await super().async_added_to_hass()
+        if self.follows_live_match:
+            self.async_on_remove(self.live_coordinator.async_add_listener(self._handle_coordinator_update))
+        if self.follows_league and (league := self.league_coordinator) is not None:
+            self.async_on_remove(league.async_add_listener(self._handle_coordinator_update))
+
+    def _fingerprint_inputs(self):
+        """Return the parts of the payload this sensor's state is built from."""
+        return (self.team_data,)
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Write state only when this sensor's inputs changed."""
+        # availability leads the inputs, so a flip is always written
+        inputs = (self.available, self.team_name) + tuple(self._fingerprint_inputs())
+        last = self._last_inputs
+        # Unchanged sub-objects are usually shared between refreshes (304s,
+        # cached refresh tiers), so identity settles most updates for free
+        if last is not None and len(last) == len(inputs) and all(a is b for a, b in zip(last, inputs)):
+            return
+        self._last_inputs = inputs
+        digest = fingerprint(inputs)
+        if digest == self._last_fingerprint:
+            return
+        self._last_fingerprint = digest
+        started = time.perf_counter()
+        self.async_write_ha_state()
+        get_metrics(self.hass).observe_render(self.entity_description_key, time.perf_counter() - started)
 
     @property
     def team_data(self):
         """Return the data for this team."""
-        return self.coordinator.data if self.coordinator.data is not None else {}
+        data = self.coordinator.team_payload(self._team_id)
+        return data if data is not None else {}
+
+    @property
+    def available(self):
+        """Keep serving the last good data until it exceeds the max staleness."""
+        return (
+            self.coordinator.team_payload(self._team_id) is not None
+            and not self.coordinator.team_is_stale(self._team_id)
+        )
 
     @property
     def team_name(self):
@@ -83,40 +220,61 @@ class FotMobBaseSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def entity_picture(self):
-        """Return the logo of the tracked team."""
-        return f"https://images.fotmob.com/image_resources/logo/teamlogo/{self._team_id}.png"
+        """Return the locally cached logo of the tracked team."""
+        return logo_url(self._team_id)
 
-    def _find_team_in_tables(self, tables):
-        """Helper to find team row and league name in various table structures."""
-        if not tables:
-            return None, None, None
-            
-        for container in tables:
-            # Check if this is from the team overview or league API
-            # Team overview has data in .data, League API has data directly or in .data
-            data = container.get('data') if 'data' in container else container
-            if not isinstance(data, dict):
-                continue
-
-            if data.get('composite'):
-                for sub_table in data.get('tables', []):
-                    league_name = sub_table.get('leagueName')
-                    rows = sub_table.get('table', {}).get('all', [])
-                    for row in rows:
-                        if str(row.get('id')) == str(self._team_id):
-                            return row, league_name, container
-            else:
-                league_name = data.get('leagueName')
-                rows = data.get('table', {}).get('all', [])
-                for row in rows:
-                    if str(row.get('id')) == str(self._team_id):
-                        return row, league_name, container
-        return None, None, None
+    @property
+    def snapshot(self):
+        """Return the per-refresh lookup snapshot of the team data."""
+        return self.coordinator.team_snapshot(self._team_id)
+
+    @property
+    def league_coordinator(self):
+        """Return the coordinator owning the standings of the team's league."""
+        return self.coordinator.league_coordinator(self._team_id)
+
+    def _team_entry(self):
+        """Return this team's TableEntry, from the league's standings first."""
+        league = self.league_coordinator
+        entry = league.lookup(self._team_id) if league is not None else None
+        return entry or self.snapshot.overview_index.lookup(self._team_id)
+
+    def _team_row(self):
+        """Return this team's row in the league tables."""
+        entry = self._team_entry()
+        return entry.row if entry else None
+
+    @property
+    def live_coordinator(self):
+        """Return the coordinator polling this team's live match."""
+        return self.coordinator.live_coordinator(self._team_id)
+
+    @property
+    def live_match(self):
+        """Return the last polled match details, or an empty dict."""
+        return self.live_coordinator.data or {}
 
 class FotMobMatchSensor(FotMobBaseSensor):
     """Sensor for the next or live match."""
 
     entity_description_key = "match"
+    follows_live_match = True
+
+    def _fingerprint_inputs(self):
+        view = self.snapshot.timeline.current
+        if not view:
+            return (None,)
+        live = self._live_details(view.fixture)
+        if view.opponent_entry:
+            return (view.fixture, live, view.opponent_entry.row, view.opponent_entry.raw_form)
+        return (view.fixture, live)
+
+    def _live_details(self, match):
+        """Return the polled match details of the fixture, if any."""
+        live = self.live_match
+        if live and str(match.get('id')) == live.get('match_id'):
+            return live
+        return None
 
     @property
     def name(self):
@@ -124,29 +282,18 @@ class FotMobMatchSensor(FotMobBaseSensor):
 
     @property
     def state(self):
-        data = self.team_data
-        fixtures = data.get('fixtures', {}).get('allFixtures', {}).get('fixtures', [])
-        
-        active_match = None
-        upcoming_matches = []
-        
-        for fix in fixtures:
-            status = fix.get('status', {})
-            if status.get('started') and not status.get('finished'):
-                active_match = fix
-                break
-            if not status.get('started'):
-                upcoming_matches.append(fix)
-        
-        match_to_track = active_match or (upcoming_matches[0] if upcoming_matches else None)
-        
-        if match_to_track:
-            status = match_to_track.get('status', {})
+        view = self.snapshot.timeline.current
+
+        if view:
+            match_to_track = view.fixture
+            status = view.status
             home_team = match_to_track.get('home', {}).get('name')
             away_team = match_to_track.get('away', {}).get('name')
             
             if status.get('started') and not status.get('finished'):
-                score = status.get('scoreStr', '0 - 0')
+                # The match details poll is fresher than the overview
+                live = self._live_details(match_to_track)
+                score = live.get('score') if live and live.get('score') else status.get('scoreStr', '0 - 0')
                 return f"LIVE: {score}"
             return f"{home_team} vs {away_team}"
         
@@ -154,100 +301,39 @@ class FotMobMatchSensor(FotMobBaseSensor):
 
     @property
     def extra_state_attributes(self):
-        data = self.team_data
-        fixtures = data.get('fixtures', {}).get('allFixtures', {}).get('fixtures', [])
-        
-        active_match = None
-        upcoming_matches = []
-        
-        for fix in fixtures:
-            status = fix.get('status', {})
-            if status.get('started') and not status.get('finished'):
-                active_match = fix
-                break
-            if not status.get('started'):
-                upcoming_matches.append(fix)
-        
-        match = active_match or (upcoming_matches[0] if upcoming_matches else None)
-        if not match:
+        # Opponent rank, form and difficulty are precomputed per refresh
+        view = self.snapshot.timeline.current
+        if not view:
             return {}
 
-        status = match.get('status', {})
-        home_id = match.get('home', {}).get('id')
-        is_home = str(home_id) == str(self._team_id)
-        opponent = match.get('away', {}).get('name') if is_home else match.get('home', {}).get('name')
-        opponent_id = match.get('away', {}).get('id') if is_home else match.get('home', {}).get('id')
-
-        opponent_rank = "N/A"
-        opponent_form = []
-        difficulty = "N/A"
-
-        # Try to find opponent in league table
-        tables = data.get('table', [])
-        row, _, container = self._find_team_in_tables(tables)
-        # We need to find the opponent, not the current team, so we use a custom search
-        # similar to _find_team_in_tables but for opponent_id
-        
-        found_opponent = False
-        if tables:
-            for c in tables:
-                c_data = c.get('data') if 'data' in c else c
-                if not isinstance(c_data, dict):
-                    continue
-                    
-                if c_data.get('composite'):
-                    for sub_table in c_data.get('tables', []):
-                        for r in sub_table.get('table', {}).get('all', []):
-                            if str(r.get('id')) == str(opponent_id):
-                                opponent_rank = r.get('idx')
-                                raw_form = c.get('teamForm', {}).get(str(opponent_id)) or r.get('form', [])
-                                found_opponent = True
-                                break
-                        if found_opponent: break
-                else:
-                    for r in c_data.get('table', {}).get('all', []):
-                        if str(r.get('id')) == str(opponent_id):
-                            opponent_rank = r.get('idx')
-                            raw_form = c.get('teamForm', {}).get(str(opponent_id)) or r.get('form', [])
-                            found_opponent = True
-                            break
-                if found_opponent: break
-
-        if found_opponent:
-            if isinstance(raw_form, list):
-                for f in raw_form:
-                    if isinstance(f, dict):
-                        opponent_form.append(f.get('resultString', f.get('result', '?')))
-                    elif isinstance(f, str):
-                        opponent_form.append(f)
-            
-            if isinstance(opponent_rank, int):
-                if opponent_rank <= 4:
-                    difficulty = "High"
-                elif opponent_rank <= 10:
-                    difficulty = "Medium"
-                else:
-                    difficulty = "Low"
-
+        match = view.fixture
+        status = view.status
         attributes = {
-            "opponent": opponent,
-            "opponent_id": opponent_id,
-            "opponent_logo": f"https://images.fotmob.com/image_resources/logo/teamlogo/{opponent_id}.png",
-            "home_away": "Home" if is_home else "Away",
+            "opponent": view.opponent,
+            "opponent_id": view.opponent_id,
+            "opponent_logo": logo_url(view.opponent_id),
+            "home_away": "Home" if view.is_home else "Away",
             "league": match.get('league', {}).get('name'),
             "match": f"{match.get('home', {}).get('name')} vs {match.get('away', {}).get('name')}",
             "timestamp": localize_time(status.get('utcTime')),
             "status": "Live" if (status.get('started') and not status.get('finished')) else "Scheduled",
             "score": status.get('scoreStr'),
-            "opponent_rank": opponent_rank,
-            "opponent_form": opponent_form,
-            "difficulty": difficulty
+            "opponent_rank": view.opponent_rank,
+            "opponent_form": list(view.opponent_form),
+            "difficulty": view.difficulty
         }
+        if live := self._live_details(match):
+            attributes["score"] = live.get('score') or attributes["score"]
+            attributes["minute"] = live.get('minute')
         return attributes
 
 class FotMobLeaguePositionSensor(FotMobBaseSensor):
     """Sensor for league position."""
     entity_description_key = "position"
+    follows_league = True
+
+    def _fingerprint_inputs(self):
+        return (self._team_row(),)
 
     @property
     def name(self):
@@ -255,8 +341,7 @@ class FotMobLeaguePositionSensor(FotMobBaseSensor):
 
     @property
     def state(self):
-        tables = self.team_data.get('table', [])
-        row, _, _ = self._find_team_in_tables(tables)
+        row = self._team_row()
         if row:
             return row.get('idx')
         return None
@@ -268,6 +353,10 @@ class FotMobLeaguePositionSensor(FotMobBaseSensor):
 class FotMobLeaguePointsSensor(FotMobBaseSensor):
     """Sensor for league points."""
     entity_description_key = "points"
+    follows_league = True
+
+    def _fingerprint_inputs(self):
+        return (self._team_row(),)
 
     @property
     def name(self):
@@ -275,8 +364,7 @@ class FotMobLeaguePointsSensor(FotMobBaseSensor):
 
     @property
     def state(self):
-        tables = self.team_data.get('table', [])
-        row, _, _ = self._find_team_in_tables(tables)
+        row = self._team_row()
         if row:
             return row.get('pts')
         return None
@@ -289,54 +377,29 @@ class FotMobTeamFormSensor(FotMobBaseSensor):
     """Sensor for team form."""
     entity_description_key = "form"
 
+    def _fingerprint_inputs(self):
+        entry = self.snapshot.table_index.lookup(self._team_id)
+        return (entry.row, entry.raw_form) if entry else (None,)
+
     @property
     def name(self):
         return f"{self.team_name} Form"
 
     @property
     def state(self):
-        tables = self.team_data.get('table', [])
-        if not tables:
-            league_data = self.team_data.get('league_table', {})
-            tables = league_data.get('table', [])
-
-        for table_container in tables:
-            # teamForm is at table_container level, NOT inside data.table
-            team_form = table_container.get('teamForm', {})
-            form_entries = team_form.get(str(self._team_id), [])
-            
-            if form_entries:
-                results = []
-                for f in form_entries:
-                    if isinstance(f, dict):
-                        results.append(f.get('resultString', f.get('result', '?')))
-                    elif isinstance(f, str):
-                        results.append(f)
-                return "-".join(results) if results else "N/A"
-            
-            # Fallback: check row-level form data
-            rows = table_container.get('data', {}).get('table', {}).get('all', [])
-            for entry in rows:
-                if str(entry.get('id')) == str(self._team_id):
-                    form = entry.get('form', [])
-                    if isinstance(form, list) and form:
-                        return "-".join([f.get('resultString', f.get('result', '?')) if isinstance(f, dict) else str(f) for f in form])
+        # teamForm (container level) is preferred over row-level form data
+        entry = self.snapshot.table_index.lookup(self._team_id)
+        if entry and entry.form:
+            return "-".join(entry.form)
         return "N/A"
 
     @property
     def extra_state_attributes(self):
-        tables = self.team_data.get('table', [])
-        if not tables:
-            league_data = self.team_data.get('league_table', {})
-            tables = league_data.get('table', [])
-
-        row, _, container = self._find_team_in_tables(tables)
-        if row and container:
-            team_form = container.get('teamForm', {})
-            form_entries = team_form.get(str(self._team_id), [])
+        entry = self.snapshot.table_index.lookup(self._team_id)
+        if entry:
             return {
-                "form_list": form_entries or row.get('form', []),
-                "deduction": row.get('deductionReason')
+                "form_list": entry.raw_form,
+                "deduction": entry.row.get('deductionReason')
             }
         return {}
 
@@ -347,6 +410,10 @@ class FotMobTeamFormSensor(FotMobBaseSensor):
 class FotMobMatchesPlayedSensor(FotMobBaseSensor):
     """Sensor for matches played."""
     entity_description_key = "played"
+    follows_league = True
+
+    def _fingerprint_inputs(self):
+        return (self._team_row(),)
 
     @property
     def name(self):
@@ -354,8 +421,7 @@ class FotMobMatchesPlayedSensor(FotMobBaseSensor):
 
     @property
     def state(self):
-        tables = self.team_data.get('table', [])
-        row, _, _ = self._find_team_in_tables(tables)
+        row = self._team_row()
         if row:
             return row.get('played')
         return None
@@ -368,6 +434,12 @@ class FotMobTopScorerSensor(FotMobBaseSensor):
     """Sensor for top scorer."""
     entity_description_key = "top_scorer"
 
+    def _fingerprint_inputs(self):
+        return (
+            self.team_data.get('topPlayers'),
+            self.team_data.get('overview', {}).get('topPlayers'),
+        )
+
     @property
     def name(self):
         return f"{self.team_name} Top Scorer"
@@ -394,6 +466,12 @@ class FotMobTopAssistSensor(FotMobBaseSensor):
     """Sensor for top assist provider."""
     entity_description_key = "top_assist"
 
+    def _fingerprint_inputs(self):
+        return (
+            self.team_data.get('topPlayers'),
+            self.team_data.get('overview', {}).get('topPlayers'),
+        )
+
     @property
     def name(self):
         return f"{self.team_name} Top Assist"
@@ -419,6 +497,9 @@ class FotMobTopRatingSensor(FotMobBaseSensor):
     """Sensor for top rating."""
     entity_description_key = "top_rating"
 
+    def _fingerprint_inputs(self):
+        return (self.team_data.get('overview', {}).get('topPlayers'),)
+
     @property
     def name(self):
         return f"{self.team_name} Top Rating"
@@ -440,6 +521,10 @@ class FotMobTopRatingSensor(FotMobBaseSensor):
 class FotMobTeamTransfersSensor(FotMobBaseSensor):
     """Sensor for team transfers."""
     entity_description_key = "transfers"
+    _unrecorded_attributes = frozenset({"players_in", "players_out", "contract_extensions", "truncated"})
+
+    def _fingerprint_inputs(self):
+        return (self.team_data.get('transfers'),)
 
     @property
     def name(self):
@@ -456,11 +541,11 @@ class FotMobTeamTransfersSensor(FotMobBaseSensor):
     @property
     def extra_state_attributes(self):
         transfers = self.team_data.get('transfers', {}).get('data', {})
-        return {
+        return shape_attributes({
             "players_in": transfers.get('Players in', []),
             "players_out": transfers.get('Players out', []),
             "contract_extensions": transfers.get('Contract extensions', [])
-        }
+        }, ("players_in", "players_out", "contract_extensions"), self.coordinator.options)
 
     @property
     def icon(self):
@@ -469,6 +554,10 @@ class FotMobTeamTransfersSensor(FotMobBaseSensor):
 class FotMobTeamHistorySensor(FotMobBaseSensor):
     """Sensor for team history (trophies)."""
     entity_description_key = "history"
+    _unrecorded_attributes = frozenset({"trophies", "truncated"})
+
+    def _fingerprint_inputs(self):
+        return (self.team_data.get('history'),)
 
     @property
     def name(self):
@@ -514,17 +603,28 @@ class FotMobTeamHistorySensor(FotMobBaseSensor):
                 "seasons": seasons
             })
             
-        return {
+        return shape_attributes({
             "trophies": flattened_trophies
-        }
+        }, ("trophies",), self.coordinator.options)
 
     @property
     def icon(self):
         return "mdi:trophy"
 
 class FotMobLeagueTableSensor(FotMobBaseSensor):
-    """Sensor for full league table."""
+    """Sensor for the team's place in its league table.
+
+    The full table lives on the league's standings sensor; this one only
+    carries the team's own row.
+    """
     entity_description_key = "league_table"
+    follows_league = True
+
+    def _fingerprint_inputs(self):
+        entry = self._team_entry()
+        if entry is None:
+            return (None,)
+        return (entry.row, entry.section.version)
 
     @property
     def name(self):
@@ -532,139 +632,34 @@ class FotMobLeagueTableSensor(FotMobBaseSensor):
 
     @property
     def state(self):
-        # Search all tables in overview
-        tables = self.team_data.get('table', [])
-        row, _, _ = self._find_team_in_tables(tables)
+        row = self._team_row()
         if row:
             return row.get('idx')
         return None
 
     @property
     def extra_state_attributes(self):
-        # 1. Try to get data from the Team API root first (supports scissioned/composite leagues)
-        tables = self.team_data.get('table', [])
-        
-        # 2. Fallback to full league_table fetch
-        if not tables:
-            league_data = self.team_data.get('league_table', {})
-            tables = league_data.get('table', [])
-            
-        if not tables:
-            return {"league_name": "N/A", "table": []}
-            
-        # We prefer the table that contains our team
-        league_info = {}
-        rows = []
-        table_data_obj = {}
-        matched_container = None
-        
-        row, league_name, matched_container = self._find_team_in_tables(tables)
-        
-        if matched_container:
-            data = matched_container.get('data') if 'data' in matched_container else matched_container
-            if data.get('composite'):
-                # For composite, we need to find WHICH sub-table has our team
-                for sub in data.get('tables', []):
-                    if any(str(r.get('id')) == str(self._team_id) for r in sub.get('table', {}).get('all', [])):
-                        league_info = {"leagueName": sub.get('leagueName')}
-                        table_data_obj = sub.get('table', {})
-                        rows = table_data_obj.get('all', [])
-                        break
-            else:
-                league_info = data
-                table_data_obj = data.get('table', {})
-                rows = table_data_obj.get('all', [])
-
-        if not rows and tables:
-            matched_container = tables[0]
-            data = matched_container.get('data') if 'data' in matched_container else matched_container
-            if data.get('composite') and data.get('tables'):
-                sub = data['tables'][0]
-                league_info = {"leagueName": sub.get('leagueName')}
-                table_data_obj = sub.get('table', {})
-                rows = table_data_obj.get('all', [])
-            else:
-                league_info = data
-                table_data_obj = league_info.get('table', {})
-                rows = table_data_obj.get('all', [])
-        
-        # High-Fidelity Merge: teamForm and nextOpponent are at table_container level
-        # (sibling of 'data'), NOT inside data.table
-        team_form_map = {}
-        team_form_obj = matched_container.get('teamForm', {}) if matched_container else {}
-        for t_id, entries in team_form_obj.items():
-            team_form_map[str(t_id)] = entries
-            
-        next_map = {}
-        next_obj = matched_container.get('nextOpponent', {}) if matched_container else {}
-        if not isinstance(next_obj, dict):
-            next_obj = table_data_obj.get('nextOpponent', {})
-        if isinstance(next_obj, dict):
-            for t_id, data in next_obj.items():
-                if isinstance(data, list) and len(data) >= 3:
-                    next_map[str(t_id)] = {
-                        "id": data[0],
-                        "time": localize_time(data[1])
-                    }
-        
-        formatted_table = []
-        for row in rows:
-            t_id = str(row.get('id'))
-            
-            # 1. Extract form from teamForm (high-fidelity), fallback to row-local
-            form_results = []
-            raw_form = team_form_map.get(t_id) or row.get('form', [])
-            
-            if isinstance(raw_form, list):
-                for f in raw_form:
-                    if isinstance(f, dict):
-                        form_results.append(f.get('resultString', f.get('result', '?')))
-                    elif isinstance(f, str):
-                        form_results.append(f)
-                    else:
-                        form_results.append('?')
-
-            # 2. Extract next opponent (prefer merge, fallback to row-local)
-            next_data = next_map.get(t_id)
-            next_id = next_data.get("id") if isinstance(next_data, dict) else None
-            next_time = next_data.get("time") if isinstance(next_data, dict) else "N/A"
-
-            if not next_id:
-                next_opponent = row.get("next")
-                if isinstance(next_opponent, list) and len(next_opponent) > 0:
-                    next_id = next_opponent[0].get("id")
-                    # Fallback time extraction if needed
-                elif isinstance(next_opponent, (str, int)):
-                    next_id = next_opponent
-
-            formatted_table.append({
-                "rank": row.get("idx"),
-                "team": row.get("name"),
-                "team_id": row.get("id"),
-                "played": row.get("played"),
-                "wins": row.get("wins"),
-                "draws": row.get("draws"),
-                "losses": row.get("losses"),
-                "goals": row.get("scoresStr", "-"),
-                "gd": row.get("goalConDiff"),
-                "pts": row.get("pts"),
-                "form": form_results,
-                "next_id": next_id,
-                "timestamp": next_time,
-                "color": row.get("qualColor") or row.get("color") or "", 
-                "deduction": row.get("deductionReason"),
-                "is_current": t_id == str(self._team_id)
-            })
-            
+        entry = self._team_entry()
+        if entry is None:
+            return {"league_name": "N/A", "league_id": None, "row": None}
+
+        # The formatted rows are shared with the league's standings sensor;
+        # only our own row gets a copy, flagged as current
+        rows, positions = rendered_table(self.hass, entry.section)
+        position = positions.get(str(self._team_id))
         return {
-            "league_name": league_info.get("leagueName", "N/A"),
-            "table": formatted_table
+            "league_name": entry.section.league_name or "N/A",
+            "league_id": entry.section.league_id,
+            "row": dict(rows[position], is_current=True) if position is not None else None,
         }
 
 class FotMobStadiumSensor(FotMobBaseSensor):
     """Sensor for team stadium."""
     entity_description_key = "stadium"
 
+    def _fingerprint_inputs(self):
+        return (self.team_data.get('details'),)
+
     @property
     def name(self):
         return f"{self.team_name} Stadium"
@@ -719,6 +714,13 @@ class FotMobCoachSensor(FotMobBaseSensor):
     """Sensor for team coach."""
     entity_description_key = "coach"
 
+    def _fingerprint_inputs(self):
+        return (
+            self.team_data.get('coach'),
+            self.team_data.get('overview', {}).get('lastLineupStats', {}).get('coach'),
+            self.team_data.get('squad'),
+        )
+
     @property
     def name(self):
         return f"{self.team_name} Coach"
@@ -782,3 +784,519 @@ class FotMobCoachSensor(FotMobBaseSensor):
     @property
     def icon(self):
         return "mdi:account-tie"
+
+class FotMobLiveMinuteSensor(FotMobBaseSensor):
+    """Sensor for the minute of the live match."""
+
+    entity_description_key = "live_minute"
+    follows_live_match = True
+
+    def _fingerprint_inputs(self):
+        return (self.live_match,)
+
+    @property
+    def name(self):
+        return f"{self.team_name} Live Minute"
+
+    @property
+    def state(self):
+        live = self.live_match
+        if not live:
+            return "Not live"
+        if live.get('finished'):
+            return "FT"
+        if not live.get('started'):
+            return "Not started"
+        return live.get('minute') or live.get('reason') or "Live"
+
+    @property
+    def extra_state_attributes(self):
+        live = self.live_match
+        if not live:
+            return {}
+        home = live.get('home', {})
+        away = live.get('away', {})
+        return {
+            "match_id": live.get('match_id'),
+            "match": f"{home.get('name')} vs {away.get('name')}",
+            "league": live.get('league'),
+            "score": live.get('score'),
+            "lineups": live.get('lineups'),
+            "tracking": self.live_coordinator.tracking,
+        }
+
+    @property
+    def icon(self):
+        return "mdi:timer-outline"
+
+class FotMobLiveEventsSensor(FotMobBaseSensor):
+    """Sensor for the goals, cards and substitutions of the live match."""
+
+    entity_description_key = "live_events"
+    follows_live_match = True
+
+    def _fingerprint_inputs(self):
+        return (self.live_match,)
+
+    @property
+    def name(self):
+        return f"{self.team_name} Live Events"
+
+    @property
+    def state(self):
+        return len(self.live_match.get('events', []))
+
+    @property
+    def extra_state_attributes(self):
+        events = self.live_match.get('events', [])
+        return {
+            "match_id": self.live_match.get('match_id'),
+            "last_event": events[-1] if events else None,
+            "events": events,
+        }
+
+    @property
+    def icon(self):
+        return "mdi:soccer"
+
+class FotMobLiveStatsSensor(FotMobBaseSensor):
+    """Sensor for the score and statistics of the live match."""
+
+    entity_description_key = "live_stats"
+    follows_live_match = True
+
+    def _fingerprint_inputs(self):
+        return (self.live_match,)
+
+    @property
+    def name(self):
+        return f"{self.team_name} Live Stats"
+
+    @property
+    def state(self):
+        return self.live_match.get('score') or "N/A"
+
+    @property
+    def extra_state_attributes(self):
+        live = self.live_match
+        if not live:
+            return {}
+        # Stats map a title to [home, away]
+        return {
+            "match_id": live.get('match_id'),
+            "home": live.get('home', {}).get('name'),
+            "away": live.get('away', {}).get('name'),
+            **live.get('stats', {}),
+        }
+
+    @property
+    def icon(self):
+        return "mdi:chart-bar"
+
+class FotMobNextFixturesSensor(FotMobBaseSensor):
+    """Sensor for the next scheduled fixtures."""
+
+    entity_description_key = "next_fixtures"
+
+    def _fingerprint_inputs(self):
+        # opponent_rank and difficulty come from the table, not the fixture
+        return tuple(
+            item for view in self.snapshot.timeline.next_fixtures(FIXTURES_LISTED)
+            for item in (view.fixture, view.opponent_entry.row if view.opponent_entry else None)
+        )
+
+    @property
+    def name(self):
+        return f"{self.team_name} Next Fixtures"
+
+    @property
+    def state(self):
+        upcoming = self.snapshot.timeline.next_fixtures(1)
+        if not upcoming:
+            return "No upcoming matches"
+        return f"{'vs' if upcoming[0].is_home else '@'} {upcoming[0].opponent}"
+
+    @property
+    def extra_state_attributes(self):
+        views = self.snapshot.timeline.next_fixtures(FIXTURES_LISTED)
+        timestamps = localize_times([view.status.get('utcTime') for view in views])
+        return {
+            "fixtures": [
+                {
+                    "match_id": view.fixture.get('id'),
+                    "opponent": view.opponent,
+                    "home_away": "Home" if view.is_home else "Away",
+                    "league": view.fixture.get('league', {}).get('name'),
+                    "timestamp": timestamp,
+                    "opponent_rank": view.opponent_rank,
+                    "difficulty": view.difficulty,
+                }
+                for view, timestamp in zip(views, timestamps)
+            ]
+        }
+
+    @property
+    def icon(self):
+        return "mdi:calendar-month"
+
+class FotMobLastResultsSensor(FotMobBaseSensor):
+    """Sensor for the latest results of the team."""
+
+    entity_description_key = "last_results"
+
+    def _fingerprint_inputs(self):
+        return tuple(view.fixture for view in self.snapshot.timeline.last_results(FIXTURES_LISTED))
+
+    @property
+    def name(self):
+        return f"{self.team_name} Last Results"
+
+    @property
+    def state(self):
+        results = [view.result or '?' for view in self.snapshot.timeline.last_results(FIXTURES_LISTED)]
+        return "-".join(results) if results else "N/A"
+
+    @property
+    def extra_state_attributes(self):
+        views = self.snapshot.timeline.last_results(FIXTURES_LISTED)
+        timestamps = localize_times([view.status.get('utcTime') for view in views])
+        return {
+            "results": [
+                {
+                    "match_id": view.fixture.get('id'),
+                    "opponent": view.opponent,
+                    "home_away": "Home" if view.is_home else "Away",
+                    "league": view.fixture.get('league', {}).get('name'),
+                    "timestamp": timestamp,
+                    "score": view.status.get('scoreStr'),
+                    "result": view.result,
+                }
+                for view, timestamp in zip(views, timestamps)
+            ]
+        }
+
+    @property
+    def icon(self):
+        return "mdi:scoreboard"
+
+class FotMobSeasonStatsSensor(FotMobBaseSensor):
+    """Base class for the sensors reading the stored results of the team."""
+
+    def _fingerprint_inputs(self):
+        results = self.coordinator.team_results(self._team_id)
+        return (results.revision if results is not None else None,)
+
+    @property
+    def stats(self):
+        """Return the running season figures, or None without a results store."""
+        results = self.coordinator.team_results(self._team_id)
+        return results.stats if results is not None else None
+
+    def _season_attributes(self):
+        """Return the season start and number of stored results."""
+        stats = self.stats
+        results = self.coordinator.team_results(self._team_id)
+        return {
+            "season_start": localize_time(stats.season_start.isoformat()) if stats.season_start else "N/A",
+            "results_stored": len(results.results),
+        }
+
+class FotMobSeasonRecordSensor(FotMobSeasonStatsSensor):
+    """Sensor for the season record of the team, all competitions."""
+
+    entity_description_key = "season_record"
+
+    @property
+    def name(self):
+        return f"{self.team_name} Season Record"
+
+    @property
+    def state(self):
+        stats = self.stats
+        return stats.total.record if stats is not None else "N/A"
+
+    @property
+    def extra_state_attributes(self):
+        stats = self.stats
+        if stats is None:
+            return {}
+        return {
+            **stats.total.as_dict(),
+            "home": stats.home.as_dict(),
+            "away": stats.away.as_dict(),
+            "competitions": {name: split.record for name, split in stats.competitions.items()},
+            **self._season_attributes(),
+        }
+
+    @property
+    def icon(self):
+        return "mdi:clipboard-list-outline"
+
+class FotMobGoalsPerGameSensor(FotMobSeasonStatsSensor):
+    """Sensor for the goals scored per match this season."""
+
+    entity_description_key = "goals_per_game"
+
+    @property
+    def name(self):
+        return f"{self.team_name} Goals Per Game"
+
+    @property
+    def state(self):
+        stats = self.stats
+        return stats.total.per_game(stats.total.goals_for) if stats is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        stats = self.stats
+        if stats is None:
+            return {}
+        total = stats.total
+        return {
+            "goals_for": total.goals_for,
+            "goals_against": total.goals_against,
+            "goal_difference": total.goals_for - total.goals_against,
+            "conceded_per_game": total.per_game(total.goals_against),
+            "home_goals_per_game": stats.home.per_game(stats.home.goals_for),
+            "away_goals_per_game": stats.away.per_game(stats.away.goals_for),
+            "clean_sheets": stats.clean_sheets,
+            "failed_to_score": stats.failed_to_score,
+            **self._season_attributes(),
+        }
+
+    @property
+    def icon(self):
+        return "mdi:soccer"
+
+class FotMobStreakSensor(FotMobSeasonStatsSensor):
+    """Sensor for the current run of results, e.g. W3."""
+
+    entity_description_key = "streak"
+
+    @property
+    def name(self):
+        return f"{self.team_name} Streak"
+
+    @property
+    def state(self):
+        stats = self.stats
+        if stats is None or not stats.streak_result:
+            return "N/A"
+        return f"{stats.streak_result}{stats.streak}"
+
+    @property
+    def extra_state_attributes(self):
+        stats = self.stats
+        if stats is None:
+            return {}
+        return {
+            "result": stats.streak_result,
+            "length": stats.streak,
+            "unbeaten": stats.unbeaten,
+            "winless": stats.winless,
+            "longest_win": stats.longest_win,
+            "longest_unbeaten": stats.longest_unbeaten,
+            **self._season_attributes(),
+        }
+
+    @property
+    def icon(self):
+        return "mdi:fire"
+
+class FotMobLeagueStandingsSensor(CoordinatorEntity, SensorEntity):
+    """Sensor for the full table of a league, one per league.
+
+    Provided by a single config entry however many tracked teams play in
+    the league; composite leagues list every group.
+    """
+
+    entity_description_key = "standings"
+    _attr_icon = "mdi:table-large"
+    _unrecorded_attributes = frozenset({"table", "groups", "truncated"})
+
+    def __init__(self, coordinator, options):
+        """Initialize the sensor with the options of the providing entry."""
+        super().__init__(coordinator)
+        self._options = options
+        self._attr_unique_id = f"fotmob_league_{coordinator.league_id}_standings"
+
+    async def async_added_to_hass(self):
+        """Remove the entity once no tracked team plays in the league."""
+        await super().async_added_to_hass()
+        self.async_on_remove(async_dispatcher_connect(
+            self.hass, SIGNAL_LEAGUE_REMOVED.format(self.coordinator.league_id), self._async_league_removed
+        ))
+
+    @callback
+    def _async_league_removed(self):
+        self.hass.async_create_task(self.async_remove())
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Write state, recording how long it took."""
+        started = time.perf_counter()
+        self.async_write_ha_state()
+        get_metrics(self.hass).observe_render(self.entity_description_key, time.perf_counter() - started)
+
+    @property
+    def name(self):
+        return f"{self.coordinator.league_name or f'League {self.coordinator.league_id}'} Table"
+
+    @property
+    def state(self):
+        # The leader of the first (sub-)table
+        index = self.coordinator.data
+        if index is None or not index.sections or not index.sections[0].rows:
+            return None
+        return index.sections[0].rows[0].get('name')
+
+    @property
+    def extra_state_attributes(self):
+        index = self.coordinator.data
+        if index is None or not index.sections:
+            return {"league_id": self.coordinator.league_id, "league_name": "N/A", "table": []}
+        tables = [
+            {"league_name": section.league_name or "N/A", "table": list(rendered_table(self.hass, section)[0])}
+            for section in index.sections
+        ]
+        attributes = {"league_id": self.coordinator.league_id, **tables[0]}
+        if len(tables) > 1:
+            compact = is_compact(self._options)
+            attributes["groups"] = [
+                dict(group, table=columnar(group["table"])) if compact else group for group in tables
+            ]
+        return shape_attributes(attributes, ("table",), self._options, truncate=("groups",))
+
+class FotMobRefreshDurationSensor(SensorEntity):
+    """Diagnostic sensor for the refresh duration of a config entry."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(self, coordinator, config_entry):
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self._attr_unique_id = f"fotmob_{config_entry.entry_id}_refresh_duration"
+        self._attr_name = f"{config_entry.title} Refresh Duration"
+
+    @property
+    def native_value(self):
+        duration = self.coordinator.last_refresh_duration
+        return round(duration * 1000, 1) if duration is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        histogram = get_metrics(self.hass).refresh.get(self.coordinator.name)
+        attributes = histogram.as_dict(1000, buckets=False) if histogram else {}
+        attributes["update_interval"] = str(self.coordinator.update_interval)
+        return attributes
+
+class FotMobMetricsSensor(SensorEntity):
+    """Base class for the integration-wide diagnostic sensors.
+
+    The figures change with every request, so they are polled rather
+    than pushed.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, metrics):
+        """Initialize the sensor."""
+        self._metrics = metrics
+        self._attr_unique_id = f"fotmob_metrics_{self.entity_description_key}"
+
+    def _endpoint_p95(self, attribute, bounds, scale):
+        """Return the p95 of an endpoint histogram across every URL type."""
+        histograms = [getattr(endpoint, attribute) for endpoint in self._metrics.endpoints.values()]
+        p95 = FotMobMetrics.merged(histograms, bounds).quantile(0.95)
+        return round(p95 * scale, 1) if p95 is not None else None
+
+class FotMobApiLatencySensor(FotMobMetricsSensor):
+    """Diagnostic sensor for FotMob request latency."""
+
+    entity_description_key = "api_latency"
+    _attr_name = "FotMob API Latency"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-outline"
+
+    @property
+    def native_value(self):
+        return self._endpoint_p95("latency", SECONDS_BUCKETS, 1000)
+
+    @property
+    def extra_state_attributes(self):
+        # p95 across every request type as the state, per type here
+        return {
+            kind: {
+                "latency_ms": endpoint.latency.as_dict(1000, buckets=False),
+                "queue_wait_ms": endpoint.queue_wait.as_dict(1000, buckets=False),
+            }
+            for kind, endpoint in self._metrics.endpoints.items()
+        }
+
+class FotMobApiTrafficSensor(FotMobMetricsSensor):
+    """Diagnostic sensor for the bytes downloaded from FotMob."""
+
+    entity_description_key = "api_traffic"
+    _attr_name = "FotMob API Traffic"
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+    _attr_icon = "mdi:download-network"
+
+    @property
+    def native_value(self):
+        return int(sum(endpoint.size.total for endpoint in self._metrics.endpoints.values()))
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            kind: {
+                "downloads": endpoint.size.count,
+                "bytes": int(endpoint.size.total),
+                "p95_bytes": endpoint.size.quantile(0.95),
+                "not_modified": endpoint.not_modified,
+                "retries": int(endpoint.retries.total),
+                "rate_limited": endpoint.rate_limited,
+                "errors": endpoint.errors,
+            }
+            for kind, endpoint in self._metrics.endpoints.items()
+        }
+
+class FotMobDecodeTimeSensor(FotMobMetricsSensor):
+    """Diagnostic sensor for the time spent decoding and projecting responses."""
+
+    entity_description_key = "decode_time"
+    _attr_name = "FotMob Decode Time"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:code-json"
+
+    @property
+    def native_value(self):
+        return self._endpoint_p95("decode", SECONDS_BUCKETS, 1000)
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            kind: endpoint.decode.as_dict(1000, buckets=False)
+            for kind, endpoint in self._metrics.endpoints.items()
+        }
+
+class FotMobRenderTimeSensor(FotMobMetricsSensor):
+    """Diagnostic sensor for the time spent writing sensor states."""
+
+    entity_description_key = "render_time"
+    _attr_name = "FotMob Render Time"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:view-dashboard-outline"
+
+    @property
+    def native_value(self):
+        p95 = FotMobMetrics.merged(self._metrics.render.values(), SECONDS_BUCKETS).quantile(0.95)
+        return round(p95 * 1000, 2) if p95 is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            key: histogram.as_dict(1000, buckets=False)
+            for key, histogram in self._metrics.render.items()
+        }
@@ -0,0 +1,318 @@
+"""Normalized view of a team payload, built once per coordinator refresh."""
+import json
+from bisect import bisect_left
+from datetime import datetime
+
+
+def fingerprint(value):
+    """Return a cheap content hash of JSON-like data."""
+    return hash(json.dumps(value, separators=(',', ':'), default=str))
+
+
+def flatten_form(raw_form):
+    """Flatten FotMob form entries to a list of result strings (W/D/L)."""
+    results = []
+    if isinstance(raw_form, list):
+        for f in raw_form:
+            if isinstance(f, dict):
+                results.append(f.get('resultString', f.get('result', '?')))
+            elif isinstance(f, str):
+                results.append(f)
+            else:
+                results.append('?')
+    return results
+
+
+def parse_utc(utc_time_str):
+    """Parse a FotMob UTC time string, returning None when it is invalid."""
+    if not isinstance(utc_time_str, str) or not utc_time_str:
+        return None
+    try:
+        return datetime.fromisoformat(utc_time_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def difficulty(rank):
+    """Rate an opponent by league rank: High (top 4), Medium (top 10) or Low."""
+    if not isinstance(rank, int):
+        return "N/A"
+    if rank <= 4:
+        return "High"
+    if rank <= 10:
+        return "Medium"
+    return "Low"
+
+
+class TableSection:
+    """One standings table: a plain league or a composite sub-table."""
+
+    __slots__ = ("league_id", "league_name", "table", "container", "team_form", "next_opponent", "_version")
+
+    def __init__(self, league_id, league_name, table, container):
+        """Initialize the section."""
+        self.league_id = league_id
+        self.league_name = league_name
+        self.table = table if isinstance(table, dict) else {}
+        self.container = container
+        self._version = None
+        # teamForm and nextOpponent live at container level (sibling of 'data')
+        self.team_form = {
+            str(t_id): entries for t_id, entries in (container.get('teamForm') or {}).items()
+        }
+        next_obj = container.get('nextOpponent', {})
+        if not isinstance(next_obj, dict):
+            next_obj = self.table.get('nextOpponent', {})
+        self.next_opponent = {}
+        if isinstance(next_obj, dict):
+            for t_id, data in next_obj.items():
+                if isinstance(data, list) and len(data) >= 3:
+                    self.next_opponent[str(t_id)] = (data[0], data[1])
+
+    @property
+    def rows(self):
+        """Return the table rows in rank order."""
+        return self.table.get('all', [])
+
+    @property
+    def version(self):
+        """Return a content hash of the rows, form and next opponents.
+
+        Equal across the payloads of every team in the league, so it keys
+        work shared between them. Computed once per snapshot.
+        """
+        if self._version is None:
+            self._version = fingerprint((self.league_name, self.rows, self.team_form, self.next_opponent))
+        return self._version
+
+
+class TableEntry:
+    """A team's row together with the section it was found in."""
+
+    __slots__ = ("row", "section", "raw_form", "form")
+
+    def __init__(self, row, section, raw_form):
+        """Initialize the entry."""
+        self.row = row
+        self.section = section
+        self.raw_form = raw_form
+        self.form = flatten_form(raw_form)
+
+    @property
+    def league_name(self):
+        """Return the name of the (sub-)league holding the row."""
+        return self.section.league_name
+
+
+class TableIndex:
+    """Team-id keyed lookups over a list of FotMob table containers.
+
+    Handles both the team overview layout (rows under ``data``) and the
+    league API layout, including composite leagues split in sub-tables.
+    The first occurrence of a team wins, matching the old linear scan.
+    """
+
+    __slots__ = ("tables", "sections", "entries")
+
+    def __init__(self, tables):
+        """Build the index in a single pass over every table row."""
+        self.tables = tables or []
+        self.sections = []
+        self.entries = {}
+
+        for container in self.tables:
+            if not isinstance(container, dict):
+                continue
+            data = container.get('data') if 'data' in container else container
+            if not isinstance(data, dict):
+                continue
+
+            league_id = data.get('leagueId')
+            if data.get('composite'):
+                for sub_table in data.get('tables', []):
+                    self._add_section(
+                        TableSection(league_id, sub_table.get('leagueName'), sub_table.get('table', {}), container)
+                    )
+            else:
+                self._add_section(
+                    TableSection(league_id, data.get('leagueName'), data.get('table', {}), container)
+                )
+
+    def _add_section(self, section):
+        """Register a section and index its rows by team id."""
+        self.sections.append(section)
+        for row in section.rows:
+            t_id = str(row.get('id'))
+            if t_id in self.entries:
+                continue
+            raw_form = section.team_form.get(t_id) or row.get('form', [])
+            self.entries[t_id] = TableEntry(row, section, raw_form)
+
+    def lookup(self, team_id):
+        """Return the TableEntry for a team, or None."""
+        return self.entries.get(str(team_id))
+
+    def section_for(self, team_id):
+        """Return the section holding the team, else the first section."""
+        entry = self.entries.get(str(team_id))
+        if entry:
+            return entry.section
+        return self.sections[0] if self.sections else None
+
+
+class FixtureView:
+    """A fixture seen from the tracked team, with its opponent precomputed."""
+
+    __slots__ = (
+        "fixture", "kickoff", "is_home", "opponent", "opponent_id", "opponent_entry",
+        "opponent_rank", "opponent_form", "difficulty",
+    )
+
+    def __init__(self, fixture, team_id, index):
+        """Initialize the view, looking the opponent up in the table index."""
+        self.fixture = fixture
+        self.kickoff = parse_utc(fixture.get('status', {}).get('utcTime'))
+        home = fixture.get('home', {})
+        away = fixture.get('away', {})
+        self.is_home = str(home.get('id')) == team_id
+        opponent = away if self.is_home else home
+        self.opponent = opponent.get('name')
+        self.opponent_id = opponent.get('id')
+        self.opponent_entry = index.lookup(self.opponent_id)
+        if self.opponent_entry:
+            self.opponent_rank = self.opponent_entry.row.get('idx')
+            self.opponent_form = self.opponent_entry.form
+        else:
+            self.opponent_rank = "N/A"
+            self.opponent_form = []
+        self.difficulty = difficulty(self.opponent_rank)
+
+    @property
+    def status(self):
+        """Return the FotMob status block of the fixture."""
+        return self.fixture.get('status', {})
+
+    @property
+    def result(self):
+        """Return W, D or L for the tracked team, or None before full time."""
+        if not self.status.get('finished'):
+            return None
+        home = self.fixture.get('home', {}).get('score')
+        away = self.fixture.get('away', {}).get('score')
+        if not isinstance(home, int) or not isinstance(away, int):
+            return None
+        own, other = (home, away) if self.is_home else (away, home)
+        return "W" if own > other else "D" if own == other else "L"
+
+
+def _kickoff_key(view):
+    """Sort key placing fixtures without a kickoff time last."""
+    return (view.kickoff is None, view.kickoff.timestamp() if view.kickoff else 0)
+
+
+class FixtureTimeline:
+    """The fixtures of a team split in past, live and upcoming lists.
+
+    Each list is sorted by kickoff; upcoming fixtures can be looked up by
+    time with a bisect over their kickoff timestamps.
+    """
+
+    __slots__ = ("past", "live", "upcoming", "_upcoming_times")
+
+    def __init__(self, fixtures, team_id, index):
+        """Classify every fixture in a single pass."""
+        self.past = []
+        self.live = []
+        self.upcoming = []
+        for fix in fixtures:
+            status = fix.get('status', {})
+            view = FixtureView(fix, team_id, index)
+            if status.get('finished'):
+                self.past.append(view)
+            elif status.get('started'):
+                self.live.append(view)
+            else:
+                self.upcoming.append(view)
+        for views in (self.past, self.live, self.upcoming):
+            views.sort(key=_kickoff_key)
+        self._upcoming_times = [
+            view.kickoff.timestamp() for view in self.upcoming if view.kickoff is not None
+        ]
+
+    @property
+    def season_start(self):
+        """Return the earliest kickoff of the fixture list, or None."""
+        kickoffs = [views[0].kickoff for views in (self.past, self.live, self.upcoming) if views and views[0].kickoff]
+        return min(kickoffs, default=None)
+
+    def next_fixtures(self, count, after=None):
+        """Return up to count upcoming fixtures, optionally kicking off after a time."""
+        start = bisect_left(self._upcoming_times, after.timestamp()) if after is not None else 0
+        return self.upcoming[start:start + count]
+
+    def last_results(self, count):
+        """Return up to count finished fixtures, most recent first."""
+        return self.past[::-1][:count]
+
+    @property
+    def current(self):
+        """Return the live fixture, else the next scheduled one."""
+        if self.live:
+            return self.live[0]
+        return self.upcoming[0] if self.upcoming else None
+
+
+class TeamSnapshot:
+    """Precomputed lookups for one coordinator payload.
+
+    ``overview_index`` covers the tables embedded in the team overview;
+    ``table_index`` falls back to the full league payload when the
+    overview carries no tables. ``timeline`` classifies the fixtures,
+    with opponents resolved against the overview tables.
+    """
+
+    __slots__ = ("team_id", "data", "overview_index", "table_index", "timeline")
+
+    def __init__(self, team_id, data):
+        """Build the snapshot."""
+        self.team_id = str(team_id)
+        self.data = data
+
+        overview_tables = data.get('table', [])
+        self.overview_index = TableIndex(overview_tables)
+        if overview_tables:
+            self.table_index = self.overview_index
+        else:
+            self.table_index = TableIndex(data.get('league_table', {}).get('table', []))
+
+        fixtures = data.get('fixtures', {}).get('allFixtures', {}).get('fixtures', [])
+        self.timeline = FixtureTimeline(fixtures, self.team_id, self.overview_index)
+
+    @property
+    def season(self):
+        """Return FotMob's name of the season of the overview tables, or None."""
+        for section in self.overview_index.sections:
+            data = section.container.get('data', section.container)
+            if season := data.get('selectedSeason'):
+                return str(season)
+        return None
+
+    @property
+    def active_fixture(self):
+        """Return the live fixture, or None."""
+        return self.timeline.live[0].fixture if self.timeline.live else None
+
+    @property
+    def next_fixture(self):
+        """Return the next scheduled fixture, or None."""
+        return self.timeline.upcoming[0].fixture if self.timeline.upcoming else None
+
+    @property
+    def current_fixture(self):
+        """Return the live fixture, else the next scheduled one."""
+        return self.active_fixture or self.next_fixture
+
+    @property
+    def team_entry(self):
+        """Return the tracked team's row in the overview tables."""
+        return self.overview_index.lookup(self.team_id)
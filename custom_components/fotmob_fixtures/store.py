@@ -0,0 +1,71 @@
+"""Persistent cache of the last good payload of each team."""
+import logging
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Shorter than the fastest polling interval, so frequent refreshes do not
+# keep pushing the write back
+SAVE_DELAY = 30
+
+# Top-level payload keys read by the sensors; everything else (stats tabs,
+# season lists, ...) is left out of the stored copy.
+STORED_KEYS = (
+    "details",
+    "fixtures",
+    "table",
+    "topPlayers",
+    "overview",
+    "coach",
+    "squad",
+    "transfers",
+    "history",
+    "league_table",
+)
+
+
+class FotMobPayloadStore:
+    """Load and save a team's merged payload with HA's Store helper."""
+
+    def __init__(self, hass, storage_id):
+        """Initialize the store; storage_id is the entry id (plus team for groups)."""
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{storage_id}")
+
+    async def async_load(self):
+        """Return (payload, fetched_at, tier fetch times) or None."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Ignoring unreadable FotMob cache: %s", err)
+            return None
+        if not stored or not stored.get("data"):
+            return None
+        fetched_at = dt_util.parse_datetime(stored.get("fetched_at") or "")
+        if fetched_at is None:
+            return None
+        tiers = {}
+        for name, value in stored.get("tiers", {}).items():
+            if (parsed := dt_util.parse_datetime(value or "")) is not None:
+                tiers[name] = parsed
+        return stored["data"], fetched_at, tiers
+
+    def async_schedule_save(self, data, fetched_at, tiers):
+        """Save a compact copy of the payload after a short delay."""
+
+        def _data_to_save():
+            return {
+                "fetched_at": fetched_at.isoformat(),
+                "tiers": {name: value.isoformat() for name, value in tiers.items()},
+                "data": {key: data[key] for key in STORED_KEYS if key in data},
+            }
+
+        self._store.async_delay_save(_data_to_save, SAVE_DELAY)
+
+    async def async_remove(self):
+        """Delete the stored payload."""
+        await self._store.async_remove()
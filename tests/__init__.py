@@ -0,0 +1 @@
+"""Tests for the FotMob Fixtures integration."""
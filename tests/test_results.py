@@ -0,0 +1,57 @@
+"""Season figures of the results store as the overview window slides."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.fotmob_fixtures.results import FotMobResultsStore
+from custom_components.fotmob_fixtures.snapshot import TeamSnapshot
+
+TEAM_ID = "1"
+FIRST_KICKOFF = datetime(2025, 8, 1, tzinfo=timezone.utc)
+
+
+def _fixture(number, finished=True):
+    """Return a weekly fixture of the team, won 2-0 when finished."""
+    kickoff = FIRST_KICKOFF + timedelta(weeks=number)
+    return {
+        "id": number,
+        "home": {"id": int(TEAM_ID), "name": "Home FC", "score": 2 if finished else None},
+        "away": {"id": 100 + number, "name": f"Away {number}", "score": 0 if finished else None},
+        "status": {"utcTime": kickoff.strftime("%Y-%m-%dT%H:%M:%SZ"), "finished": finished},
+    }
+
+
+def _append(store, finished, upcoming):
+    """Append the results of an overview listing these fixtures."""
+    fixtures = [_fixture(number) for number in finished] + [_fixture(number, False) for number in upcoming]
+    snapshot = TeamSnapshot(TEAM_ID, {"fixtures": {"allFixtures": {"fixtures": fixtures}}})
+    store.append(snapshot.timeline.past, snapshot.timeline.season_start, snapshot.season)
+
+
+# The delayed Store save is still scheduled at teardown
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_record_kept_when_overview_window_slides(hass):
+    """Fixtures dropping out of the overview keep counting for the season."""
+    store = FotMobResultsStore(hass, "test")
+    _append(store, range(10), [10, 11])
+    assert store.stats.total.record == "10-0-0"
+    season_start = store.stats.season_start
+
+    # Three old fixtures drop out of the overview and one result is added
+    _append(store, range(3, 11), [11, 12])
+
+    assert len(store.results) == 11
+    assert store.stats.total.record == "11-0-0"
+    assert store.stats.season_start == season_start
+
+
+# The delayed Store save is still scheduled at teardown
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_new_season_resets_record(hass):
+    """A fixture list starting after every stored result is a new season."""
+    store = FotMobResultsStore(hass, "test")
+    _append(store, range(10), [10])
+    _append(store, [], [40, 41])
+
+    assert len(store.results) == 10
+    assert store.stats.total.record == "0-0-0"
@@ -0,0 +1,52 @@
+"""Max staleness during an outage outlasting it."""
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.fotmob_fixtures.const import CONF_MAX_STALENESS
+from custom_components.fotmob_fixtures.coordinator import FotMobDataUpdateCoordinator
+from custom_components.fotmob_fixtures.sensor import FotMobTeamFormSensor
+
+TEAM_ID = "8633"
+PAYLOAD = {"details": {"name": "Test FC"}, "fixtures": {"allFixtures": {"fixtures": []}}}
+
+
+# The retry after the failed refreshes is still scheduled at teardown
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_sensor_unavailable_after_max_staleness(hass, freezer):
+    """Sensors turn unavailable once the cached data outlives max staleness."""
+    coordinator = FotMobDataUpdateCoordinator(hass, TEAM_ID, {CONF_MAX_STALENESS: 1})
+    coordinator._team.restore(PAYLOAD, dt_util.utcnow(), {}, coordinator.options)
+    coordinator._schedule_stale_check()
+    coordinator.async_set_updated_data(PAYLOAD)
+
+    entity = FotMobTeamFormSensor(coordinator, TEAM_ID)
+    entity.hass = hass
+    entity.async_write_ha_state = Mock()
+    coordinator.async_add_listener(entity._handle_coordinator_update)
+    entity._handle_coordinator_update()
+    assert entity.available
+    assert entity.async_write_ha_state.call_count == 1
+
+    # The outage: every refresh fails, and only the first one notifies
+    coordinator._team.async_fetch = AsyncMock(side_effect=UpdateFailed("offline"))
+    for _ in range(3):
+        freezer.tick(timedelta(minutes=20))
+        await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert entity.available
+    assert entity.async_write_ha_state.call_count == 1
+
+    freezer.tick(timedelta(minutes=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert coordinator.team_is_stale(TEAM_ID)
+    assert not entity.available
+    assert entity.async_write_ha_state.call_count == 2
+    coordinator.async_release()